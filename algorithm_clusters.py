@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate algorithm detection for the Algoritmeregister.
+MinHash signatures over character shingles, banded locality-sensitive hashing to find
+candidate pairs (no all-pairs comparison) and union-find to turn verified pairs into clusters.
+
+    python algorithm_clusters.py --benchmark 100000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+from collections import Counter
+
+import numpy as np
+
+NUM_PERM = 64
+BANDS = 8
+SHINGLE_SIZE = 5
+THRESHOLD = 0.7
+SEED = 42
+NORMALIZE_RE = re.compile(r'[^0-9a-zà-ÿ]+')
+
+
+def normalize(text: str) -> str:
+    return NORMALIZE_RE.sub(' ', text.lower()).strip()
+
+
+def shingle_keys(texts: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """Byte shingles of every normalized text as 64-bit keys, concatenated, plus shingles per text.
+
+    Windows are taken over one buffer of all texts at once; windows that cross a text boundary
+    are dropped. Texts shorter than a shingle become a single key.
+    """
+    encoded = [normalize(t).encode('utf-8') for t in texts]
+    lengths = np.fromiter((len(e) for e in encoded), dtype=np.int64, count=len(encoded))
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    counts = np.where(lengths >= SHINGLE_SIZE, lengths - SHINGLE_SIZE + 1, (lengths > 0).astype(np.int64))
+    buffer = np.frombuffer(b''.join(encoded) + b'\0' * SHINGLE_SIZE, dtype=np.uint8)
+
+    windows = np.lib.stride_tricks.sliding_window_view(buffer, SHINGLE_SIZE)
+    positions = np.repeat(starts, counts) + (np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts))
+    keys = np.zeros(len(positions), dtype=np.uint64)
+    for i in range(SHINGLE_SIZE):
+        keys |= windows[positions, i].astype(np.uint64) << np.uint64(8 * i)
+    # Short texts: their window ran into the next text, so key them on their own bytes
+    first_key = np.cumsum(counts) - counts
+    for doc in np.flatnonzero((lengths > 0) & (lengths < SHINGLE_SIZE)):
+        keys[first_key[doc]] = int.from_bytes(encoded[doc], 'little')
+    return keys, counts
+
+
+def minhash_signatures(texts: list[str], num_perm: int = NUM_PERM, seed: int = SEED) -> tuple[np.ndarray, np.ndarray]:
+    """MinHash signature matrix (docs x num_perm) and a mask of docs that had any text."""
+    values, counts = shingle_keys(texts)
+    has_text = counts > 0
+    signatures = np.full((len(texts), num_perm), np.iinfo(np.uint32).max, dtype=np.uint32)
+    if not has_text.any():
+        return signatures, has_text
+    offsets = np.concatenate(([0], np.cumsum(counts[has_text])[:-1]))
+
+    # Multiply-shift hashing: h(x) = (a*x + b) >> 32 with odd 64-bit a, wrapping mod 2**64
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 2**63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 2**63, size=num_perm, dtype=np.uint64)
+    rows = np.flatnonzero(has_text)
+    hashed = np.empty(len(values), dtype=np.uint64)
+    for p in range(num_perm):
+        np.multiply(values, a[p], out=hashed)
+        hashed += b[p]
+        hashed >>= np.uint64(32)
+        signatures[rows, p] = np.minimum.reduceat(hashed, offsets)
+    return signatures, has_text
+
+
+def candidate_pairs(signatures: np.ndarray, has_text: np.ndarray, bands: int = BANDS) -> np.ndarray:
+    """Pairs of docs sharing at least one LSH band; each bucket links its members to its first doc."""
+    rows = signatures.shape[1] // bands
+    docs = np.flatnonzero(has_text)
+    pairs = []
+    for band in range(bands):
+        block = np.ascontiguousarray(signatures[docs, band * rows:(band + 1) * rows])
+        keys = block.view(np.dtype((np.void, block.dtype.itemsize * rows))).ravel()
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        starts = np.flatnonzero(np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1])))
+        sizes = np.diff(np.concatenate((starts, [len(order)])))
+        multi = sizes > 1
+        if not multi.any():
+            continue
+        leaders = np.repeat(order[starts[multi]], sizes[multi] - 1)
+        member_mask = np.ones(len(order), dtype=bool)
+        member_mask[starts] = False
+        in_multi = np.repeat(multi, sizes)
+        members = order[member_mask & in_multi]
+        pairs.append(np.stack((docs[leaders], docs[members]), axis=1))
+    if not pairs:
+        return np.zeros((0, 2), dtype=np.int64)
+    return np.unique(np.concatenate(pairs), axis=0)
+
+
+def find(parent: np.ndarray, i: int) -> int:
+    root = i
+    while parent[root] != root:
+        root = parent[root]
+    while parent[i] != root:
+        parent[i], i = root, parent[i]
+    return root
+
+
+def cluster_texts(texts: list[str], threshold: float = THRESHOLD) -> tuple[np.ndarray, dict]:
+    """Cluster id per text (the index of the cluster's first member) plus run stats."""
+    started = time.perf_counter()
+    if not texts:
+        return np.zeros(0, dtype=np.int64), {'documents': 0, 'candidate_pairs': 0, 'verified_pairs': 0,
+                                             'clusters': 0, 'seconds': 0.0}
+    signatures, has_text = minhash_signatures(texts)
+    pairs = candidate_pairs(signatures, has_text)
+    # Verify candidates with the MinHash estimate of their Jaccard similarity
+    similarity = (signatures[pairs[:, 0]] == signatures[pairs[:, 1]]).mean(axis=1) if len(pairs) else np.zeros(0)
+    verified = pairs[similarity >= threshold]
+
+    parent = np.arange(len(texts))
+    for i, j in verified:
+        root_i, root_j = find(parent, int(i)), find(parent, int(j))
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+    clusters = np.fromiter((find(parent, i) for i in range(len(texts))), dtype=np.int64, count=len(texts))
+    stats = {
+        'documents': len(texts),
+        'candidate_pairs': int(len(pairs)),
+        'verified_pairs': int(len(verified)),
+        'clusters': int(len(np.unique(clusters))),
+        'seconds': round(time.perf_counter() - started, 2),
+    }
+    return clusters, stats
+
+
+def synthetic_register(size: int, templates: int, seed: int = SEED) -> tuple[list[str], list[int]]:
+    """Vendor templates published by many organizations with small textual edits."""
+    rng = random.Random(seed)
+    words = ['burgers', 'aanvragen', 'signalen', 'risico', 'uitkering', 'parkeren', 'vergunning', 'toeslag',
+             'fraude', 'afval', 'belasting', 'subsidie', 'zorg', 'jeugd', 'schuld', 'woning', 'melding',
+             'controle', 'selectie', 'planning', 'route', 'voorspelling', 'classificatie', 'beoordeling']
+    bases = [' '.join(rng.choice(words) for _ in range(rng.randint(18, 30))) for _ in range(templates)]
+    texts, truth = [], []
+    for _ in range(size):
+        template = rng.randrange(templates)
+        tokens = bases[template].split()
+        tokens.insert(rng.randrange(len(tokens)), f'gemeente{rng.randrange(400)}')
+        if rng.random() < 0.3:
+            tokens[rng.randrange(len(tokens))] = rng.choice(words)
+        texts.append(' '.join(tokens))
+        truth.append(template)
+    return texts, truth
+
+
+def benchmark(size: int) -> None:
+    templates = max(1, size // 20)
+    texts, truth = synthetic_register(size, templates)
+    clusters, stats = cluster_texts(texts)
+    # Purity: share of docs whose cluster is dominated by their own template
+    dominant: dict[int, int] = {}
+    for (cluster, _), count in Counter(zip(clusters.tolist(), truth)).items():
+        dominant[cluster] = max(dominant.get(cluster, 0), count)
+    pure = sum(dominant.values())
+    all_pairs = size * (size - 1) // 2
+    print(f"📊 {size} algorithms from {templates} templates")
+    print(f"   • {stats['candidate_pairs']} candidate pairs instead of {all_pairs} all-pairs comparisons")
+    print(f"   • {stats['verified_pairs']} verified pairs → {stats['clusters']} clusters")
+    print(f"   • purity {pure / size:.3f}, {stats['seconds']}s ({size / max(stats['seconds'], 1e-9):,.0f} algorithms/s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='MinHash LSH near-duplicate detection for algorithms.')
+    parser.add_argument('--benchmark', type=int, metavar='N', help='Cluster a synthetic register of N algorithms')
+    args = parser.parse_args()
+    benchmark(args.benchmark or 100_000)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+BM25 full-text search over Algoritmeregister algorithms (name, description, goal).
+Dutch-aware tokenization (accent folding, stopwords, Snowball-style stemming); the index is
+persisted as per-algorithm term counts so ingest only re-tokenizes algorithms whose text
+changed, and queries score postings with numpy instead of scanning organizations.json.
+
+    python algorithm_search.py "fraudedetectie risicoprofilering"
+    python algorithm_search.py "fraude" --organizations
+    python algorithm_search.py --benchmark 100000
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import tempfile
+import time
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+from scipy import sparse
+
+ROOT = Path(__file__).resolve().parent
+ORGS_PATH = ROOT / 'src' / 'organizations.json'
+INDEX_PATH = ROOT / 'exports' / 'search-index.npz'
+
+K1 = 1.2
+B = 0.75
+TOP = 20
+FIELDS = ('name', 'description', 'goal')
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+VOWELS = frozenset('aeiouy')
+STOPWORDS = frozenset({
+    'aan', 'al', 'als', 'bij', 'dan', 'dat', 'de', 'deze', 'die', 'dit', 'door', 'een', 'en', 'er',
+    'het', 'hij', 'hoe', 'in', 'is', 'je', 'kan', 'kunnen', 'met', 'na', 'naar', 'niet', 'nog', 'of',
+    'om', 'ons', 'ook', 'op', 'over', 'te', 'ten', 'ter', 'tot', 'uit', 'van', 'voor', 'wat', 'we',
+    'welke', 'wij', 'wordt', 'worden', 'zal', 'ze', 'zijn', 'zich', 'zo', 'zodat', 'and', 'the',
+    'for', 'of', 'to',
+})
+
+
+def _region(word: str, start: int = 0) -> int:
+    """Snowball region: position after the first non-vowel following a vowel, from `start`."""
+    for i in range(start + 1, len(word)):
+        if word[i] not in VOWELS and word[i - 1] in VOWELS:
+            return i + 1
+    return len(word)
+
+
+def _undouble(word: str) -> str:
+    return word[:-1] if word.endswith(('kk', 'dd', 'tt')) else word
+
+
+def _strip_en(word: str, r1: int) -> str | None:
+    """Remove -en/-ene after a consonant (not 'gem'), or None if it does not apply."""
+    for suffix in ('ene', 'en'):
+        if word.endswith(suffix):
+            base = word[:-len(suffix)]
+            if len(base) >= r1 and base and base[-1] not in VOWELS and not base.endswith('gem'):
+                return _undouble(base)
+            return None
+    return None
+
+
+@lru_cache(maxsize=200_000)
+def stem(word: str) -> str:
+    """Dutch stem following the Snowball algorithm's steps (simplified vowel handling)."""
+    if len(word) <= 3 or not word.isalpha():
+        return word
+    r1 = max(3, _region(word))
+    r2 = _region(word, _region(word))
+
+    # Step 1: -heden, -en/-ene, -s/-se
+    if word.endswith('heden'):
+        if len(word) - 5 >= r1:
+            word = word[:-5] + 'heid'
+    elif word.endswith(('ene', 'en')):
+        word = _strip_en(word, r1) or word
+    elif word.endswith(('se', 's')):
+        base = word[:-2] if word.endswith('se') else word[:-1]
+        if len(base) >= r1 and base and base[-1] not in VOWELS and base[-1] != 'j':
+            word = base
+
+    # Step 2: -e after a consonant
+    e_removed = False
+    if word.endswith('e') and len(word) - 1 >= r1 and len(word) > 1 and word[-2] not in VOWELS:
+        word = _undouble(word[:-1])
+        e_removed = True
+
+    # Step 3a: -heid, then -en again
+    if word.endswith('heid') and len(word) - 4 >= r2 and not word.endswith('cheid'):
+        word = word[:-4]
+        word = _strip_en(word, r1) or word
+
+    # Step 3b: derivational suffixes
+    if word.endswith(('end', 'ing')) and len(word) - 3 >= r2:
+        word = word[:-3]
+        if word.endswith('ig') and len(word) - 2 >= r2 and not word.endswith('eig'):
+            word = word[:-2]
+        else:
+            word = _undouble(word)
+    elif word.endswith('ig') and len(word) - 2 >= r2 and not word.endswith('eig'):
+        word = word[:-2]
+    elif word.endswith('lijk') and len(word) - 4 >= r2:
+        word = word[:-4]
+        if word.endswith('e') and len(word) - 1 >= r1 and len(word) > 1 and word[-2] not in VOWELS:
+            word = _undouble(word[:-1])
+    elif word.endswith('baar') and len(word) - 4 >= r2:
+        word = word[:-4]
+    elif word.endswith('bar') and len(word) - 3 >= r2 and e_removed:
+        word = word[:-3]
+
+    # Step 4: undouble a vowel in a final consonant-vowel-vowel-consonant ("maan" -> "man")
+    if (len(word) >= 4 and word[-1] not in VOWELS and word[-1] != 'i' and word[-4] not in VOWELS
+            and word[-3] == word[-2] and word[-2] in 'aeou'):
+        word = word[:-2] + word[-1]
+    return word
+
+
+def fold(text: str) -> str:
+    """Lowercase and strip accents ("geëvalueerd" -> "geevalueerd")."""
+    decomposed = unicodedata.normalize('NFKD', text.lower())
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text: str) -> list[str]:
+    return [stem(token) for token in TOKEN_RE.findall(fold(text)) if token not in STOPWORDS]
+
+
+def document_key(algo: dict, organization: str) -> str:
+    if algo.get('algorithm_id') is not None:
+        return str(algo['algorithm_id'])
+    return f"{organization}/{algo.get('name') or ''}"
+
+
+def documents_from_organizations(organizations: dict) -> list[dict]:
+    """One search document per algorithm in the organizations.json structure.
+
+    Ingest and --rebuild both index this structure, so the (truncated) description and goal
+    text and the fingerprints agree whichever of them last wrote the index.
+    """
+    return [
+        {'key': document_key(algo, org_name), 'organization': org_name,
+         **{field: algo.get(field) or '' for field in FIELDS}}
+        for org_name, org in organizations.items()
+        for algo in org.get('algorithms', [])
+    ]
+
+
+def fingerprint(doc: dict) -> str:
+    text = '\x1f'.join([doc['organization'], *(str(doc.get(field) or '') for field in FIELDS)])
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def load_stored(path: Path = INDEX_PATH) -> tuple[list[str], dict[str, tuple[str, np.ndarray, np.ndarray]]]:
+    """Vocabulary plus cached (fingerprint, term ids, counts) per document key."""
+    if not path.exists():
+        return [], {}
+    stored = np.load(path, allow_pickle=False)
+    indptr, indices, data = stored['indptr'], stored['indices'], stored['data']
+    rows = {}
+    for i, (key, fp) in enumerate(zip(stored['keys'], stored['fingerprints'])):
+        rows[str(key)] = (str(fp), indices[indptr[i]:indptr[i + 1]], data[indptr[i]:indptr[i + 1]])
+    return [str(term) for term in stored['vocab']], rows
+
+
+def build_search_index(documents: list[dict], path: Path = INDEX_PATH) -> dict:
+    """Persist term counts per document, re-tokenizing only documents whose text changed."""
+    vocab, cached = load_stored(path)
+    term_ids = {term: i for i, term in enumerate(vocab)}
+    fingerprints, indptr, indices, data = [], [0], [], []
+    rebuilt = 0
+    for doc in documents:
+        fp = fingerprint(doc)
+        hit = cached.get(doc['key'])
+        if hit and hit[0] == fp:
+            cols, counts = hit[1], hit[2]
+        else:
+            tokens = [t for field in FIELDS for t in tokenize(str(doc.get(field) or ''))]
+            ids = np.fromiter((term_ids.setdefault(t, len(term_ids)) for t in tokens), dtype=np.int32, count=len(tokens))
+            cols, counts = np.unique(ids, return_counts=True)
+            cols, counts = cols.astype(np.int32), counts.astype(np.int32)
+            rebuilt += 1
+        fingerprints.append(fp)
+        indices.append(cols)
+        data.append(counts)
+        indptr.append(indptr[-1] + len(cols))
+
+    vocab = sorted(term_ids, key=term_ids.get)
+    path.parent.mkdir(exist_ok=True)
+    np.savez_compressed(
+        path,
+        keys=np.asarray([doc['key'] for doc in documents]),
+        organizations=np.asarray([doc['organization'] for doc in documents]),
+        names=np.asarray([str(doc.get('name') or '') for doc in documents]),
+        fingerprints=np.asarray(fingerprints),
+        vocab=np.asarray(vocab),
+        indptr=np.asarray(indptr, dtype=np.int64),
+        indices=np.concatenate(indices) if indices else np.zeros(0, dtype=np.int32),
+        data=np.concatenate(data) if data else np.zeros(0, dtype=np.int32),
+    )
+    stats = {'documents': len(documents), 'rebuilt': rebuilt, 'terms': len(vocab)}
+    print(f"🔎 Search index: {len(documents)} algorithms ({rebuilt} re-tokenized, "
+          f"{len(documents) - rebuilt} cached), {len(vocab)} terms")
+    return stats
+
+
+class SearchIndex:
+    """BM25 queries over a persisted index; postings hold precomputed per-document weights."""
+
+    def __init__(self, path: Path = INDEX_PATH) -> None:
+        stored = np.load(path, allow_pickle=False)
+        self.keys = stored['keys']
+        self.names = stored['names']
+        self.org_names, self.org_ids = np.unique(stored['organizations'], return_inverse=True)
+        self.term_ids = {str(term): i for i, term in enumerate(stored['vocab'])}
+        counts = sparse.csr_matrix(
+            (stored['data'].astype(np.float32), stored['indices'], stored['indptr']),
+            shape=(len(self.keys), len(self.term_ids)),
+        )
+        n_docs = max(counts.shape[0], 1)
+        lengths = np.asarray(counts.sum(axis=1)).ravel()
+        norm = K1 * (1 - B + B * lengths / max(lengths.mean(), 1e-9))
+        df = np.diff(counts.tocsc().indptr)
+        idf = np.log(1 + (n_docs - df + 0.5) / (df + 0.5)).astype(np.float32)
+        # Term-major postings with BM25 weights: idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * len / avg))
+        weights = counts.copy()
+        row_norm = np.repeat(norm, np.diff(counts.indptr)).astype(np.float32)
+        weights.data = idf[weights.indices] * weights.data * (K1 + 1) / (weights.data + row_norm)
+        self.postings = weights.tocsc()
+
+    def scores(self, query: str) -> np.ndarray:
+        scores = np.zeros(len(self.keys), dtype=np.float32)
+        for term in set(tokenize(query)):
+            term_id = self.term_ids.get(term)
+            if term_id is None:
+                continue
+            start, stop = self.postings.indptr[term_id], self.postings.indptr[term_id + 1]
+            # Doc ids are unique within one posting list, so fancy-index += is safe
+            scores[self.postings.indices[start:stop]] += self.postings.data[start:stop]
+        return scores
+
+    def search(self, query: str, top: int = TOP) -> list[dict]:
+        """Ranked algorithms for a free-text query."""
+        scores = self.scores(query)
+        hits = np.flatnonzero(scores)
+        if len(hits) > top:
+            hits = hits[np.argpartition(-scores[hits], top - 1)[:top]]
+        hits = hits[np.argsort(-scores[hits], kind='stable')]
+        return [
+            {'key': str(self.keys[i]), 'name': str(self.names[i]),
+             'organization': str(self.org_names[self.org_ids[i]]), 'score': round(float(scores[i]), 3)}
+            for i in hits
+        ]
+
+    def organizations(self, query: str, top: int = TOP) -> list[dict]:
+        """Organizations ranked by the summed score of their matching algorithms."""
+        scores = self.scores(query)
+        matched = scores > 0
+        totals = np.bincount(self.org_ids[matched], weights=scores[matched], minlength=len(self.org_names))
+        matches = np.bincount(self.org_ids[matched], minlength=len(self.org_names))
+        best = np.flatnonzero(totals)
+        best = best[np.argsort(-totals[best], kind='stable')][:top]
+        return [
+            {'organization': str(self.org_names[org]), 'score': round(float(totals[org]), 3),
+             'matches': int(matches[org])}
+            for org in best
+        ]
+
+
+def synthetic_documents(size: int, seed: int = 42) -> list[dict]:
+    """Zipf-distributed pseudo-Dutch vocabulary so postings resemble real register text."""
+    rng = random.Random(seed)
+    syllables = ['ver', 'be', 'ge', 'aan', 'vraag', 'risi', 'co', 'frau', 'de', 'toe', 'slag', 'uit',
+                 'ke', 'ring', 'meld', 'ing', 'park', 'eer', 'zorg', 'jeugd', 'schuld', 'wo', 'ning']
+    words = list({''.join(rng.choice(syllables) for _ in range(rng.randint(2, 4))) for _ in range(20_000)})
+    cum_weights = list(np.cumsum([1 / (rank + 1) for rank in range(len(words))]))
+    return [
+        {'key': str(i), 'organization': f'Gemeente {rng.randrange(400)}',
+         'name': ' '.join(rng.choices(words, cum_weights=cum_weights, k=5)),
+         'description': ' '.join(rng.choices(words, cum_weights=cum_weights, k=30)),
+         'goal': ' '.join(rng.choices(words, cum_weights=cum_weights, k=40))}
+        for i in range(size)
+    ]
+
+
+def benchmark(size: int) -> None:
+    documents = synthetic_documents(size)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'search-index.npz'
+        started = time.perf_counter()
+        build_search_index(documents, path)
+        built = time.perf_counter()
+        documents[0]['goal'] += ' gewijzigd'
+        build_search_index(documents, path)
+        updated = time.perf_counter()
+        index = SearchIndex(path)
+        loaded = time.perf_counter()
+    queries = [' '.join(random.Random(i).sample(documents[i]['description'].split(), 3)) for i in range(200)]
+    timings = []
+    for query in queries:
+        started_query = time.perf_counter()
+        index.search(query)
+        index.organizations(query)
+        timings.append(time.perf_counter() - started_query)
+    timings.sort()
+    print(f"📊 {size} algorithms: build {built - started:.1f}s, incremental update {updated - built:.1f}s, "
+          f"load {loaded - updated:.2f}s")
+    print(f"   • query + organization rollup: median {timings[len(timings) // 2] * 1000:.2f} ms, "
+          f"p95 {timings[int(len(timings) * 0.95)] * 1000:.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='BM25 search over Algoritmeregister algorithms.')
+    parser.add_argument('query', nargs='?', help='Free-text query, e.g. "fraude risicoprofilering"')
+    parser.add_argument('--top', type=int, default=TOP, help='Number of results')
+    parser.add_argument('--organizations', action='store_true', help='Roll results up per organization')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    parser.add_argument('--rebuild', action='store_true', help='Rebuild the index from src/organizations.json')
+    parser.add_argument('--benchmark', type=int, metavar='N', help='Time build and queries on N synthetic algorithms')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return
+    if args.rebuild or not INDEX_PATH.exists():
+        with open(ORGS_PATH, 'r') as f:
+            build_search_index(documents_from_organizations(json.load(f)['organizations']))
+    if not args.query:
+        return
+    index = SearchIndex()
+    results = index.organizations(args.query, args.top) if args.organizations else index.search(args.query, args.top)
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+    for row in results:
+        if args.organizations:
+            print(f"   {row['score']:7.2f}  {row['organization']} ({row['matches']} algorithms)")
+        else:
+            print(f"   {row['score']:7.2f}  {row['name']} - {row['organization']}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Single entry point for the lead pipeline. Subcommands are imported only when they run, so
+JSON-only commands never load pandas/numpy and start within 100 ms; the heavy ones pay for their
+own imports.
+
+    python algoritmehub.py ingest-register --csv "Gepubliceerde algoritmes 2026-1-2.csv"
+    python algoritmehub.py extract-tenders
+    python algoritmehub.py enrich
+    python algoritmehub.py contacts
+    python algoritmehub.py crawl --limit 20
+    python algoritmehub.py top-leads
+    python algoritmehub.py --benchmark 5
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+ROOT = Path(__file__).resolve().parent
+
+# name -> (module or script, description, kind). 'json' commands only read and write JSON/CSV and must
+# start within COLD_START_BUDGET_MS; 'network' commands also load the HTTP/SMTP stack; 'pandas' ones load pandas
+COMMANDS: dict[str, tuple[str, str, str]] = {
+    'ingest-register': ('register_ingest', 'Ingest an Algoritmeregister CSV export into leads and indexes', 'pandas'),
+    'extract-tenders': ('tender_extract', 'Extract AI/governance/ICT tenders for the tender browser', 'pandas'),
+    'enrich': ('lead_enrichment', 'Enrich leads with TenderNed buying signals', 'pandas'),
+    'spend': ('tender_spend', 'Look up TenderNed procurement spend per organization, year and category', 'pandas'),
+    'db': ('analytics_db', 'Query register, tenders, matches and contacts in an embedded SQLite database', 'json'),
+    'contacts': ('scripts/expand-contact-research.py', 'Fill contact research with register-derived contacts', 'json'),
+    'contact-summary': ('contact_summary', 'Rebuild the compact contact summary used by the dashboards', 'json'),
+    'guess-contacts': ('scripts/enrich-contacts.py', 'Generate and validate standard contact addresses', 'network'),
+    'crawl': ('scripts/enrich-contacts-online.py', 'Crawl organization websites for named contacts', 'network'),
+    'top-leads': ('scripts/generate-top-leads.py', 'Generate the Top 20 outreach lead list', 'json'),
+    'export-crm': ('scripts/export-crm.py', 'Stream a joined CRM export (CSV/NDJSON/Parquet)', 'json'),
+    'outreach': ('scripts/outreach-dispatch.py', 'Dispatch outreach emails through the send queue', 'network'),
+    'query-server': ('scripts/lead-query-server.py', 'Serve lead queries over HTTP/JSON', 'network'),
+    'daemon': ('scripts/lead-daemon.py', 'Keep datasets warm and rebuild on change', 'pandas'),
+}
+HEAVY_MODULES = ('pandas', 'numpy', 'scipy', 'pyarrow')
+COLD_START_BUDGET_MS = 100
+IMPORTTIME_PATTERN = r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)'
+
+
+def load_command(name: str) -> ModuleType:
+    """Import the module behind a subcommand (scripts/*.py are loaded by path)."""
+    target = COMMANDS[name][0]
+    if not target.endswith('.py'):
+        return importlib.import_module(target)
+    module_name = 'algoritmehub_' + name.replace('-', '_')
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, ROOT / target)
+    module = importlib.util.module_from_spec(spec)
+    # Registered before executing, so dataclasses and pickling can find the module
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_command(name: str, argv: list[str]) -> None:
+    module = load_command(name)
+    sys.argv = [f'algoritmehub {name}', *argv]
+    module.main()
+
+
+def import_profile(stderr: str) -> tuple[float, list[tuple[float, str]], set[str]]:
+    """Total import time (ms), the slowest top-level imports and all module names from -X importtime."""
+    import re
+
+    pattern = re.compile(IMPORTTIME_PATTERN)
+    total, top, modules = 0.0, [], set()
+    for line in stderr.splitlines():
+        match = pattern.match(line)
+        if not match:
+            continue
+        cumulative, indent, module = int(match.group(2)) / 1000, match.group(3), match.group(4)
+        modules.add(module.split('.')[0])
+        if len(indent) == 1:
+            total += cumulative
+            top.append((cumulative, module))
+    return total, sorted(top, reverse=True)[:3], modules
+
+
+def benchmark(runs: int) -> None:
+    """Cold start of every subcommand: interpreter, imports and argument parsing (`<command> --help`)."""
+    # Only the benchmark needs these; the dispatcher itself stays minimal
+    import statistics
+    import subprocess
+    import time
+
+    def wall(arguments: list[str]) -> float:
+        times = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            subprocess.run([sys.executable, *arguments], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                           check=True, cwd=ROOT)
+            times.append((time.perf_counter() - started) * 1000)
+        return statistics.median(times)
+
+    baseline = wall(['-c', 'pass'])
+    print(f"📊 Cold start over {runs} runs (median; bare interpreter {baseline:.0f} ms)")
+    for name, (_, _, kind) in COMMANDS.items():
+        elapsed = wall([__file__, name, '--help'])
+        profile = subprocess.run([sys.executable, '-X', 'importtime', __file__, name, '--help'],
+                                 capture_output=True, text=True, check=True, cwd=ROOT)
+        imports, top, modules = import_profile(profile.stderr)
+        loaded = [module for module in HEAVY_MODULES if module in modules]
+        status = '  '
+        if kind == 'json':
+            status = '✅' if elapsed < COLD_START_BUDGET_MS and not loaded else '⚠️ '
+        slowest = ', '.join(f'{module} {ms:.0f}' for ms, module in top)
+        print(f"   {status} {name:<16} {kind:<8} {elapsed:5.0f} ms (imports {imports:4.0f} ms: {slowest})"
+              + (f" [{', '.join(loaded)}]" if loaded else ''))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog='algoritmehub',
+        description='Algoritmehub lead pipeline.',
+        epilog='commands:\n' + '\n'.join(f'  {name:<17} {help_text}' for name, (_, help_text, _) in COMMANDS.items())
+               + '\n\nRun "algoritmehub <command> --help" for the options of a command.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('command', nargs='?', choices=COMMANDS, metavar='command', help='Command to run')
+    parser.add_argument('arguments', nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    parser.add_argument('--benchmark', type=int, metavar='N', help='Measure cold start of every command over N runs')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return
+    if args.command is None:
+        parser.print_help()
+        sys.exit(2)
+    run_command(args.command, args.arguments)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,484 @@
+#!/usr/bin/env python3
+"""
+Embedded SQLite database over the register, TenderNed procurements, organization matches and
+contact research (exports/algoritmehub.sqlite). Sources are loaded once into indexed tables and
+the database is rebuilt only when a source file changed, so cross-dataset questions are a
+query instead of another script. The lead aggregates of the ingest and the buying signals of
+the enrichment are views (lead_stats, tender_signals); --check compares them with the JSON outputs.
+
+Tables: organizations, algorithms, tenders, tender_categories, matches, contact_research, contacts.
+
+    python analytics_db.py --build
+    python analytics_db.py --query ai-municipalities --param since=2024-01-01
+    python analytics_db.py --sql "SELECT type, COUNT(*) FROM organizations GROUP BY type"
+    python analytics_db.py --check
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sqlite3
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+from entity_resolution import ENTITIES_PATH, OVERRIDES_PATH, EntityTable, normalize
+
+ROOT = Path(__file__).resolve().parent
+DB_PATH = ROOT / 'exports' / 'algoritmehub.sqlite'
+LEADS_PATH = ROOT / 'src' / 'data.json'
+ORGS_PATH = ROOT / 'src' / 'organizations.json'
+TENDERS_JSON_PATH = ROOT / 'src' / 'tenders.json'
+ENRICHED_PATH = ROOT / 'src' / 'data_enriched.json'
+CONTACTS_PATH = ROOT / 'exports' / 'contact-research.json'
+# Same file as tender_reader.TENDERS_PATH; not imported so queries never load pandas
+WORKBOOK_PATH = ROOT / 'public' / 'tenderned_data.xlsx'
+# Recent tender activity, as in lead_enrichment.tender_aggregates
+RECENT_SINCE = '2024-01-01'
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE organizations (
+    name TEXT PRIMARY KEY,
+    entity_id TEXT,
+    type TEXT,
+    lead_score INTEGER,
+    priority TEXT,
+    high_risk_count INTEGER,
+    has_iama INTEGER
+);
+CREATE TABLE algorithms (
+    algorithm_id INTEGER,
+    organization TEXT NOT NULL,
+    name TEXT,
+    category TEXT,
+    status TEXT,
+    provider TEXT,
+    publication_category TEXT,
+    publication_date TEXT,
+    begin_date TEXT,
+    is_impactful INTEGER,
+    has_lawful_basis INTEGER,
+    contact_email TEXT
+);
+CREATE TABLE tenders (
+    id INTEGER PRIMARY KEY,
+    organization TEXT,
+    entity_id TEXT,
+    title TEXT,
+    publication_date TEXT,
+    year INTEGER,
+    category TEXT,
+    value REAL,
+    url TEXT,
+    publication_count INTEGER,
+    copies INTEGER  -- source rows with this ID; tenders.json repeats some publications verbatim
+);
+CREATE TABLE tender_categories (tender_id INTEGER NOT NULL, category TEXT NOT NULL, PRIMARY KEY (category, tender_id));
+CREATE TABLE matches (tender_organization TEXT PRIMARY KEY, entity_id TEXT, method TEXT);
+CREATE TABLE contact_research (
+    organization TEXT PRIMARY KEY, entity_id TEXT, primary_email TEXT, notes TEXT, last_checked TEXT
+);
+CREATE TABLE contacts (organization TEXT NOT NULL, entity_id TEXT, role TEXT, name TEXT, email TEXT, linkedin TEXT);
+"""
+
+INDEXES = """
+CREATE INDEX organizations_entity ON organizations (entity_id);
+CREATE INDEX algorithms_org ON algorithms (organization, publication_date);
+CREATE INDEX algorithms_category ON algorithms (publication_category);
+CREATE INDEX tenders_entity ON tenders (entity_id, publication_date);
+CREATE INDEX tenders_org ON tenders (organization);
+CREATE INDEX tenders_date ON tenders (publication_date);
+CREATE INDEX tender_categories_tender ON tender_categories (tender_id);
+CREATE INDEX contact_research_entity ON contact_research (entity_id);
+CREATE INDEX contacts_entity ON contacts (entity_id);
+
+-- Register aggregates of register_ingest, per organization
+CREATE VIEW lead_stats AS
+SELECT o.name, o.entity_id, o.type, o.lead_score, o.priority, o.has_iama, o.high_risk_count,
+       COUNT(a.organization) AS algorithm_count,
+       COALESCE(SUM(a.is_impactful), 0) AS impactful_count,
+       MAX(a.publication_date) AS latest_date,
+       MIN(a.publication_date) AS first_date
+FROM organizations o LEFT JOIN algorithms a ON a.organization = o.name
+GROUP BY o.name;
+
+-- Buying signals of lead_enrichment, per canonical organization
+CREATE VIEW tender_signals AS
+SELECT t.entity_id,
+       COUNT(DISTINCT t.id) AS total,
+       COALESCE(SUM(c.category = 'AI'), 0) AS ai,
+       COALESCE(SUM(c.category = 'Governance'), 0) AS governance,
+       COALESCE(SUM(c.category = 'ICT'), 0) AS ict,
+       MAX(t.publication_date >= '{recent}') AS recent
+FROM tenders t LEFT JOIN tender_categories c ON c.tender_id = t.id
+WHERE t.entity_id IS NOT NULL
+GROUP BY t.entity_id;
+""".format(recent=RECENT_SINCE)
+
+# name -> (description, SQL with :named parameters, default parameters)
+QUERIES: dict[str, tuple[str, str, dict[str, object]]] = {
+    'leads': (
+        'Leads with register aggregates and buying signals, best first',
+        """SELECT l.name, l.type, l.lead_score, l.priority, l.algorithm_count, l.impactful_count,
+                  l.latest_date, COALESCE(s.total, 0) AS tenders, COALESCE(s.ai, 0) AS ai_tenders
+           FROM lead_stats l LEFT JOIN tender_signals s ON s.entity_id = l.entity_id
+           ORDER BY l.lead_score DESC, l.name LIMIT :limit""",
+        {'limit': 20},
+    ),
+    'ai-municipalities': (
+        'Municipalities with impactful algorithms, no IAMA and an AI tender since a date',
+        """SELECT l.name, l.impactful_count, COUNT(DISTINCT t.id) AS ai_tenders, MAX(t.publication_date) AS last_ai_tender
+           FROM lead_stats l
+           JOIN tenders t ON t.entity_id = l.entity_id AND t.publication_date >= :since
+           JOIN tender_categories c ON c.tender_id = t.id AND c.category = 'AI'
+           WHERE l.type = 'Gemeente' AND l.impactful_count >= :min_impactful AND NOT l.has_iama
+           GROUP BY l.name ORDER BY ai_tenders DESC, l.impactful_count DESC""",
+        {'since': RECENT_SINCE, 'min_impactful': 3},
+    ),
+    'uncontacted-signals': (
+        'Organizations with AI or governance tenders but no named contact',
+        """SELECT l.name, l.priority, s.ai, s.governance, r.primary_email
+           FROM lead_stats l
+           JOIN tender_signals s ON s.entity_id = l.entity_id AND s.ai + s.governance > 0
+           LEFT JOIN contact_research r ON r.entity_id = l.entity_id
+           WHERE NOT EXISTS (SELECT 1 FROM contacts c WHERE c.entity_id = l.entity_id AND c.name IS NOT NULL)
+           ORDER BY s.ai DESC, s.governance DESC, l.lead_score DESC""",
+        {},
+    ),
+    'tender-stats': (
+        'Tender browser statistics per category and year (tenders.json stats)',
+        """SELECT t.category, t.year, COUNT(*) AS tenders, COUNT(DISTINCT t.organization) AS organizations,
+                  SUM(t.value) AS estimated_value
+           FROM tenders t WHERE t.category IS NOT NULL
+           GROUP BY t.category, t.year ORDER BY t.category, t.year""",
+        {},
+    ),
+    'providers': (
+        'Most used algorithm providers, with the number of organizations using them',
+        """SELECT provider, COUNT(*) AS algorithms, COUNT(DISTINCT organization) AS organizations
+           FROM algorithms WHERE provider != '' GROUP BY provider
+           ORDER BY organizations DESC, algorithms DESC LIMIT :limit""",
+        {'limit': 20},
+    ),
+}
+
+
+def read_json(path: Path) -> dict:
+    return json.loads(path.read_text(encoding='utf-8')) if path.exists() else {}
+
+
+def source_paths(workbook: Path | None) -> list[Path]:
+    paths = [LEADS_PATH, ORGS_PATH, CONTACTS_PATH, ENTITIES_PATH, OVERRIDES_PATH]
+    return paths + [workbook if workbook and workbook.exists() else TENDERS_JSON_PATH]
+
+
+def source_stamp(workbook: Path | None) -> str:
+    """Fingerprint of the source files the database was built from."""
+    return json.dumps({str(path): path.stat().st_mtime for path in source_paths(workbook) if path.exists()},
+                      sort_keys=True)
+
+
+def load_register(conn: sqlite3.Connection, entity_table: EntityTable) -> int:
+    leads = read_json(LEADS_PATH).get('leads', [])
+    organizations = read_json(ORGS_PATH).get('organizations', {})
+    by_name = {lead['name']: lead for lead in leads if lead.get('name')}
+    names = list(dict.fromkeys([*by_name, *organizations]))
+    # The register defines the organizations; ids match the enrichment's resolve_lead_ids
+    entity_ids = entity_table.resolve(names, source='register', create=True)
+
+    conn.executemany(
+        'INSERT INTO organizations VALUES (?, ?, ?, ?, ?, ?, ?)',
+        [(name,
+          by_name.get(name, {}).get('entity_id') or entity_ids.get(name),
+          by_name.get(name, {}).get('type'),
+          by_name.get(name, {}).get('lead_score'),
+          by_name.get(name, {}).get('priority'),
+          (organizations.get(name) or by_name.get(name, {})).get('high_risk_count'),
+          bool((organizations.get(name) or by_name.get(name, {})).get('has_iama')))
+         for name in names],
+    )
+    rows = [
+        (algorithm.get('algorithm_id'), name, algorithm.get('name'), algorithm.get('category'),
+         algorithm.get('status'), algorithm.get('provider'), algorithm.get('publication_category'),
+         algorithm.get('publication_date'), algorithm.get('begin_date'), bool(algorithm.get('is_impactful')),
+         bool(algorithm.get('has_lawful_basis')), algorithm.get('contact_email'))
+        for name, org in organizations.items() for algorithm in org.get('algorithms', [])
+    ]
+    conn.executemany('INSERT INTO algorithms VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+    return len(rows)
+
+
+def workbook_tenders(workbook: Path) -> list[tuple[tuple, list[str]]]:
+    """All procurements of the TenderNed workbook with their taxonomy categories (needs pandas)."""
+    import pandas as pd
+
+    from tender_dedup import DATE_COLUMN, ID_COLUMN, TITLE_COLUMN, dedupe_tenders, org_column
+    from tender_reader import VALUE_COLUMN, read_tenders
+    from tender_taxonomy import load_matcher
+
+    matcher = load_matcher()
+    df, labels = dedupe_tenders(*read_tenders(workbook, matcher))
+    dates = pd.to_datetime(df[DATE_COLUMN], errors='coerce')
+
+    def column(name: str) -> list:
+        values = df[name].astype(object) if name in df.columns else pd.Series(None, index=df.index, dtype=object)
+        return values.where(values.notna(), None).tolist()
+
+    rows = zip(
+        df[ID_COLUMN].astype(int).tolist(),
+        column(org_column(df)),
+        column(TITLE_COLUMN),
+        dates.dt.strftime('%Y-%m-%d').astype(object).where(dates.notna(), None).tolist(),
+        dates.dt.year.astype('Int64').astype(object).where(dates.notna(), None).tolist(),
+        [matcher.primary(int(mask)) for mask in labels],
+        column(VALUE_COLUMN),
+        column('URL TenderNed'),
+        df['publication_count'].astype(int).tolist(),
+    )
+    return [(row, matcher.names(int(mask))) for row, mask in zip(rows, labels)]
+
+
+def json_tenders() -> list[tuple[tuple, list[str]]]:
+    """The relevant tenders of src/tenders.json (primary category only)."""
+    records = []
+    for tender in read_json(TENDERS_JSON_PATH).get('tenders', []):
+        records.append(((
+            tender['ID publicatie'],
+            tender.get('Naam Aanbestedende dienst'),
+            tender.get('Naam aanbesteding'),
+            tender.get('Publicatiedatum'),
+            tender.get('year'),
+            tender.get('category'),
+            tender.get('Geraamde waarde in EUR'),
+            tender.get('URL TenderNed'),
+            len(tender.get('publications') or [tender]),
+        ), [tender['category']] if tender.get('category') else []))
+    return records
+
+
+def load_tenders(conn: sqlite3.Connection, entity_table: EntityTable, workbook: Path | None) -> str:
+    if workbook and workbook.exists():
+        records, source = workbook_tenders(workbook), workbook.name
+    else:
+        records, source = json_tenders(), TENDERS_JSON_PATH.name
+    names = {row[1] for row, _ in records if row[1]}
+    entity_ids = entity_table.resolve(sorted(names), source='tenderned')
+    # One row per publication ID; repeated source rows are counted in copies rather than dropped
+    copies = Counter(row[0] for row, _ in records)
+    first: dict[int, tuple] = {}
+    for row, _ in records:
+        first.setdefault(row[0], row)
+
+    conn.executemany(
+        'INSERT INTO tenders VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+        [(row[0], row[1], entity_ids.get(row[1]), *row[2:], copies[row[0]]) for row in first.values()],
+    )
+    conn.executemany(
+        'INSERT OR IGNORE INTO tender_categories VALUES (?, ?)',
+        [(row[0], category) for row, categories in records for category in categories],
+    )
+    conn.executemany(
+        'INSERT INTO matches VALUES (?, ?, ?)',
+        [(name, entity_ids.get(name), (entity_table.aliases.get(normalize(name)) or {}).get('method'))
+         for name in sorted(names)],
+    )
+    conn.execute("INSERT INTO meta VALUES ('tender_source', ?)", (source,))
+    repeated = sum(1 for count in copies.values() if count > 1)
+    duplicates = f' ({len(records) - len(first)} duplicate rows of {repeated} IDs)' if repeated else ''
+    return f'{len(first)} tenders from {source}{duplicates}'
+
+
+def load_contacts(conn: sqlite3.Connection) -> int:
+    research = read_json(CONTACTS_PATH).get('contacts', {})
+    conn.executemany(
+        'INSERT INTO contact_research VALUES (?, ?, ?, ?, ?)',
+        [(name, entry.get('entity_id'), entry.get('primary_email'), entry.get('notes'), entry.get('last_checked_online'))
+         for name, entry in research.items()],
+    )
+    rows = [(name, entry.get('entity_id'), contact.get('role'), contact.get('name'), contact.get('email'),
+             contact.get('linkedin'))
+            for name, entry in research.items() for contact in entry.get('contacts') or []]
+    conn.executemany('INSERT INTO contacts VALUES (?, ?, ?, ?, ?, ?)', rows)
+    return len(rows)
+
+
+def build_database(path: Path = DB_PATH, workbook: Path | None = WORKBOOK_PATH) -> None:
+    """Load every source into a fresh database file, swapped in when complete."""
+    started = time.perf_counter()
+    path.parent.mkdir(exist_ok=True)
+    building = path.with_suffix('.building')
+    building.unlink(missing_ok=True)
+    conn = sqlite3.connect(building)
+    try:
+        conn.executescript(SCHEMA)
+        # Read-only use of the entity table: matching runs in memory, src/organization-entities.json is untouched
+        entity_table = EntityTable.load()
+        algorithms = load_register(conn, entity_table)
+        tenders = load_tenders(conn, entity_table, workbook)
+        contacts = load_contacts(conn)
+        conn.executescript(INDEXES)
+        conn.executemany('INSERT INTO meta VALUES (?, ?)', [
+            ('built', datetime.now().strftime('%Y-%m-%d %H:%M')),
+            ('sources', source_stamp(workbook)),
+        ])
+        conn.commit()
+        conn.execute('ANALYZE')
+    finally:
+        conn.close()
+    building.replace(path)
+    print(f"🗄️  Built {path.name} in {time.perf_counter() - started:.1f}s: {algorithms} algorithms, "
+          f"{tenders}, {contacts} contacts")
+
+
+def is_stale(path: Path = DB_PATH, workbook: Path | None = WORKBOOK_PATH) -> bool:
+    if not path.exists():
+        return True
+    try:
+        with sqlite3.connect(f'file:{path}?mode=ro', uri=True) as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'sources'").fetchone()
+    except sqlite3.DatabaseError:
+        return True
+    return row is None or row[0] != source_stamp(workbook)
+
+
+def open_database(path: Path = DB_PATH, workbook: Path | None = WORKBOOK_PATH, rebuild: bool = False) -> sqlite3.Connection:
+    """Read-only connection, (re)building the database first when a source changed."""
+    if rebuild or is_stale(path, workbook):
+        build_database(path, workbook)
+    return sqlite3.connect(f'file:{path}?mode=ro', uri=True)
+
+
+def run_query(conn: sqlite3.Connection, sql: str, params: dict[str, object] | None = None) -> tuple[list[str], list[tuple]]:
+    cursor = conn.execute(sql, params or {})
+    return [column[0] for column in cursor.description or []], cursor.fetchall()
+
+
+def named_query(name: str, overrides: dict[str, str]) -> tuple[str, dict[str, object]]:
+    _, sql, defaults = QUERIES[name]
+    params = dict(defaults)
+    for key, value in overrides.items():
+        default = defaults.get(key)
+        params[key] = type(default)(value) if isinstance(default, (int, float)) else value
+    return sql, params
+
+
+def print_rows(columns: list[str], rows: list[tuple], output: str) -> None:
+    if output == 'json':
+        print(json.dumps([dict(zip(columns, row)) for row in rows], indent=2, ensure_ascii=False))
+        return
+    if output == 'csv':
+        writer = csv.writer(sys.stdout)
+        writer.writerow(columns)
+        writer.writerows(rows)
+        return
+    cells = [['' if value is None else str(value) for value in row] for row in rows]
+    widths = [min(40, max([len(column), *(len(row[i]) for row in cells)])) for i, column in enumerate(columns)]
+    print('  '.join(column.ljust(width) for column, width in zip(columns, widths)))
+    print('  '.join('-' * width for width in widths))
+    for row in cells:
+        print('  '.join(value[:width].ljust(width) for value, width in zip(row, widths)))
+    print(f"({len(rows)} rows)")
+
+
+def check(conn: sqlite3.Connection) -> bool:
+    """Compare the SQL views with the aggregates in data.json and data_enriched.json."""
+    ok = True
+    fields = ['algorithm_count', 'impactful_count', 'latest_date', 'first_date']
+    stats = {row[0]: row[1:] for row in conn.execute(f"SELECT name, {', '.join(fields)} FROM lead_stats")}
+    leads = read_json(LEADS_PATH).get('leads', [])
+    differing = [lead['name'] for lead in leads
+                 if stats.get(lead['name']) != tuple(lead.get(field) for field in fields)]
+    print(f"{'✅' if not differing else '❌'} lead_stats: {len(leads) - len(differing)}/{len(leads)} leads match data.json"
+          + (f" (first difference: {differing[0]})" if differing else ''))
+    ok &= not differing
+
+    expected = read_json(TENDERS_JSON_PATH).get('stats', {})
+    # tenders.json stats count repeated rows, so the comparison does too
+    counts = dict(conn.execute(
+        "SELECT LOWER(category), SUM(copies) FROM tenders WHERE category IS NOT NULL GROUP BY category"))
+    counts['total'] = sum(counts.values())
+    keys = ['total', 'ai', 'governance', 'ict']
+    matched = all(counts.get(key, 0) == expected.get(key) for key in keys)
+    print(f"{'✅' if matched else '⚠️ '} tender-stats: {', '.join(f'{key} {counts.get(key, 0)}' for key in keys)}"
+          + ('' if matched else f" (tenders.json: {', '.join(f'{key} {expected.get(key)}' for key in keys)})"))
+    ok &= matched
+
+    enriched = read_json(ENRICHED_PATH).get('leads', [])
+    source = conn.execute("SELECT value FROM meta WHERE key = 'tender_source'").fetchone()
+    if enriched and source and source[0] != WORKBOOK_PATH.name:
+        # tenders.json holds only the relevant tenders; the enrichment counts every workbook tender
+        print(f"⏭️  tender_signals: skipped, data_enriched.json is built from {WORKBOOK_PATH.name} "
+              f"and this database from {source[0]}")
+    elif enriched and source:
+        signals = {row[0]: row[1:] for row in conn.execute(
+            "SELECT l.name, s.total, s.ai, s.governance, s.ict FROM lead_stats l "
+            "JOIN tender_signals s ON s.entity_id = l.entity_id")}
+        keys = ['tender_count', 'tender_ai', 'tender_governance', 'tender_ict']
+        differing = [lead['name'] for lead in enriched
+                     if signals.get(lead['name'], (0, 0, 0, 0)) != tuple(lead.get(key) or 0 for key in keys)]
+        print(f"{'✅' if not differing else '⚠️ '} tender_signals: {len(enriched) - len(differing)}/{len(enriched)} "
+              f"leads match data_enriched.json" + (f" (first difference: {differing[0]}; signals need the "
+                                                  f"workbook build and the same entity table)" if differing else ''))
+        ok &= not differing
+    return ok
+
+
+def benchmark(conn: sqlite3.Connection, runs: int) -> None:
+    print(f"📊 Named queries, best of {runs} runs")
+    for name in QUERIES:
+        sql, params = named_query(name, {})
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            _, rows = run_query(conn, sql, params)
+            timings.append(time.perf_counter() - started)
+        print(f"   {name:<22} {len(rows):>5} rows  {min(timings) * 1000:7.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Query the register, tenders, matches and contacts with SQL.')
+    parser.add_argument('--db', type=Path, default=DB_PATH, help='Database file')
+    parser.add_argument('--tenders', type=Path, default=WORKBOOK_PATH,
+                        help='TenderNed workbook (default: public/tenderned_data.xlsx; src/tenders.json if absent)')
+    parser.add_argument('--from-json', action='store_true', help='Load tenders from src/tenders.json, without pandas')
+    parser.add_argument('--build', action='store_true', help='Rebuild the database even if it is up to date')
+    parser.add_argument('--query', choices=sorted(QUERIES), help='Run a named query')
+    parser.add_argument('--param', action='append', default=[], metavar='KEY=VALUE', help='Named query parameter')
+    parser.add_argument('--sql', help='Run an SQL statement (read-only)')
+    parser.add_argument('--format', choices=['table', 'json', 'csv'], default='table', help='Output format')
+    parser.add_argument('--check', action='store_true', help='Compare the SQL views with the JSON outputs')
+    parser.add_argument('--benchmark', type=int, metavar='N', help='Time the named queries over N runs')
+    args = parser.parse_args()
+
+    workbook = None if args.from_json else args.tenders
+    conn = open_database(args.db, workbook, rebuild=args.build)
+    if args.check:
+        sys.exit(0 if check(conn) else 1)
+    if args.benchmark:
+        benchmark(conn, args.benchmark)
+        return
+    if args.query or args.sql:
+        if args.query:
+            sql, params = named_query(args.query, dict(param.split('=', 1) for param in args.param))
+        else:
+            sql, params = args.sql, {}
+        started = time.perf_counter()
+        columns, rows = run_query(conn, sql, params)
+        elapsed = time.perf_counter() - started
+        print_rows(columns, rows, args.format)
+        if args.format == 'table':
+            print(f"⏱️  {elapsed * 1000:.1f} ms")
+        return
+    if not args.build:
+        print("Named queries (--query NAME [--param KEY=VALUE]):")
+        for name, (description, _, defaults) in QUERIES.items():
+            params = ', '.join(f'{key}={value}' for key, value in defaults.items())
+            print(f"   {name:<22} {description}" + (f" [{params}]" if params else ''))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Per-organization contact-candidate index, built once at register ingest.
+For every organization: normalized register emails with their classified role (memoized per
+distinct local-part), email domains and derived base URLs. Contact expansion and crawl
+planning read src/contact-candidates.json instead of rescanning algorithm lists.
+
+    python contact_candidates.py "Gemeente Utrecht"
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable
+from urllib.parse import urlparse
+
+ROOT = Path(__file__).resolve().parent
+INDEX_PATH = ROOT / 'src' / 'contact-candidates.json'
+
+EMAIL_RE = re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+')
+EMAIL_FULL_RE = re.compile(r'^[\w.+-]+@[\w-]+\.[\w.-]+$')
+
+ROLE_RULES = [
+    ('Functionaris Gegevensbescherming (FG)', re.compile(r'(^|[._-])(fg|functionaris|gegevensbescherming|privacy|dpo)([._-]|$)')),
+    ('CISO', re.compile(r'(^|[._-])ciso([._-]|$)')),
+    ('CIO', re.compile(r'(^|[._-])cio([._-]|$)')),
+    ('Algoritmeregister contact', re.compile(r'algoritme')),
+    ('Data/Informatiemanagement', re.compile(r'(data|informatie|informatiemanagement)')),
+    ('Algemeen contact', re.compile(r'(info|contact|gemeente|secretariaat|postbus)')),
+]
+
+# Job-title keywords of the roles outreach targets, used for researched roles and crawled pages
+ROLE_KEYWORDS = {
+    'Functionaris Gegevensbescherming (FG)': [
+        'functionaris gegevensbescherming',
+        'gegevensbescherming',
+        'privacy officer',
+        'privacyfunctionaris',
+        'fg',
+        'dpo',
+    ],
+    'CISO': [
+        'ciso',
+        'informatiebeveiliging',
+        'security officer',
+    ],
+    'CIO': [
+        'cio',
+        'chief information officer',
+        'informatiemanager',
+    ],
+}
+# A site's crawl stops once named contacts for these roles are known for all its organizations
+TARGET_ROLES = set(ROLE_KEYWORDS)
+# Researched roles are free text ("CIO (Chief Information Officer)"); keywords must be whole words
+TARGET_ROLE_PATTERNS = [
+    (role, re.compile(r'\b(' + '|'.join(map(re.escape, keywords)) + r')\b', re.I))
+    for role, keywords in ROLE_KEYWORDS.items()
+]
+
+
+def extract_emails(value: object) -> list[str]:
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [email for item in value for email in extract_emails(item)]
+    if not isinstance(value, str):
+        return []
+    return EMAIL_RE.findall(value)
+
+
+def normalize_emails(emails: Iterable[str]) -> list[str]:
+    """Lowercased, well-formed, de-duplicated emails in first-seen order."""
+    cleaned = (email.strip().lower() for email in emails)
+    return list(dict.fromkeys(email for email in cleaned if email and EMAIL_FULL_RE.match(email)))
+
+
+@lru_cache(maxsize=None)
+def role_for_local(local: str) -> tuple[str, int]:
+    """Role and priority rank for an email local-part; the same local-part recurs across many orgs."""
+    for index, (role, pattern) in enumerate(ROLE_RULES):
+        if pattern.search(local):
+            return role, index
+    return 'Algemeen contact', len(ROLE_RULES)
+
+
+def role_for_email(email: str) -> tuple[str, int]:
+    return role_for_local(email.split('@', 1)[0].lower())
+
+
+def target_role(role: str | None) -> str | None:
+    """The TARGET_ROLES entry a recorded role stands for, if any."""
+    if not role or role in TARGET_ROLES:
+        return role
+    return next((target for target, pattern in TARGET_ROLE_PATTERNS if pattern.search(role)), None)
+
+
+def role_rank(role: str | None) -> int:
+    """Priority rank of a free-text research role ("Chief Information Officer") under ROLE_RULES.
+
+    FG, CISO and CIO are recognised by target_role, as the crawler does; only other roles are
+    matched like an email local-part, against the remaining rules.
+    """
+    target = target_role(role)
+    names = [name for name, _ in ROLE_RULES]
+    if target is not None:
+        return names.index(target)
+    local = re.sub(r'[^a-z0-9]+', '.', (role or '').lower())
+    for index, (name, pattern) in enumerate(ROLE_RULES):
+        if name not in TARGET_ROLES and pattern.search(local):
+            return index
+    return len(ROLE_RULES)
+
+
+def canonical_base(url: str) -> str | None:
+    if not url:
+        return None
+    parsed = urlparse(url)
+    if not parsed.scheme:
+        parsed = urlparse('https://' + url)
+    if not parsed.netloc:
+        return None
+    return f'{parsed.scheme}://{parsed.netloc}'
+
+
+def org_candidates(org: dict) -> dict:
+    """Contact candidates for one organization from its register emails and websites."""
+    emails = normalize_emails(
+        extract_emails(org.get('contact_emails', []))
+        + [email for algo in org.get('algorithms', []) for email in extract_emails(algo.get('contact_email'))]
+    )
+    ranked = sorted(emails, key=lambda email: (role_for_email(email)[1], email))
+    domains = list(dict.fromkeys(email.split('@', 1)[1] for email in emails))
+    return {
+        'entity_id': org.get('entity_id'),
+        'emails': [
+            {'email': email, 'role': role_for_email(email)[0], 'rank': role_for_email(email)[1]}
+            for email in ranked
+        ],
+        'domains': domains,
+        'website_bases': list(dict.fromkeys(filter(None, map(canonical_base, org.get('websites', []) or [])))),
+        'email_bases': list(dict.fromkeys(filter(None, map(canonical_base, domains)))),
+    }
+
+
+def build_contact_index(organizations: dict, output_path: Path = INDEX_PATH) -> dict:
+    index = {name: org_candidates(org) for name, org in organizations.items()}
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({'generated_date': datetime.now().strftime('%Y-%m-%d %H:%M'), 'organizations': index},
+                  f, ensure_ascii=False, separators=(',', ':'))
+    emails = sum(len(entry['emails']) for entry in index.values())
+    roles = role_for_local.cache_info()
+    print(f"📇 Contact candidates: {emails} emails for {len(index)} organizations "
+          f"({roles.currsize} distinct local-parts classified, {roles.hits} memo hits)")
+    return index
+
+
+def load_contact_index(path: Path = INDEX_PATH) -> dict[str, dict]:
+    """Candidates per organization name, or {} when the ingest has not written the index yet."""
+    if not path.exists():
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)['organizations']
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Show contact candidates for organizations.')
+    parser.add_argument('names', nargs='+', help='Organization names')
+    args = parser.parse_args()
+    index = load_contact_index()
+    for name in args.names:
+        print(json.dumps({name: index.get(name)}, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
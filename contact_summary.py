@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Compact per-organization projection of exports/contact-research.json for the dashboards.
+Lead rows only need the primary email, how many named contacts exist, the best contact found
+and when the organization was last checked online; notes, LinkedIn search URLs of other
+contacts and phone numbers stay in the full research file, which is only loaded when an
+organization is opened. Written next to the research file by the contact scripts.
+
+The research stays keyed by the name it was researched under (the maintenance scripts edit it by
+name), but every entry carries the canonical entity_id of src/organization-entities.json; the
+summary is keyed by that id, so dashboards and exports join contacts to leads on entity_id.
+
+    python contact_summary.py
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from datetime import datetime
+from pathlib import Path
+
+from contact_candidates import role_rank
+from entity_resolution import EntityTable
+
+ROOT = Path(__file__).resolve().parent
+CONTACTS_PATH = ROOT / 'exports' / 'contact-research.json'
+SUMMARY_PATH = ROOT / 'exports' / 'contact-summary.json'
+
+
+def contact_summary(entry: dict) -> dict:
+    """Summary of one research entry; empty fields are left out."""
+    contacts = entry.get('contacts') or []
+    named = [c for c in contacts if c.get('name')]
+    # Named contacts ranked by role priority (FG, CISO, CIO, ...), research order within a role;
+    # without a named person the first role found is kept
+    best = min(named, key=lambda c: role_rank(c.get('role'))) if named else (contacts[0] if contacts else {})
+    linked = next((c for c in named if c.get('linkedin')), None)
+    summary = {
+        'primary_email': entry.get('primary_email'),
+        'named': len(named),
+        'name': best.get('name'),
+        'role': best.get('role'),
+        'linkedin': linked['linkedin'] if linked else None,
+        'linkedin_name': linked['name'] if linked else None,
+        'last_checked': entry.get('last_checked_online'),
+    }
+    return {key: value for key, value in summary.items() if value is not None}
+
+
+def assign_entity_ids(contacts_payload: dict, table: EntityTable | None = None) -> int:
+    """Set entity_id on research entries that lack one; returns how many entries remain without an id."""
+    contacts = contacts_payload.get('contacts') or {}
+    missing = [name for name, entry in contacts.items() if not entry.get('entity_id')]
+    table = table or EntityTable.load()
+    # Before the first register ingest there are no entities to resolve against
+    if missing and table.entities:
+        entity_ids = table.resolve(missing, source='contacts')
+        table.save()
+        for name in missing:
+            if entity_ids.get(name):
+                contacts[name]['entity_id'] = entity_ids[name]
+    return sum(1 for entry in contacts.values() if not entry.get('entity_id'))
+
+
+def research_keys(contacts: dict) -> dict[str, str]:
+    """entity_id -> the name an organization's research is stored under."""
+    return {entry['entity_id']: name for name, entry in contacts.items() if entry.get('entity_id')}
+
+
+def build_contact_summary(contacts_payload: dict) -> dict:
+    """Summaries keyed by entity_id; research entries that resolve to no organization cannot join a lead."""
+    return {
+        'generated_date': contacts_payload.get('generated_date') or datetime.now().strftime('%Y-%m-%d %H:%M'),
+        'contacts': {
+            entry['entity_id']: contact_summary(entry)
+            for entry in (contacts_payload.get('contacts') or {}).values() if entry.get('entity_id')
+        },
+    }
+
+
+def save_research(contacts_payload: dict, path: Path = CONTACTS_PATH) -> None:
+    path.write_text(json.dumps(contacts_payload, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+
+
+def save_contact_summary(contacts_payload: dict, path: Path = SUMMARY_PATH) -> dict:
+    summary = build_contact_summary(contacts_payload)
+    path.write_text(json.dumps(summary, ensure_ascii=False, separators=(',', ':')) + '\n', encoding='utf-8')
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Write the compact contact summary used by the dashboards.')
+    parser.add_argument('--contacts-file', type=Path, default=CONTACTS_PATH, help='Contact research JSON')
+    parser.add_argument('--output', type=Path, default=SUMMARY_PATH, help='Summary JSON to write')
+    args = parser.parse_args()
+
+    contacts_payload = json.loads(args.contacts_file.read_text(encoding='utf-8'))
+    entries = contacts_payload.get('contacts') or {}
+    had_ids = sum(1 for entry in entries.values() if entry.get('entity_id'))
+    unresolved = assign_entity_ids(contacts_payload)
+    if len(entries) - unresolved > had_ids:
+        save_research(contacts_payload, args.contacts_file)
+    summary = save_contact_summary(contacts_payload, args.output)
+    full_kb = args.contacts_file.stat().st_size / 1024
+    print(f"✅ Summarized {len(summary['contacts'])} organizations: "
+          f"{full_kb:.0f} KB -> {args.output.stat().st_size / 1024:.0f} KB")
+    if unresolved:
+        print(f"⚠️  {unresolved} researched organizations have no entity id and are left out "
+              f"(see python entity_resolution.py)")
+    print(f"💾 Saved to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
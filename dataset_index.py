@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Precomputed sort orders and facet postings shipped with the dashboard datasets.
+data.json and tenders.json carry an 'index': row positions per sort key and per facet value.
+The dashboards filter by intersecting postings and page by slicing a permutation instead of
+re-sorting and re-counting on every filter change; facet counts are the posting lengths.
+
+    python dataset_index.py --benchmark 30000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Iterable
+
+# Sort keys offered by the lead dashboard; all descending, leads without a value last
+LEAD_SORTS = ['lead_score', 'algorithm_count', 'impactful_count', 'latest_date']
+
+
+def sort_order(rows: list[dict], field: str) -> list[int]:
+    """Row positions by field descending (stable, like Array.prototype.sort); missing values last."""
+    present = [i for i, row in enumerate(rows) if row.get(field) is not None]
+    missing = [i for i, row in enumerate(rows) if row.get(field) is None]
+    return sorted(present, key=lambda i: rows[i][field], reverse=True) + missing
+
+
+def postings(values: Iterable[Iterable[object]]) -> dict[str, list[int]]:
+    """Row positions per facet value; a row may carry several values (or none)."""
+    index: dict[str, list[int]] = {}
+    for position, row_values in enumerate(values):
+        for value in row_values:
+            index.setdefault(str(value), []).append(position)
+    return dict(sorted(index.items()))
+
+
+def year_of(date: str | None) -> list[str]:
+    return [date[:4]] if date else []
+
+
+def lead_index(leads: list[dict]) -> dict:
+    return {
+        'sort': {field: sort_order(leads, field) for field in LEAD_SORTS},
+        'facets': {
+            'type': postings([lead['type']] if lead.get('type') else [] for lead in leads),
+            'priority': postings([lead['priority']] if lead.get('priority') else [] for lead in leads),
+            'category': postings(
+                [category for category, count in (lead.get('categories') or {}).items() if count] for lead in leads
+            ),
+            # Year of the most recent register publication
+            'year': postings(year_of(lead.get('latest_date')) for lead in leads),
+        },
+    }
+
+
+def tender_index(tenders: list[dict]) -> dict:
+    return {
+        'facets': {
+            'category': postings([tender['category']] if tender.get('category') else [] for tender in tenders),
+            'year': postings([int(tender['year'])] if tender.get('year') else [] for tender in tenders),
+            'organization': postings(
+                [tender['Naam Aanbestedende dienst']] if tender.get('Naam Aanbestedende dienst') else []
+                for tender in tenders
+            ),
+        },
+    }
+
+
+def benchmark(size: int) -> None:
+    rng = random.Random(7)
+    leads = [{
+        'name': f'Organisatie {i}',
+        'type': rng.choice(['Gemeente', 'Provincie', 'ZBO', 'Overig']),
+        'priority': rng.choice(['Hot', 'Warm', 'Medium', 'Low']),
+        'lead_score': rng.randint(0, 100),
+        'algorithm_count': rng.randint(1, 60),
+        'impactful_count': rng.randint(0, 20),
+        'latest_date': None if rng.random() < 0.1 else f'{rng.randint(2019, 2025)}-{rng.randint(1, 12):02d}-01',
+        'categories': {category: rng.randint(0, 3) for category in ('Fraude', 'Zorg', 'Verkeer')},
+    } for i in range(size)]
+    started = time.perf_counter()
+    index = lead_index(leads)
+    elapsed = time.perf_counter() - started
+    postings_count = sum(len(rows) for facet in index['facets'].values() for rows in facet.values())
+    print(f"📊 {size} leads: {len(LEAD_SORTS)} sort orders and {postings_count} facet postings in {elapsed * 1000:.0f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Build sort orders and facet postings for the dashboard data.')
+    parser.add_argument('--benchmark', type=int, metavar='N', default=3000, help='Index N synthetic leads')
+    args = parser.parse_args()
+    benchmark(args.benchmark)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 const XLSX = require('xlsx');
 const fs = require('fs');
 const path = require('path');
+const { loadMatcher, loadCache, saveCache, classifyTender } = require('./tender-taxonomy');
 
 // Load existing leads
 const leadsPath = path.join(__dirname, 'src', 'data.json');
@@ -9,34 +10,23 @@ const existingData = JSON.parse(fs.readFileSync(leadsPath, 'utf-8'));
 // Load TenderNed data
 console.log('📂 Loading TenderNed Excel file (this may take a moment)...');
 const workbook = XLSX.readFile(path.join(__dirname, 'public', 'tenderned_data.xlsx'));
-const sheetName = workbook.SheetNames[0];
+const sheetName = workbook.SheetNames[1];
 const tenderData = XLSX.utils.sheet_to_json(workbook.Sheets[sheetName]);
 
 console.log(`✅ Loaded ${tenderData.length} tenders from TenderNed`);
 
-// Keywords to search for AI/governance related tenders
-const aiKeywords = ['ai', 'artificial intelligence', 'kunstmatige intelligentie', 'algoritme', 'algorithm', 'machine learning', 'deep learning', 'neural', 'chatbot', 'llm'];
-const govKeywords = ['governance', 'compliance', 'gdpr', 'avg', 'privacy', 'informatiebeveiliging', 'security', 'audit', 'risk', 'risico'];
-const ictKeywords = ['ict', 'software', 'saas', 'cloud', 'digitalisering', 'informatisering', 'applicatie', 'systeem'];
-
-// Helper to check if tender matches keywords
-function matchesKeywords(tender, keywords) {
-    const searchFields = [
-        tender['Naam opdracht'] || '',
-        tender['Omschrijving'] || '',
-        tender['Onderwerp'] || '',
-        tender['Titel'] || '',
-        tender['CPV-code omschrijving'] || ''
-    ].join(' ').toLowerCase();
-
-    return keywords.some(kw => searchFields.includes(kw.toLowerCase()));
-}
+// Shared keyword taxonomy (src/tender-taxonomy.json), same matcher rules as the Python scripts
+const matcher = loadMatcher();
+const labelCache = loadCache(matcher);
+const AI = matcher.bit('AI');
+const GOVERNANCE = matcher.bit('Governance');
+const ICT = matcher.bit('ICT');
 
 // Find tenders per organization
 const orgTenders = {};
 
 tenderData.forEach(tender => {
-    const orgName = tender['Aanbestedende dienst'] || tender['Naam organisatie'] || '';
+    const orgName = tender['Naam Aanbestedende dienst'] || tender['Officiële naam Aanbestedende dienst'] || '';
     if (!orgName) return;
 
     // Normalize organization name
@@ -56,9 +46,10 @@ tenderData.forEach(tender => {
     orgTenders[normalizedName].total++;
 
     // Check categories
-    if (matchesKeywords(tender, aiKeywords)) orgTenders[normalizedName].ai++;
-    if (matchesKeywords(tender, govKeywords)) orgTenders[normalizedName].governance++;
-    if (matchesKeywords(tender, ictKeywords)) orgTenders[normalizedName].ict++;
+    const labels = classifyTender(tender, matcher, labelCache);
+    if (labels & AI) orgTenders[normalizedName].ai++;
+    if (labels & GOVERNANCE) orgTenders[normalizedName].governance++;
+    if (labels & ICT) orgTenders[normalizedName].ict++;
 
     // Track years
     const year = tender['Jaar'] || tender['Publicatiedatum']?.substring(0, 4);
@@ -67,6 +58,8 @@ tenderData.forEach(tender => {
     }
 });
 
+saveCache(matcher, labelCache);
+
 console.log(`📊 Found ${Object.keys(orgTenders).length} unique organizations in TenderNed data`);
 
 // Match with existing leads
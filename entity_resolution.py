@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Persistent entity resolution for organization names.
+Register, TenderNed and contact-research names are resolved once to a canonical organization
+id and stored with their provenance in src/organization-entities.json, so later runs (and
+joins) are dictionary lookups. Only names never seen before go through matching.
+Manual corrections live in src/entity-overrides.json: {"aliases": {"raw name": "entity-id" | null}}.
+
+    python entity_resolution.py "Gemeente 's-Hertogenbosch (Den Bosch)"
+    python entity_resolution.py --stats
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable
+
+ROOT = Path(__file__).resolve().parent
+ENTITIES_PATH = ROOT / 'src' / 'organization-entities.json'
+OVERRIDES_PATH = ROOT / 'src' / 'entity-overrides.json'
+
+PAREN_RE = re.compile(r'\(([^)]*)\)')
+NON_WORD_RE = re.compile(r'[^0-9a-z]+')
+ACRONYM_RE = re.compile(r'^[A-Za-z][A-Za-z-]{2,9}$')
+
+
+def normalize(name: str) -> str:
+    """Lowercase, accent-free, punctuation-free key: "Gemeente 's-Hertogenbosch" -> "gemeente s hertogenbosch"."""
+    decomposed = unicodedata.normalize('NFKD', str(name).lower())
+    folded = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return ' '.join(NON_WORD_RE.sub(' ', folded).split())
+
+
+def base_keys(name: str) -> list[str]:
+    """Looser keys for matching: the name without parentheses, plus an acronym in parentheses ("NZa")."""
+    keys = [normalize(PAREN_RE.sub(' ', name))]
+    for inner in PAREN_RE.findall(name):
+        if ACRONYM_RE.match(inner.strip()):
+            keys.append(normalize(inner))
+    return [key for key in keys if key]
+
+
+def slugify(name: str) -> str:
+    return normalize(name).replace(' ', '-') or 'org'
+
+
+def contains(short: str, long: str) -> bool:
+    """Word-boundary containment of one key in another."""
+    return f' {short} ' in f' {long} '
+
+
+class EntityTable:
+    """Canonical organizations, alias -> entity records with provenance, and manual overrides."""
+
+    def __init__(self, data: dict | None = None, overrides: dict | None = None,
+                 path: Path = ENTITIES_PATH) -> None:
+        data = data or {}
+        self.path = path
+        self.entities: dict[str, dict] = data.get('entities', {})
+        self.aliases: dict[str, dict] = data.get('aliases', {})
+        self.overrides = {normalize(raw): entity_id for raw, entity_id in (overrides or {}).items()}
+        self.by_base: dict[str, set[str]] = defaultdict(set)
+        for entity_id, entity in self.entities.items():
+            for alias in entity['aliases']:
+                for key in base_keys(alias):
+                    self.by_base[key].add(entity_id)
+
+    @classmethod
+    def load(cls, path: Path = ENTITIES_PATH, overrides_path: Path = OVERRIDES_PATH) -> EntityTable:
+        data = json.loads(path.read_text(encoding='utf-8')) if path.exists() else {}
+        overrides = {}
+        if overrides_path.exists():
+            overrides = json.loads(overrides_path.read_text(encoding='utf-8')).get('aliases', {})
+        return cls(data, overrides, path)
+
+    def save(self) -> None:
+        payload = {
+            'generated_date': datetime.now().strftime('%Y-%m-%d %H:%M'),
+            'entities': dict(sorted(self.entities.items())),
+            'aliases': dict(sorted(self.aliases.items())),
+        }
+        self.path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+
+    def canonical_id(self, name: str) -> str | None:
+        """Hash lookup of an already resolved name (overrides first)."""
+        key = normalize(name)
+        if key in self.overrides:
+            return self.overrides[key]
+        record = self.aliases.get(key)
+        return record['id'] if record else None
+
+    def canonical_name(self, entity_id: str | None) -> str | None:
+        entity = self.entities.get(entity_id) if entity_id else None
+        return entity['name'] if entity else None
+
+    def add_entity(self, name: str) -> str:
+        entity_id = base = slugify(name)
+        suffix = 2
+        while entity_id in self.entities:
+            entity_id = f'{base}-{suffix}'
+            suffix += 1
+        self.entities[entity_id] = {'name': name, 'aliases': []}
+        return entity_id
+
+    def link(self, name: str, entity_id: str | None, source: str, method: str, candidates: Iterable[str] = ()) -> None:
+        record = {'id': entity_id, 'raw': name, 'source': source, 'method': method,
+                  'first_seen': datetime.now().strftime('%Y-%m-%d')}
+        if entity_id is None:
+            # Remember how many entities existed, so unmatched names are retried once the table grows
+            record['checked_against'] = len(self.entities)
+            if candidates:
+                record['candidates'] = sorted(candidates)
+        self.aliases[normalize(name)] = record
+        entity = self.entities.get(entity_id) if entity_id else None
+        if entity is not None:
+            if name not in entity['aliases']:
+                entity['aliases'].append(name)
+            for key in base_keys(name):
+                self.by_base[key].add(entity_id)
+
+    def match(self, name: str) -> tuple[str | None, str, set[str]]:
+        """Best entity for an unseen name: (id, method, ambiguous candidates)."""
+        keys = base_keys(name)
+        if not keys:
+            return None, 'unmatched', set()
+        for key in keys:
+            hits = self.by_base.get(key, set())
+            if len(hits) == 1:
+                return next(iter(hits)), 'base', set()
+            if len(hits) > 1:
+                return None, 'ambiguous', hits
+        key = keys[0]
+        hits = {
+            entity_id for base, ids in self.by_base.items() if len(base) > 3 and (contains(key, base) or contains(base, key))
+            for entity_id in ids
+        }
+        if len(hits) == 1:
+            return next(iter(hits)), 'contains', set()
+        return None, 'ambiguous' if hits else 'unmatched', hits
+
+    def resolve(self, names: Iterable[str], source: str, create: bool = False) -> dict[str, str | None]:
+        """Canonical id per name. Seen names are lookups; unseen ones are matched (or created) and stored.
+
+        With create=True (the register, which defines the organizations) a name only joins an
+        existing entity on an exact normalized key or an override; otherwise it becomes a new entity.
+        """
+        resolved: dict[str, str | None] = {}
+        stats: Counter = Counter()
+        for name in names:
+            if not isinstance(name, str) or not name.strip() or name in resolved:
+                continue
+            key = normalize(name)
+            if key in self.overrides:
+                entity_id = self.overrides[key]
+                if key not in self.aliases or self.aliases[key]['id'] != entity_id:
+                    self.link(name, entity_id, source, 'override')
+                resolved[name] = entity_id
+                stats['override'] += 1
+                continue
+            record = self.aliases.get(key)
+            stale = record is not None and record['id'] is None and (
+                create or record.get('checked_against', 0) < len(self.entities))
+            if record is not None and not stale:
+                resolved[name] = record['id']
+                stats['cached'] += 1
+                continue
+            if create:
+                entity_id = self.add_entity(name)
+                self.link(name, entity_id, source, 'new')
+                stats['new'] += 1
+            else:
+                entity_id, method, candidates = self.match(name)
+                self.link(name, entity_id, source, method, candidates)
+                stats[method] += 1
+            resolved[name] = entity_id
+        summary = ', '.join(f'{count} {method}' for method, count in stats.most_common())
+        print(f"🪪 Entity resolution ({source}): {len(resolved)} names - {summary or 'nothing to do'}")
+        return resolved
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Look up canonical organizations and their aliases.')
+    parser.add_argument('names', nargs='*', help='Organization names to resolve (read-only)')
+    parser.add_argument('--stats', action='store_true', help='Summarize the entity table')
+    args = parser.parse_args()
+
+    table = EntityTable.load()
+    if args.stats:
+        methods = Counter(record['method'] for record in table.aliases.values())
+        sources = Counter(record['source'] for record in table.aliases.values())
+        multi = sum(1 for entity in table.entities.values() if len(entity['aliases']) > 1)
+        print(f"🪪 {len(table.entities)} entities ({multi} with several aliases), {len(table.aliases)} aliases")
+        print(f"   • by source: {dict(sources)}")
+        print(f"   • by method: {dict(methods)}")
+    for name in args.names:
+        entity_id = table.canonical_id(name)
+        if entity_id is None:
+            entity_id, method, candidates = table.match(name)
+            detail = f"{method} (not stored)" + (f", candidates: {', '.join(sorted(candidates))}" if candidates else '')
+        else:
+            record = table.aliases.get(normalize(name), {})
+            detail = f"{record.get('method', 'override')} via {record.get('source', 'overrides')}"
+        print(f"   {name} -> {entity_id} ({table.canonical_name(entity_id)}) [{detail}]")
+
+
+if __name__ == '__main__':
+    main()
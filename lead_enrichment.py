@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+TenderNed buying signals and lead enrichment, used by the enrich command and the lead daemon.
+Tenders are classified and aggregated per organization once; joining the aggregates onto a
+(re)scored lead list is a cheap entity_id join.
+
+    python algoritmehub.py enrich --tenders public/tenderned_data.xlsx
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from entity_resolution import EntityTable
+from tender_dedup import dedupe_tenders, org_column
+from tender_reader import TENDERS_PATH, read_tenders
+from tender_spend import SpendCube, build_spend_cube, cube_payload, save_spend_cube, spend_frame
+from tender_taxonomy import TenderMatcher, classify_frame, load_matcher
+
+ROOT = Path(__file__).resolve().parent
+LEADS_PATH = ROOT / 'src' / 'data.json'
+ENRICHED_PATH = ROOT / 'src' / 'data_enriched.json'
+
+
+def load_tenders(path: Path = TENDERS_PATH,
+                 matcher: TenderMatcher | None = None) -> tuple[pd.DataFrame, pd.Series | None]:
+    """Tenders streamed from the workbook, with their taxonomy labels when a matcher is given."""
+    return read_tenders(path, matcher)
+
+
+def tender_labels(df: pd.DataFrame, matcher: TenderMatcher) -> pd.Series:
+    """Category bitmask per tender with the shared taxonomy (src/tender-taxonomy.json)."""
+    # Publications classified in earlier runs reuse their cached labels
+    return pd.Series(classify_frame(df, matcher), index=df.index)
+
+
+def tender_aggregates(df: pd.DataFrame, matcher: TenderMatcher | None = None,
+                      labels: pd.Series | None = None) -> pd.DataFrame:
+    """Procurement counts per contracting authority: total, AI, governance, ICT and recent activity.
+
+    Expects one row per procurement (dedupe_tenders); raw publications count corrections and awards again.
+    """
+    matcher = matcher or load_matcher()
+    if labels is None:
+        labels = tender_labels(df, matcher)
+    df = df.assign(
+        is_ai=(labels & matcher.bit('AI')) > 0,
+        is_gov=(labels & matcher.bit('Governance')) > 0,
+        is_ict=(labels & matcher.bit('ICT')) > 0,
+        # Recent = published in 2024 or later
+        is_recent=pd.to_datetime(df['Publicatiedatum'], errors='coerce').dt.year >= 2024,
+    )
+
+    org_col = org_column(df)
+    return df.groupby(org_col).agg(
+        total=('ID publicatie', 'count'),
+        ai=('is_ai', 'sum'),
+        governance=('is_gov', 'sum'),
+        ict=('is_ict', 'sum'),
+        recent=('is_recent', 'any'),
+    ).reset_index().rename(columns={org_col: 'org_name'})
+
+
+def resolve_lead_ids(leads_df: pd.DataFrame, entity_table: EntityTable) -> pd.DataFrame:
+    """Fill in entity ids for leads from a data.json written before ids existed.
+
+    These leads are registered first, so TenderNed names can match them.
+    """
+    if 'entity_id' not in leads_df.columns:
+        leads_df['entity_id'] = None
+    missing_ids = leads_df['entity_id'].isna()
+    if missing_ids.any():
+        lead_ids = entity_table.resolve(leads_df.loc[missing_ids, 'name'], source='register', create=True)
+        leads_df.loc[missing_ids, 'entity_id'] = leads_df.loc[missing_ids, 'name'].map(lead_ids)
+    return leads_df
+
+
+def entity_signals(agg_data: pd.DataFrame, entity_table: EntityTable) -> pd.DataFrame:
+    """Tender aggregates per canonical organization id."""
+    # TenderNed names resolved in earlier runs are plain lookups; only new variants are matched
+    tender_ids = entity_table.resolve(agg_data['org_name'].astype(str).unique(), source='tenderned')
+    entity_ids = agg_data['org_name'].astype(str).map(tender_ids)
+    return agg_data.assign(entity_id=entity_ids).dropna(subset=['entity_id']).groupby('entity_id').agg(
+        total=('total', 'sum'),
+        ai=('ai', 'sum'),
+        governance=('governance', 'sum'),
+        ict=('ict', 'sum'),
+        recent=('recent', 'any'),
+    )
+
+
+def tender_spend(df: pd.DataFrame, labels: pd.Series, matcher: TenderMatcher, entity_table: EntityTable) -> dict:
+    """Spend cube payload keyed by canonical organization id (the TenderNed name when unresolved)."""
+    names = df[org_column(df)].astype(str)
+    tender_ids = entity_table.resolve(names.unique(), source='tenderned')
+    keys = names.map(tender_ids).fillna(names)
+    cube = build_spend_cube(spend_frame(df, labels, matcher.categories, keys))
+    display_names = {entity_id: entity_table.canonical_name(entity_id)
+                     for entity_id in set(tender_ids.values()) if entity_id}
+    return cube_payload(cube, display_names)
+
+
+def enrich_leads(leads_df: pd.DataFrame, signals: pd.DataFrame,
+                 spend: SpendCube | None = None) -> tuple[pd.DataFrame, int, int]:
+    """Leads joined with their TenderNed signals and rescored, plus matched and enriched counts."""
+    joined = leads_df.join(signals, on='entity_id')
+    matched = joined['entity_id'].notna() & joined['total'].notna()
+
+    counts = joined[['total', 'ai', 'governance', 'ict']].fillna(0).astype(int)
+    recent = joined['recent'].fillna(False).astype(bool)
+
+    # Buying signal (0-15 points): AI first, then governance, then ICT
+    buying_signal = np.select(
+        [counts['ai'] > 0, counts['governance'] > 0, counts['ict'] > 0],
+        [np.minimum(15, counts['ai'] * 5), np.minimum(10, counts['governance'] * 3), np.minimum(5, counts['ict'])],
+        default=0,
+    )
+    # Recency bonus
+    buying_signal = np.where(recent, np.minimum(15, buying_signal + 3), buying_signal)
+    buying_signal = np.where(matched, buying_signal, 0)
+
+    matched_count = int(matched.sum())
+    enriched_count = int((matched & ((buying_signal > 0) | (counts['total'] > 5))).sum())
+
+    enriched_df = leads_df.copy()
+    enriched_df['tender_count'] = counts['total']
+    enriched_df['tender_ai'] = counts['ai']
+    enriched_df['tender_governance'] = counts['governance']
+    enriched_df['tender_ict'] = counts['ict']
+    enriched_df['buying_signal'] = buying_signal
+    if spend is not None:
+        # Total estimated value of all tenders, read from the spend cube
+        enriched_df['tender_value'] = [spend.total(entity_id) for entity_id in leads_df['entity_id']]
+    enriched_df['lead_score_original'] = enriched_df['lead_score']
+    enriched_df['lead_score'] = np.where(
+        matched,
+        np.minimum(100, enriched_df['lead_score'] + buying_signal // 2),
+        enriched_df['lead_score'],
+    )
+
+    # Sort by new score
+    enriched_df = enriched_df.sort_values('lead_score', ascending=False, kind='stable')
+    return enriched_df, matched_count, enriched_count
+
+
+def enriched_output(enriched_df: pd.DataFrame, total_algorithms: int, matched_count: int,
+                    enriched_count: int) -> dict:
+    enriched_leads = enriched_df.to_dict(orient='records')
+    return {
+        'generated_date': pd.Timestamp.now().strftime('%Y-%m-%d'),
+        'total_leads': len(enriched_leads),
+        'total_algorithms': total_algorithms,
+        'matched_with_tenderned': matched_count,
+        'enriched_with_signals': enriched_count,
+        'leads': enriched_leads,
+    }
+
+
+def enrich(leads_path: Path = LEADS_PATH, tenders_path: Path = TENDERS_PATH,
+           output_path: Path = ENRICHED_PATH) -> dict:
+    """Enrich the leads in data.json with TenderNed buying signals and write data_enriched.json."""
+    print("📂 Loading TenderNed Excel file...")
+    matcher = load_matcher()
+    df, labels = load_tenders(tenders_path, matcher)
+    print(f"✅ Loaded {len(df)} tenders from TenderNed")
+
+    with open(leads_path, 'r', encoding='utf-8') as f:
+        existing_data = json.load(f)
+    print(f"📊 Loaded {len(existing_data['leads'])} existing leads")
+
+    df, labels = dedupe_tenders(df, labels)
+    agg_data = tender_aggregates(df, matcher, labels)
+    print(f"📊 Found {len(agg_data)} unique organizations in TenderNed data")
+    print(f"   • {int((agg_data['ai'] > 0).sum())} organizations with AI-related tenders")
+    print(f"   • {int((agg_data['governance'] > 0).sum())} organizations with governance-related tenders")
+
+    # Canonical organization ids (src/organization-entities.json)
+    entity_table = EntityTable.load()
+    leads_df = resolve_lead_ids(pd.DataFrame(existing_data['leads']), entity_table)
+    signals = entity_signals(agg_data, entity_table)
+    spend = tender_spend(df, labels, matcher, entity_table)
+    entity_table.save()
+    save_spend_cube(spend)
+
+    # Join leads with their TenderNed aggregates on the canonical id
+    enriched_df, matched_count, enriched_count = enrich_leads(leads_df, signals, SpendCube(spend))
+    enriched_data = enriched_output(enriched_df, existing_data['total_algorithms'], matched_count, enriched_count)
+    enriched_leads = enriched_data['leads']
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(enriched_data, f, indent=2, ensure_ascii=False)
+
+    print(f"\n📈 Enrichment Summary:")
+    print(f"   • Total leads: {len(enriched_leads)}")
+    print(f"   • Matched with TenderNed: {matched_count}")
+    print(f"   • Enriched with buying signals: {enriched_count}")
+    print(f"\n💾 Saved to: {output_path}")
+
+    print("\n🏆 Top 10 Leads (with buying signals):")
+    for i, lead in enumerate(enriched_leads[:10]):
+        signal = '🔥' if lead['buying_signal'] > 0 else '📊'
+        print(f"   {i+1}. {lead['name']} - Score: {lead['lead_score']} (was {lead['lead_score_original']}) {signal} AI:{lead['tender_ai']} Gov:{lead['tender_governance']}")
+
+    print("\n✅ Done!")
+    return enriched_data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Enrich leads with TenderNed buying signals.')
+    parser.add_argument('--leads', type=Path, default=LEADS_PATH, help='Scored leads (src/data.json)')
+    parser.add_argument('--tenders', type=Path, default=TENDERS_PATH, help='TenderNed Excel export')
+    parser.add_argument('--output', type=Path, default=ENRICHED_PATH, help='Enriched leads output')
+    args = parser.parse_args()
+    enrich(args.leads, args.tenders, args.output)
+
+
+if __name__ == '__main__':
+    main()
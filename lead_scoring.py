@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Lead scoring shared by the register ingest and the lead daemon.
+Turns organization records (src/organizations.json) into scored, prioritized leads.
+Weights default to DEFAULT_WEIGHTS and can be overridden in src/scoring-weights.json,
+so a weight change only needs a rescore, not a new ingest.
+
+    python lead_scoring.py "Gemeente Utrecht"
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+WEIGHTS_PATH = ROOT / 'src' / 'scoring-weights.json'
+ORGS_PATH = ROOT / 'src' / 'organizations.json'
+
+# Velocity window, as register_snapshots.DEFAULT_WEEKS (not imported: that module loads pandas)
+DEFAULT_WEEKS = 12
+
+DEFAULT_WEIGHTS = {
+    # Points per algorithm / impactful algorithm / high-risk algorithm, and their caps
+    'algorithm_points': 3,
+    'algorithm_cap': 30,
+    'impactful_points': 6,
+    'impactful_cap': 30,
+    'high_risk_points': 4,
+    'high_risk_cap': 20,
+    # Impactful algorithms without an IAMA = opportunity
+    'missing_iama': 10,
+    # Latest publication in recent_year (or the year before)
+    'recent_year': 2025,
+    'recent_points': 10,
+    'previous_year_points': 5,
+    # Velocity bonus (--velocity-scores)
+    'velocity_points': 2,
+    'velocity_cap': 10,
+    'acceleration_threshold': 1.5,
+    'acceleration_bonus': 5,
+    # Priority thresholds
+    'hot': 70,
+    'warm': 50,
+    'medium': 30,
+}
+
+RIJK_KEYWORDS = ['ministerie', 'rijks', 'belasting', 'uwv', 'svb', 'duo', 'cjib']
+ZBO_KEYWORDS = ['autoriteit', 'college', 'raad', 'bureau']
+
+
+def load_weights(path: Path = WEIGHTS_PATH) -> dict:
+    """DEFAULT_WEIGHTS with the overrides from src/scoring-weights.json (if present)."""
+    if not path.exists():
+        return dict(DEFAULT_WEIGHTS)
+    overrides = json.loads(path.read_text(encoding='utf-8'))
+    unknown = sorted(set(overrides) - set(DEFAULT_WEIGHTS))
+    if unknown:
+        raise ValueError(f"Unknown scoring weights in {path.name}: {', '.join(unknown)}")
+    return {**DEFAULT_WEIGHTS, **overrides}
+
+
+def unique_count(org: dict, field: str) -> int:
+    """Near-duplicate-free count; organizations.json written before clustering only has the raw count."""
+    return org.get(f'unique_{field}', org[field])
+
+
+def score_breakdown(org: dict, weights: dict = DEFAULT_WEIGHTS, dedup: bool = False, velocity: bool = False,
+                    weeks: int = DEFAULT_WEEKS) -> dict[str, int]:
+    """Points per scoring component (before the 100 cap)."""
+    # Near-duplicates of the same algorithm count once when dedup is on
+    algorithm_count = unique_count(org, 'algorithm_count') if dedup else org['algorithm_count']
+    impactful_count = unique_count(org, 'impactful_count') if dedup else org['impactful_count']
+    breakdown = {
+        'algorithms': min(weights['algorithm_cap'], algorithm_count * weights['algorithm_points']),
+        'impactful': min(weights['impactful_cap'], impactful_count * weights['impactful_points']),
+        'high_risk': min(weights['high_risk_cap'], org['high_risk_count'] * weights['high_risk_points']),
+        'missing_iama': weights['missing_iama'] if not org['has_iama'] and impactful_count > 0 else 0,
+        'recency': 0,
+        'velocity': 0,
+    }
+    if org['latest_date']:
+        latest = datetime.strptime(org['latest_date'], '%Y-%m-%d')
+        if latest.year >= weights['recent_year']:
+            breakdown['recency'] = weights['recent_points']
+        elif latest.year >= weights['recent_year'] - 1:
+            breakdown['recency'] = weights['previous_year_points']
+    # Velocity bonus: new (impactful) algorithms in the last window, more if publishing accelerates
+    if velocity:
+        history = org.get('history', {})
+        new_algorithms = history.get(f'new_algorithms_{weeks}w', 0) + history.get(f'new_impactful_{weeks}w', 0)
+        breakdown['velocity'] = min(weights['velocity_cap'], new_algorithms * weights['velocity_points'])
+        if history.get('acceleration', 1.0) > weights['acceleration_threshold']:
+            breakdown['velocity'] += weights['acceleration_bonus']
+    return breakdown
+
+
+def lead_priority(lead_score: int, weights: dict = DEFAULT_WEIGHTS) -> str:
+    if lead_score >= weights['hot']:
+        return 'Hot'
+    if lead_score >= weights['warm']:
+        return 'Warm'
+    if lead_score >= weights['medium']:
+        return 'Medium'
+    return 'Low'
+
+
+def lead_type(org_name: str) -> str:
+    lowered = org_name.lower()
+    if 'gemeente' in lowered:
+        return 'Gemeente'
+    if any(x in lowered for x in RIJK_KEYWORDS):
+        return 'Rijk'
+    if 'provincie' in lowered:
+        return 'Provincie'
+    if any(x in lowered for x in ZBO_KEYWORDS):
+        return 'ZBO'
+    return 'Overig'
+
+
+def build_lead(org_name: str, org: dict, weights: dict = DEFAULT_WEIGHTS, dedup: bool = False,
+               velocity: bool = False, weeks: int = DEFAULT_WEEKS) -> dict:
+    breakdown = score_breakdown(org, weights, dedup=dedup, velocity=velocity, weeks=weeks)
+    lead_score = min(100, sum(breakdown.values()))
+    history = org.get('history', {})
+    return {
+        'name': org_name,
+        'entity_id': org.get('entity_id'),
+        'type': lead_type(org_name),
+        'algorithm_count': org['algorithm_count'],
+        'impactful_count': org['impactful_count'],
+        'unique_algorithm_count': unique_count(org, 'algorithm_count'),
+        'unique_impactful_count': unique_count(org, 'impactful_count'),
+        'high_risk_count': org['high_risk_count'],
+        'has_iama': org['has_iama'],
+        'latest_date': org['latest_date'],
+        'first_date': org['first_date'],
+        'new_algorithms_recent': history.get(f'new_algorithms_{weeks}w', 0),
+        'new_impactful_recent': history.get(f'new_impactful_{weeks}w', 0),
+        'algorithms_added': history.get('algorithms_added', 0),
+        'acceleration': history.get('acceleration', 1.0),
+        'lead_score': lead_score,
+        'score_breakdown': breakdown,
+        'priority': lead_priority(lead_score, weights),
+        'categories': org['categories'],
+        # Contact info from Algoritmeregister
+        'contact_emails': org['contact_emails'],
+        'websites': org['websites'],
+        # Recent 3 algorithms for quick preview
+        'recent_algorithms': [
+            {'name': a['name'], 'date': a['publication_date'], 'category': a['category']}
+            for a in org['algorithms'][:3]
+        ],
+    }
+
+
+def build_leads(organizations: dict, weights: dict = DEFAULT_WEIGHTS, dedup: bool = False, velocity: bool = False,
+                weeks: int = DEFAULT_WEEKS) -> list[dict]:
+    """Scored leads for all organizations, highest score first."""
+    leads = [
+        build_lead(org_name, org, weights, dedup=dedup, velocity=velocity, weeks=weeks)
+        for org_name, org in organizations.items()
+    ]
+    leads.sort(key=lambda x: x['lead_score'], reverse=True)
+    return leads
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Show the score breakdown for organizations.')
+    parser.add_argument('names', nargs='+', help='Organization names')
+    parser.add_argument('--dedup-scores', action='store_true', help='Count near-duplicate algorithms once')
+    parser.add_argument('--velocity-scores', action='store_true', help='Include the velocity bonus')
+    parser.add_argument('--weeks', type=int, default=DEFAULT_WEEKS, help='Velocity window in weeks')
+    args = parser.parse_args()
+
+    weights = load_weights()
+    organizations = json.loads(ORGS_PATH.read_text(encoding='utf-8'))['organizations']
+    for name in args.names:
+        if name not in organizations:
+            print(f"   {name}: not in {ORGS_PATH.name}")
+            continue
+        lead = build_lead(name, organizations[name], weights, dedup=args.dedup_scores,
+                          velocity=args.velocity_scores, weeks=args.weeks)
+        parts = ', '.join(f'{component} {points}' for component, points in lead['score_breakdown'].items())
+        print(f"   {name}: {lead['lead_score']} ({lead['priority']}) - {parts}")
+
+
+if __name__ == '__main__':
+    main()
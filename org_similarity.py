@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Lookalike organizations from Algoritmeregister texts.
+Builds a hashed TF-IDF matrix per organization (algorithm description, goal, category, provider),
+precomputes top-k neighbours with sparse dot products and caches term counts on disk so
+only organizations whose algorithms changed are re-tokenized.
+
+    python org_similarity.py "Gemeente Asten" --top 10
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import zlib
+from pathlib import Path
+
+import numpy as np
+from scipy import sparse
+
+ROOT = Path(__file__).resolve().parent
+ORGS_PATH = ROOT / 'src' / 'organizations.json'
+CACHE_PATH = ROOT / 'exports' / 'similarity-cache.npz'
+NEIGHBOURS_PATH = ROOT / 'src' / 'lookalikes.json'
+
+N_FEATURES = 1 << 18
+TOP_K = 10
+CHUNK_ROWS = 1024
+TOKEN_RE = re.compile(r'[a-zà-ÿ]{3,}')
+STOPWORDS = {
+    'aan', 'als', 'bij', 'dan', 'dat', 'deze', 'die', 'dit', 'door', 'een', 'eens', 'het', 'hoe',
+    'kan', 'kunnen', 'met', 'naar', 'niet', 'nog', 'ook', 'over', 'te', 'ten', 'ter', 'tot', 'uit',
+    'van', 'voor', 'wat', 'welke', 'wordt', 'worden', 'zijn', 'zich', 'zodat', 'and', 'the', 'for',
+}
+
+
+def feature(token: str) -> int:
+    return zlib.crc32(token.encode('utf-8')) % N_FEATURES
+
+
+def org_tokens(org: dict) -> list[str]:
+    tokens: list[str] = []
+    for algo in org.get('algorithms', []):
+        for field in ('description', 'goal'):
+            tokens.extend(t for t in TOKEN_RE.findall((algo.get(field) or '').lower()) if t not in STOPWORDS)
+        # Category and provider count as whole tokens, not words
+        if algo.get('category'):
+            tokens.append('category:' + algo['category'].lower())
+        if algo.get('provider'):
+            tokens.append('provider:' + algo['provider'].strip().lower())
+    return tokens
+
+
+def fingerprint(org: dict) -> str:
+    parts = [
+        '\x1f'.join(algo.get(field) or '' for field in ('description', 'goal', 'category', 'provider'))
+        for algo in org.get('algorithms', [])
+    ]
+    return hashlib.sha1('\x1e'.join(parts).encode('utf-8')).hexdigest()
+
+
+def count_row(org: dict) -> tuple[np.ndarray, np.ndarray]:
+    features = np.fromiter((feature(t) for t in org_tokens(org)), dtype=np.int64)
+    indices, counts = np.unique(features, return_counts=True)
+    return indices.astype(np.int32), counts.astype(np.float32)
+
+
+def load_cache(path: Path = CACHE_PATH) -> dict[str, tuple[str, np.ndarray, np.ndarray]]:
+    if not path.exists():
+        return {}
+    cached = np.load(path, allow_pickle=False)
+    indptr, indices, data = cached['indptr'], cached['indices'], cached['data']
+    rows = {}
+    for i, (name, fp) in enumerate(zip(cached['names'], cached['fingerprints'])):
+        start, stop = indptr[i], indptr[i + 1]
+        rows[str(name)] = (str(fp), indices[start:stop], data[start:stop])
+    return rows
+
+
+def build_counts(organizations: dict, cache_path: Path = CACHE_PATH) -> tuple[list[str], sparse.csr_matrix, int]:
+    """Term-count matrix over all organizations, re-tokenizing only changed ones."""
+    cached = load_cache(cache_path)
+    names = sorted(organizations)
+    fingerprints, indptr, indices, data = [], [0], [], []
+    rebuilt = 0
+    for name in names:
+        fp = fingerprint(organizations[name])
+        hit = cached.get(name)
+        if hit and hit[0] == fp:
+            cols, vals = hit[1], hit[2]
+        else:
+            cols, vals = count_row(organizations[name])
+            rebuilt += 1
+        fingerprints.append(fp)
+        indices.append(cols)
+        data.append(vals)
+        indptr.append(indptr[-1] + len(cols))
+    indices_arr = np.concatenate(indices) if indices else np.zeros(0, dtype=np.int32)
+    data_arr = np.concatenate(data) if data else np.zeros(0, dtype=np.float32)
+    indptr_arr = np.asarray(indptr, dtype=np.int64)
+    cache_path.parent.mkdir(exist_ok=True)
+    np.savez_compressed(cache_path, names=np.asarray(names), fingerprints=np.asarray(fingerprints),
+                        indptr=indptr_arr, indices=indices_arr, data=data_arr)
+    counts = sparse.csr_matrix((data_arr, indices_arr, indptr_arr), shape=(len(names), N_FEATURES))
+    return names, counts, rebuilt
+
+
+def tfidf(counts: sparse.csr_matrix) -> sparse.csr_matrix:
+    """Sublinear TF-IDF with L2-normalized rows."""
+    n_docs = counts.shape[0]
+    df = np.bincount(counts.indices, minlength=counts.shape[1])
+    idf = (np.log((1 + n_docs) / (1 + df)) + 1).astype(np.float32)
+    weights = counts.copy()
+    weights.data = np.log1p(weights.data) * idf[weights.indices]
+    norms = np.sqrt(np.asarray(weights.multiply(weights).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return sparse.diags(1 / norms).dot(weights).tocsr()
+
+
+def top_neighbours(matrix: sparse.csr_matrix, k: int = TOP_K) -> tuple[np.ndarray, np.ndarray]:
+    """Top-k cosine neighbours per row, computed in row chunks to bound memory."""
+    n = matrix.shape[0]
+    k = min(k, max(n - 1, 0))
+    ids = np.zeros((n, k), dtype=np.int32)
+    scores = np.zeros((n, k), dtype=np.float32)
+    if k == 0:
+        return ids, scores
+    transposed = matrix.T.tocsc()
+    for start in range(0, n, CHUNK_ROWS):
+        stop = min(start + CHUNK_ROWS, n)
+        block = (matrix[start:stop] @ transposed).toarray()
+        block[np.arange(stop - start), np.arange(start, stop)] = -np.inf
+        part = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        part_scores = np.take_along_axis(block, part, axis=1)
+        order = np.argsort(-part_scores, axis=1)
+        ids[start:stop] = np.take_along_axis(part, order, axis=1)
+        scores[start:stop] = np.take_along_axis(part_scores, order, axis=1)
+    return ids, scores
+
+
+def build_lookalikes(organizations: dict, k: int = TOP_K, cache_path: Path = CACHE_PATH,
+                     output_path: Path = NEIGHBOURS_PATH) -> dict:
+    names, counts, rebuilt = build_counts(organizations, cache_path)
+    ids, scores = top_neighbours(tfidf(counts), k)
+    lookalikes = {
+        name: [[names[j], round(float(s), 4)] for j, s in zip(ids[i], scores[i]) if s > 0]
+        for i, name in enumerate(names)
+    }
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({'top_k': k, 'lookalikes': lookalikes}, f, ensure_ascii=False, separators=(',', ':'))
+    print(f"🧭 Lookalikes for {len(names)} organizations ({rebuilt} re-tokenized, {len(names) - rebuilt} cached)")
+    return lookalikes
+
+
+def similar_to(customers: list[str], top: int = TOP_K, cache_path: Path = CACHE_PATH) -> list[tuple[str, float]]:
+    """Organizations most similar to the centroid of one or more (won) customers.
+
+    Raises ValueError naming the customers that are not in the cached matrix.
+    """
+    cached = np.load(cache_path, allow_pickle=False)
+    names = [str(n) for n in cached['names']]
+    counts = sparse.csr_matrix((cached['data'], cached['indices'], cached['indptr']),
+                               shape=(len(names), N_FEATURES))
+    matrix = tfidf(counts)
+    positions = {name: i for i, name in enumerate(names)}
+    unknown = [c for c in customers if c not in positions]
+    if unknown:
+        raise ValueError(f"Not in {ORGS_PATH.name}: {', '.join(unknown)}")
+    rows = [positions[c] for c in customers]
+    if not rows:
+        return []
+    centroid = matrix[rows].sum(axis=0).A1
+    scores = matrix @ centroid
+    scores[rows] = -np.inf
+    best = np.argsort(-scores)[:top]
+    return [(names[i], float(scores[i])) for i in best if scores[i] > 0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Find organizations similar to won customers.')
+    parser.add_argument('customers', nargs='*', help='Organization names to find lookalikes for')
+    parser.add_argument('--top', type=int, default=TOP_K, help='Number of lookalikes to return')
+    parser.add_argument('--rebuild', action='store_true', help='Rebuild the matrix from src/organizations.json')
+    args = parser.parse_args()
+
+    if args.rebuild or not CACHE_PATH.exists():
+        with open(ORGS_PATH, 'r') as f:
+            build_lookalikes(json.load(f)['organizations'])
+    try:
+        lookalikes = similar_to(args.customers, args.top)
+    except ValueError as error:
+        print(f"   {error}")
+        return
+    for name, score in lookalikes:
+        print(f"   {score:.3f}  {name}")
+
+
+if __name__ == '__main__':
+    main()
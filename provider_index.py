@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Provider (vendor) cross-index for the Algoritmeregister.
+Builds a provider -> organizations inverted index and a provider co-occurrence graph at ingest
+time and persists both with integer ids in src/provider-index.json, so vendor lookups are
+O(result) instead of a scan over organizations.json.
+
+    python provider_index.py "Centric" --non-iama
+    python provider_index.py "Zivver" --related
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+from collections import Counter, defaultdict
+from datetime import datetime
+from itertools import combinations
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+INDEX_PATH = ROOT / 'src' / 'provider-index.json'
+
+# Free-text answers ("Het algoritme is door medewerkers ... ontwikkeld") are not vendor names
+MAX_PROVIDER_LENGTH = 60
+IN_HOUSE = {'intern ontwikkeld', 'eigen ontwikkeling', 'zelf ontwikkeld', 'intern', 'nvt', 'n v t'}
+URL_RE = re.compile(r'(https?://\S+|www\.\S+)')
+LEGAL_SUFFIX_RE = re.compile(r'\b(b\s?v|n\s?v|gmbh|inc|ltd|llc)\b')
+NON_WORD_RE = re.compile(r'[^0-9a-zà-ÿ]+')
+
+
+def provider_key(raw: str) -> str | None:
+    """Normalized vendor key, or None for empty, in-house or free-text providers."""
+    text = ' '.join((raw or '').split())
+    if not text or len(text) > MAX_PROVIDER_LENGTH:
+        return None
+    key = URL_RE.sub(' ', text.lower())
+    key = NON_WORD_RE.sub(' ', key)
+    key = LEGAL_SUFFIX_RE.sub(' ', key)
+    key = ' '.join(key.split())
+    if not key or key in IN_HOUSE:
+        return None
+    return key
+
+
+def build_provider_index(organizations: dict, output_path: Path = INDEX_PATH) -> dict:
+    """Inverted index and co-occurrence graph over providers, written in compact id form."""
+    spellings: dict[str, Counter] = defaultdict(Counter)
+    usage: dict[str, dict[str, list[int]]] = defaultdict(dict)  # provider -> org -> [algorithms, impactful]
+    for org_name, org in organizations.items():
+        for algo in org.get('algorithms', []):
+            key = provider_key(algo.get('provider'))
+            if key is None:
+                continue
+            spellings[key][' '.join(algo['provider'].split())] += 1
+            counts = usage[key].setdefault(org_name, [0, 0])
+            counts[0] += 1
+            counts[1] += int(bool(algo.get('is_impactful')))
+
+    org_names = sorted({org for orgs in usage.values() for org in orgs})
+    org_ids = {name: i for i, name in enumerate(org_names)}
+    keys = sorted(usage, key=lambda k: (-len(usage[k]), k))
+    provider_ids = {key: i for i, key in enumerate(keys)}
+    no_iama = [not organizations[name].get('has_iama') for name in org_names]
+
+    # Postings: [org_id, algorithms, impactful] rows per provider; non-IAMA orgs precomputed
+    postings = [[[org_ids[org], *counts] for org, counts in sorted(usage[key].items())] for key in keys]
+    non_iama = [[row[0] for row in rows if no_iama[row[0]]] for rows in postings]
+
+    providers_by_org: dict[int, list[int]] = defaultdict(list)
+    for provider_id, rows in enumerate(postings):
+        for org_id, _, _ in rows:
+            providers_by_org[org_id].append(provider_id)
+    # Edge: [provider_a, provider_b, shared orgs, impactful algorithms, algorithms in non-IAMA orgs]
+    edges: dict[tuple[int, int], list[int]] = {}
+    for org_id, provider_list in providers_by_org.items():
+        counts = {p: usage[keys[p]][org_names[org_id]] for p in provider_list}
+        for a, b in combinations(sorted(provider_list), 2):
+            edge = edges.setdefault((a, b), [0, 0, 0])
+            edge[0] += 1
+            edge[1] += counts[a][1] + counts[b][1]
+            if no_iama[org_id]:
+                edge[2] += counts[a][0] + counts[b][0]
+
+    index = {
+        'generated_date': datetime.now().strftime('%Y-%m-%d %H:%M'),
+        'providers': [spellings[key].most_common(1)[0][0] for key in keys],
+        'keys': keys,
+        'organizations': org_names,
+        'has_iama': [int(not flag) for flag in no_iama],
+        'postings': postings,
+        'non_iama': non_iama,
+        'edges': [[a, b, *counts] for (a, b), counts in sorted(edges.items())],
+    }
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+    print(f"🏭 Provider index: {len(keys)} providers, {len(org_names)} organizations, {len(edges)} co-occurrence edges")
+    return index
+
+
+class ProviderIndex:
+    """Lookups over a persisted provider index."""
+
+    def __init__(self, index: dict) -> None:
+        self.index = index
+        self.ids = {key: i for i, key in enumerate(index['keys'])}
+        self.neighbours: dict[int, list[tuple[int, list[int]]]] = defaultdict(list)
+        for a, b, *counts in index['edges']:
+            self.neighbours[a].append((b, counts))
+            self.neighbours[b].append((a, counts))
+
+    @classmethod
+    def load(cls, path: Path = INDEX_PATH) -> ProviderIndex:
+        with open(path, 'r') as f:
+            return cls(json.load(f))
+
+    def provider_id(self, provider: str) -> int | None:
+        key = provider_key(provider)
+        return self.ids.get(key) if key else None
+
+    def organizations(self, provider: str, non_iama: bool = False) -> list[dict]:
+        provider_id = self.provider_id(provider)
+        if provider_id is None:
+            return []
+        names = self.index['organizations']
+        if non_iama:
+            wanted = set(self.index['non_iama'][provider_id])
+            rows = [row for row in self.index['postings'][provider_id] if row[0] in wanted]
+        else:
+            rows = self.index['postings'][provider_id]
+        return [{'name': names[org], 'algorithms': algos, 'impactful': impactful} for org, algos, impactful in rows]
+
+    def related(self, provider: str, top: int = 10) -> list[dict]:
+        provider_id = self.provider_id(provider)
+        if provider_id is None:
+            return []
+        ranked = sorted(self.neighbours[provider_id], key=lambda item: -item[1][0])[:top]
+        return [
+            {'provider': self.index['providers'][other], 'shared_organizations': shared,
+             'impactful': impactful, 'non_iama_algorithms': non_iama}
+            for other, (shared, impactful, non_iama) in ranked
+        ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Query the provider (vendor) cross-index.')
+    parser.add_argument('provider', help='Provider name, e.g. "Centric"')
+    parser.add_argument('--non-iama', action='store_true', help='Only organizations without an IAMA')
+    parser.add_argument('--related', action='store_true', help='Show co-occurring providers instead')
+    args = parser.parse_args()
+
+    index = ProviderIndex.load()
+    if args.related:
+        for row in index.related(args.provider):
+            print(f"   {row['shared_organizations']:>4} orgs  {row['provider']} "
+                  f"(impactful {row['impactful']}, non-IAMA algorithms {row['non_iama_algorithms']})")
+        return
+    orgs = index.organizations(args.provider, non_iama=args.non_iama)
+    for org in orgs:
+        print(f"   {org['name']} - {org['algorithms']} algos, {org['impactful']} impactful")
+    print(f"✅ {len(orgs)} organizations")
+
+
+if __name__ == '__main__':
+    main()
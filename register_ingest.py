@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Algoritmeregister ingest: CSV export -> organizations, scored leads and the derived indexes.
+Adds enhanced fields: latest date, impactful count, algorithms list.
+
+    python algoritmehub.py ingest-register --csv "Gepubliceerde algoritmes 2026-1-2.csv"
+    python algoritmehub.py ingest-register --dedup-scores --velocity-scores --weeks 8
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from algorithm_clusters import cluster_texts
+from algorithm_search import build_search_index, documents_from_organizations
+from contact_candidates import build_contact_index
+from dataset_index import lead_index
+from entity_resolution import EntityTable
+from lead_scoring import build_leads, load_weights
+from org_similarity import build_lookalikes
+from provider_index import build_provider_index
+from register_snapshots import DEFAULT_WEEKS, org_history_metrics, save_snapshot, snapshot_date
+
+ROOT = Path(__file__).resolve().parent
+CSV_PATH = os.environ.get('ALGORITMEREGISTER_CSV',
+                          '/Users/zahedashkara/Desktop/Gepubliceerde algoritmes 2026-1-2.csv')
+LEADS_PATH = ROOT / 'src' / 'data.json'
+ORGS_PATH = ROOT / 'src' / 'organizations.json'
+CLUSTERS_PATH = ROOT / 'src' / 'algorithm-clusters.json'
+
+EMAIL_RE = re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+')
+HIGH_RISK_PATTERN = 'AI|machine learning|deep learning|neural|algoritm'
+
+
+def load_register(csv_path: str | Path) -> pd.DataFrame:
+    """The register export with parsed dates and impactful / high-risk / IAMA flags."""
+    df = pd.read_csv(csv_path, encoding='utf-8')
+    df['publication_dt'] = pd.to_datetime(df['publication_dt'], errors='coerce')
+    df['begin_date'] = pd.to_datetime(df['begin_date'], errors='coerce')
+    df['is_impactful'] = df['publication_category'].str.contains('Impactvolle', case=False, na=False)
+    df['is_high_risk'] = df['name'].str.contains(HIGH_RISK_PATTERN, case=False, na=False) | \
+        df['description_short'].str.contains(HIGH_RISK_PATTERN, case=False, na=False)
+    df['has_iama'] = df['impacttoetsen'].notna() & (df['impacttoetsen'] != '')
+    return df
+
+
+def assign_clusters(df: pd.DataFrame) -> dict:
+    """Near-duplicate clusters (vendor-supplied algorithms published by many organizations)."""
+    cluster_rows, cluster_stats = cluster_texts(
+        (df['name'].fillna('').astype(str) + ' ' + df['description_short'].fillna('').astype(str)).tolist()
+    )
+    # A cluster is identified by the algorithm_id of its first member. Without one, the negated row
+    # position (-1, -2, ...) keeps it apart from the (positive) algorithm ids
+    representative_ids = df['algorithm_id'].iloc[cluster_rows].to_numpy()
+    df['cluster_id'] = [
+        int(rep_id) if pd.notna(rep_id) else -int(row) - 1 for rep_id, row in zip(representative_ids, cluster_rows)
+    ]
+    return cluster_stats
+
+
+def algorithm_record(row: pd.Series) -> dict:
+    return {
+        'name': row['name'],
+        'description': row['description_short'][:200] if pd.notna(row['description_short']) else '',
+        'category': row['category'] if pd.notna(row['category']) else '',
+        'status': row['status'] if pd.notna(row['status']) else '',
+        'goal': row['goal'][:300] if pd.notna(row['goal']) else '',
+        'provider': row['provider'] if pd.notna(row['provider']) else '',
+        'publication_category': row['publication_category'] if pd.notna(row['publication_category']) else '',
+        'publication_date': row['publication_dt'].strftime('%Y-%m-%d') if pd.notna(row['publication_dt']) else None,
+        'begin_date': row['begin_date'].strftime('%Y-%m-%d') if pd.notna(row['begin_date']) else None,
+        'has_lawful_basis': pd.notna(row['lawful_basis']) and len(str(row['lawful_basis'])) > 5,
+        'is_impactful': bool(row['is_impactful']),
+        'algorithm_id': int(row['algorithm_id']) if pd.notna(row['algorithm_id']) else None,
+        'cluster_id': int(row['cluster_id']),
+        'contact_email': str(row['contact_email']).strip() if pd.notna(row['contact_email']) else None,
+        'website': str(row['website']).strip() if pd.notna(row['website']) else None
+    }
+
+
+def group_organizations(df: pd.DataFrame, history_metrics: dict[str, dict]) -> dict[str, dict]:
+    """Organization records (algorithms, counts, dates, contacts) keyed by organization name."""
+    orgs = defaultdict(lambda: {
+        'algorithms': [],
+        'count': 0,
+        'impactful_count': 0,
+        'high_risk_count': 0,
+        'has_iama': False,
+        'latest_date': None,
+        'first_date': None,
+        'categories': defaultdict(int),
+        'statuses': defaultdict(int),
+        'contact_emails': set(),
+        'websites': set(),
+        'clusters': set(),
+        'impactful_clusters': set()
+    })
+
+    for _, row in df.iterrows():
+        org = str(row['organization']).strip()
+        if not org or org == 'nan':
+            continue
+
+        orgs[org]['algorithms'].append(algorithm_record(row))
+        orgs[org]['count'] += 1
+        orgs[org]['clusters'].add(row['cluster_id'])
+
+        if row['is_impactful']:
+            orgs[org]['impactful_count'] += 1
+            orgs[org]['impactful_clusters'].add(row['cluster_id'])
+        if row['is_high_risk']:
+            orgs[org]['high_risk_count'] += 1
+        if row['has_iama']:
+            orgs[org]['has_iama'] = True
+
+        # Track dates
+        if pd.notna(row['publication_dt']):
+            pub_date = row['publication_dt']
+            if orgs[org]['latest_date'] is None or pub_date > orgs[org]['latest_date']:
+                orgs[org]['latest_date'] = pub_date
+            if orgs[org]['first_date'] is None or pub_date < orgs[org]['first_date']:
+                orgs[org]['first_date'] = pub_date
+
+        # Categories and statuses
+        if pd.notna(row['category']):
+            orgs[org]['categories'][row['category']] += 1
+        if pd.notna(row['status']):
+            orgs[org]['statuses'][row['status']] += 1
+
+        # Collect contact info (first email in a potentially messy field)
+        if pd.notna(row['contact_email']) and '@' in str(row['contact_email']):
+            email_match = EMAIL_RE.search(str(row['contact_email']).strip())
+            if email_match:
+                orgs[org]['contact_emails'].add(email_match.group().lower())
+        if pd.notna(row['website']) and row['website'].startswith('http'):
+            orgs[org]['websites'].add(str(row['website']).strip())
+
+    organizations = {}
+    for org_name, data in orgs.items():
+        # Sort algorithms by date (most recent first)
+        data['algorithms'].sort(key=lambda x: x['publication_date'] or '1970-01-01', reverse=True)
+
+        organizations[org_name] = {
+            'name': org_name,
+            'algorithm_count': data['count'],
+            'impactful_count': data['impactful_count'],
+            'unique_algorithm_count': len(data['clusters']),
+            'unique_impactful_count': len(data['impactful_clusters']),
+            'high_risk_count': data['high_risk_count'],
+            'has_iama': data['has_iama'],
+            'latest_date': data['latest_date'].strftime('%Y-%m-%d') if data['latest_date'] else None,
+            'first_date': data['first_date'].strftime('%Y-%m-%d') if data['first_date'] else None,
+            'categories': dict(data['categories']),
+            'statuses': dict(data['statuses']),
+            'algorithms': data['algorithms'],
+            'contact_emails': list(data['contact_emails']),
+            'websites': list(data['websites']),
+            'history': history_metrics.get(org_name, {})
+        }
+    return organizations
+
+
+def shared_clusters(organizations: dict[str, dict]) -> list[dict]:
+    """Clusters shared by several organizations (vendor-driven algorithms), largest first."""
+    cluster_members = defaultdict(lambda: {'organizations': set(), 'providers': set(), 'size': 0, 'name': None})
+    for org_name, org_data in organizations.items():
+        for algo in org_data['algorithms']:
+            cluster = cluster_members[algo['cluster_id']]
+            cluster['organizations'].add(org_name)
+            cluster['size'] += 1
+            if algo['provider']:
+                cluster['providers'].add(algo['provider'])
+            if algo['algorithm_id'] == algo['cluster_id'] or cluster['name'] is None:
+                cluster['name'] = algo['name']
+    return sorted(
+        (
+            {'cluster_id': cluster_id, 'name': c['name'], 'size': c['size'],
+             'organizations': sorted(c['organizations']), 'providers': sorted(c['providers'])}
+            for cluster_id, c in cluster_members.items() if len(c['organizations']) > 1
+        ),
+        key=lambda c: len(c['organizations']),
+        reverse=True
+    )
+
+
+def ingest_register(csv_path: str | Path = CSV_PATH, dedup: bool = False, velocity: bool = False,
+                    weeks: int = DEFAULT_WEEKS) -> dict:
+    """Full ingest: writes leads, organizations, clusters and the derived indexes; returns the leads output."""
+    print("📂 Loading Algoritmeregister CSV...")
+    df = load_register(csv_path)
+    print(f"✅ Loaded {len(df)} algorithms")
+
+    # Columnar snapshot of this export, then deltas/velocity against earlier snapshots
+    snapshot_path = save_snapshot(df, snapshot_date(csv_path))
+    history_metrics = org_history_metrics(weeks)
+    print(f"🗂️  Snapshot saved to {snapshot_path.name} ({len(history_metrics)} organizations with history)")
+
+    cluster_stats = assign_clusters(df)
+    print(f"🧬 {cluster_stats['clusters']} distinct algorithms after near-duplicate clustering "
+          f"({cluster_stats['candidate_pairs']} LSH candidate pairs, {cluster_stats['seconds']}s)")
+
+    organizations = group_organizations(df, history_metrics)
+    print(f"📊 Found {len(organizations)} unique organizations")
+
+    # Canonical organization ids (register names define the entities; only new names are resolved)
+    entity_table = EntityTable.load()
+    entity_ids = entity_table.resolve(organizations, source='register', create=True)
+    entity_table.save()
+    for org_name, org_data in organizations.items():
+        org_data['entity_id'] = entity_ids.get(org_name)
+
+    # Create scored leads from organizations (weights: src/scoring-weights.json)
+    leads = build_leads(organizations, load_weights(), dedup=dedup, velocity=velocity, weeks=weeks)
+
+    output = {
+        'generated_date': datetime.now().strftime('%Y-%m-%d %H:%M'),
+        'source_file': os.path.basename(csv_path),
+        'total_algorithms': len(df),
+        'total_leads': len(leads),
+        'leads': leads,
+        # Sort orders and facet postings for the dashboard
+        'index': lead_index(leads),
+    }
+    with open(LEADS_PATH, 'w', encoding='utf-8') as f:
+        json.dump(output, f, indent=2, ensure_ascii=False)
+
+    # Full organization details (for detail pages)
+    org_output = {
+        'generated_date': datetime.now().strftime('%Y-%m-%d %H:%M'),
+        'organizations': organizations
+    }
+    with open(ORGS_PATH, 'w', encoding='utf-8') as f:
+        json.dump(org_output, f, indent=2, ensure_ascii=False)
+
+    clusters = shared_clusters(organizations)
+    with open(CLUSTERS_PATH, 'w', encoding='utf-8') as f:
+        json.dump({'generated_date': datetime.now().strftime('%Y-%m-%d %H:%M'), 'clusters': clusters},
+                  f, indent=2, ensure_ascii=False)
+
+    # Contact candidates per organization (emails with roles, domains, crawl base URLs)
+    build_contact_index(organizations)
+
+    # Provider (vendor) -> organizations index and co-occurrence graph
+    build_provider_index(organizations)
+
+    # BM25 full-text index over algorithm name/description/goal (incremental)
+    build_search_index(documents_from_organizations(organizations))
+
+    # Lookalike organizations (incremental: only changed organizations are re-tokenized)
+    build_lookalikes(organizations)
+
+    print(f"\n📈 Update Summary:")
+    print(f"   • Total algorithms: {len(df)}")
+    print(f"   • Total organizations (leads): {len(leads)}")
+    print(f"   • Hot leads (score ≥70): {sum(1 for l in leads if l['lead_score'] >= 70)}")
+    print(f"   • Warm leads (score ≥50): {sum(1 for l in leads if 50 <= l['lead_score'] < 70)}")
+    print(f"   • Impactful algorithms: {sum(organizations[o]['impactful_count'] for o in organizations)}")
+
+    print(f"\n💾 Saved to:")
+    print(f"   • src/data.json (leads)")
+    print(f"   • src/organizations.json (full details)")
+    print(f"   • src/lookalikes.json (similar organizations)")
+    print(f"   • src/provider-index.json (vendor cross-index)")
+    print(f"   • src/contact-candidates.json (contact candidates per organization)")
+    print(f"   • src/organization-entities.json (canonical organizations and aliases)")
+    print(f"   • exports/search-index.npz (full-text search index)")
+    print(f"   • exports/snapshots/{snapshot_path.name} (register snapshot)")
+    print(f"   • src/algorithm-clusters.json ({len(clusters)} clusters shared across organizations)")
+
+    print(f"\n🏆 Top 10 Leads:")
+    for i, lead in enumerate(leads[:10]):
+        print(f"   {i+1}. {lead['name']} - Score: {lead['lead_score']} ({lead['priority']}) - {lead['algorithm_count']} algos, {lead['impactful_count']} impactful")
+
+    print("\n✅ Done!")
+    return output
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Update lead data from the Algoritmeregister CSV.')
+    parser.add_argument('--csv', default=CSV_PATH,
+                        help='Algoritmeregister CSV export (default: $ALGORITMEREGISTER_CSV)')
+    parser.add_argument('--dedup-scores', action='store_true',
+                        help='Score leads on distinct algorithms (near-duplicates counted once)')
+    parser.add_argument('--velocity-scores', action='store_true',
+                        help='Add a bonus for organizations that recently published new algorithms')
+    parser.add_argument('--weeks', type=int, default=DEFAULT_WEEKS, help='Velocity window in weeks')
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    ingest_register(args.csv, dedup=args.dedup_scores, velocity=args.velocity_scores, weeks=args.weeks)
+
+
+if __name__ == '__main__':
+    main()
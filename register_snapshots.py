@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Snapshot history of Algoritmeregister exports.
+Every export is stored as a compressed Parquet snapshot keyed by its export date; per-organization
+deltas and rolling-window publication velocity are computed with vectorized joins across snapshots.
+
+    python register_snapshots.py --weeks 12 --top 20
+    python register_snapshots.py --benchmark 100
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import tempfile
+import time
+import zlib
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent
+SNAPSHOT_DIR = ROOT / 'exports' / 'snapshots'
+DEFAULT_WEEKS = 12
+HISTORY_COLUMNS = ['key', 'organization', 'is_impactful']
+DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+
+
+def snapshot_date(source: str | Path) -> str:
+    """Export date from a file name like 'Gepubliceerde algoritmes 2026-1-2.csv' (today if absent)."""
+    match = DATE_RE.search(Path(source).name)
+    if not match:
+        return date.today().isoformat()
+    return date(*(int(part) for part in match.groups())).isoformat()
+
+
+def snapshot_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Columns kept per algorithm: a stable key, organization, impact flag and publication date."""
+    organization = df['organization'].astype(str).str.strip()
+    # Algorithms without an id are keyed on a hash of organization + name
+    fallback = [
+        -zlib.crc32(f'{org}\x1f{name}'.encode('utf-8')) - 1
+        for org, name in zip(organization, df['name'].astype(str))
+    ]
+    key = pd.to_numeric(df['algorithm_id'], errors='coerce')
+    frame = pd.DataFrame({
+        'key': np.where(key.notna(), key.fillna(0).astype('int64'), fallback).astype('int64'),
+        'organization': organization.astype('category'),
+        'is_impactful': df['is_impactful'].astype(bool),
+        'publication_date': pd.to_datetime(df['publication_dt'], errors='coerce'),
+    })
+    return frame[(frame['organization'] != '') & (frame['organization'] != 'nan')]
+
+
+def save_snapshot(df: pd.DataFrame, export_date: str, directory: Path = SNAPSHOT_DIR) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f'register-{export_date}.parquet'
+    snapshot_frame(df).to_parquet(path, compression='zstd', index=False)
+    return path
+
+
+def snapshot_paths(directory: Path = SNAPSHOT_DIR) -> list[tuple[pd.Timestamp, Path]]:
+    paths = []
+    for path in directory.glob('register-*.parquet'):
+        match = DATE_RE.search(path.name)
+        if match:
+            paths.append((pd.Timestamp(date(*(int(part) for part in match.groups()))), path))
+    return sorted(paths)
+
+
+def load_history(directory: Path = SNAPSHOT_DIR, columns: list[str] = HISTORY_COLUMNS) -> pd.DataFrame:
+    """All snapshots stacked, reading only the needed columns, with a 'snapshot' date column."""
+    frames = [
+        pd.read_parquet(path, columns=columns).assign(snapshot=snapshot)
+        for snapshot, path in snapshot_paths(directory)
+    ]
+    if not frames:
+        return pd.DataFrame(columns=[*columns, 'snapshot'])
+    history = pd.concat(frames, ignore_index=True)
+    history['organization'] = history['organization'].astype('category')
+    return history
+
+
+def per_org(frame: pd.DataFrame) -> pd.Series:
+    """Row count per organization, indexed by plain strings so counts from different frames align."""
+    counts = frame.groupby('organization', observed=True).size()
+    counts.index = counts.index.astype(str)
+    return counts
+
+
+def org_deltas(history: pd.DataFrame) -> pd.DataFrame:
+    """Algorithms added, removed and impactful added per organization between the last two snapshots."""
+    snapshots = np.sort(history['snapshot'].unique())
+    columns = ['algorithms_added', 'algorithms_removed', 'impactful_added']
+    if len(snapshots) < 2:
+        return pd.DataFrame(columns=columns)
+    latest = history[history['snapshot'] == snapshots[-1]]
+    previous = history[history['snapshot'] == snapshots[-2]]
+    joined = latest.merge(previous[['key']], on='key', how='left', indicator=True)
+    added = joined[joined['_merge'] == 'left_only']
+    removed = previous[~previous['key'].isin(latest['key'])]
+    deltas = pd.DataFrame({
+        'algorithms_added': per_org(added),
+        'algorithms_removed': per_org(removed),
+        'impactful_added': per_org(added[added['is_impactful']]),
+    })
+    return deltas.fillna(0).astype(int)
+
+
+def velocity(history: pd.DataFrame, weeks: int = DEFAULT_WEEKS) -> pd.DataFrame:
+    """New (first-seen) algorithms per organization in the last N weeks and the N weeks before.
+
+    The oldest snapshot is the baseline: algorithms already in it are not counted as new.
+    """
+    columns = [f'new_algorithms_{weeks}w', f'new_impactful_{weeks}w', f'new_algorithms_prev_{weeks}w', 'acceleration']
+    if history.empty:
+        return pd.DataFrame(columns=columns)
+    first = history.groupby('key', sort=False).agg(
+        first_seen=('snapshot', 'min'),
+        organization=('organization', 'last'),
+        is_impactful=('is_impactful', 'last'),
+    )
+    first = first[first['first_seen'] > history['snapshot'].min()]
+    as_of = history['snapshot'].max()
+    window = pd.Timedelta(weeks=weeks)
+    recent = first['first_seen'] > as_of - window
+    previous = (first['first_seen'] > as_of - 2 * window) & ~recent
+    metrics = pd.DataFrame({
+        columns[0]: per_org(first[recent]),
+        columns[1]: per_org(first[recent & first['is_impactful']]),
+        columns[2]: per_org(first[previous]),
+    }).fillna(0).astype(int)
+    # Acceleration: publication rate in the last window relative to the window before (+1 smoothing)
+    metrics['acceleration'] = ((metrics[columns[0]] + 1) / (metrics[columns[2]] + 1)).round(2)
+    return metrics
+
+
+def org_history_metrics(weeks: int = DEFAULT_WEEKS, directory: Path = SNAPSHOT_DIR) -> dict[str, dict]:
+    """Deltas and velocity per organization, as plain dicts for the lead scoring step."""
+    history = load_history(directory)
+    metrics = org_deltas(history).join(velocity(history, weeks), how='outer')
+    metrics = metrics.fillna({'acceleration': 1.0}).fillna(0)
+    int_columns = [c for c in metrics.columns if c != 'acceleration']
+    metrics[int_columns] = metrics[int_columns].astype(int)
+    return {str(org): row for org, row in metrics.to_dict(orient='index').items()}
+
+
+def benchmark(count: int, size: int = 100_000, weekly_new: int = 500) -> None:
+    """Write `count` weekly synthetic snapshots and time reading them plus computing the metrics."""
+    rng = np.random.default_rng(0)
+    orgs = [f'Gemeente {i}' for i in range(400)]
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        total = size
+        start = date(2024, 1, 1)
+        for week in range(count):
+            frame = pd.DataFrame({
+                'key': np.arange(total, dtype='int64'),
+                'organization': pd.Categorical(np.asarray(orgs)[rng.integers(0, len(orgs), total)]),
+                'is_impactful': rng.random(total) < 0.4,
+                'publication_date': pd.Timestamp(start),
+            })
+            frame.to_parquet(directory / f'register-{start + timedelta(weeks=week)}.parquet',
+                             compression='zstd', index=False)
+            total += weekly_new
+        size_mb = sum(p.stat().st_size for p in directory.iterdir()) / 1024 / 1024
+        started = time.perf_counter()
+        history = load_history(directory)
+        loaded = time.perf_counter()
+        metrics = org_history_metrics(directory=directory)
+        done = time.perf_counter()
+    print(f"📊 {count} snapshots ({len(history):,} rows, {size_mb:.1f} MB on disk)")
+    print(f"   • read: {loaded - started:.2f}s, read + deltas + velocity: {done - loaded:.2f}s "
+          f"for {len(metrics)} organizations")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Register snapshot history: deltas and publication velocity.')
+    parser.add_argument('--weeks', type=int, default=DEFAULT_WEEKS, help='Velocity window in weeks')
+    parser.add_argument('--top', type=int, default=20, help='Number of accelerating organizations to show')
+    parser.add_argument('--benchmark', type=int, metavar='N', help='Time N synthetic weekly snapshots')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return
+    metrics = org_history_metrics(args.weeks)
+    ranked = sorted(metrics.items(), key=lambda item: (-item[1][f'new_algorithms_{args.weeks}w'],
+                                                       -item[1]['acceleration']))
+    print(f"🚀 Fastest publishing organizations (last {args.weeks} weeks):")
+    for org, row in ranked[:args.top]:
+        print(f"   {org}: +{row[f'new_algorithms_{args.weeks}w']} algos "
+              f"(+{row[f'new_impactful_{args.weeks}w']} impactful), x{row['acceleration']}")
+
+
+if __name__ == '__main__':
+    main()
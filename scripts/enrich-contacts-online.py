@@ -2,35 +2,76 @@
 """
 Online contact enrichment from official organization websites.
 Adds contact persons to exports/contact-research.json using public pages.
+Pages are discovered from robots.txt and (gzipped) sitemaps where a site has them;
+keyword paths are only guessed for sites without a usable sitemap.
+Sites are crawled most valuable lead first, stop once FG, CISO and CIO are named,
+and a run can be bounded with --budget-seconds / --budget-requests.
+Each checkpoint also refreshes the dashboard summary (exports/contact-summary.json).
 """
 
 from __future__ import annotations
 
 import argparse
+import gzip
+import heapq
+import io
 import json
 import re
+import socket
 import time
 import ssl
+import sys
+import xml.etree.ElementTree as ET
+import zlib
+from collections import Counter
+from dataclasses import dataclass, field
 from datetime import datetime
 from html import unescape
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable, TypeVar
+from urllib.error import HTTPError, URLError
 from urllib.parse import quote_plus, urljoin, urlparse
 from urllib.request import Request, urlopen
+from urllib.robotparser import RobotFileParser
 
 ROOT = Path(__file__).resolve().parent.parent
 LEADS_PATH = ROOT / "src" / "data.json"
-ORGS_PATH = ROOT / "src" / "organizations.json"
 CONTACTS_PATH = ROOT / "exports" / "contact-research.json"
 
+sys.path.insert(0, str(ROOT))
+from contact_candidates import ROLE_KEYWORDS, TARGET_ROLES, load_contact_index, target_role  # noqa: E402
+from contact_summary import SUMMARY_PATH, assign_entity_ids, research_keys, save_contact_summary  # noqa: E402
+
 USER_AGENT = "Mozilla/5.0 (compatible; AlgoritmehubContactBot/1.0)"
 FETCH_TIMEOUT = 6
 MAX_HTML_BYTES = 2_000_000
+MAX_ROBOTS_BYTES = 500_000
 DEFAULT_MAX_PAGES = 4
 DEFAULT_DELAY = 0.2
 DEFAULT_LIMIT = 0
 DEFAULT_CHECKPOINT = 10
 
+# Host health, per scheme and host (a refused https port says nothing about http):
+# hosts that fail DNS or refuse connections are dead right away,
+# hosts that time out are dead after a couple of consecutive failures.
+FATAL_ERRORS = {"dns", "refused"}
+DEAD_AFTER_FAILURES = 2
+MAX_HOST_DELAY = 10.0
+LATENCY_DELAY_FACTOR = 0.5
+LATENCY_SMOOTHING = 0.3
+RATE_LIMIT_BACKOFF = 2.0
+
+# Sitemap discovery: a few requests per host replace blind path guesses.
+# Sitemap indexes are followed for at most MAX_SITEMAP_FETCHES documents per host,
+# and at most MAX_SITEMAP_URLS <loc> entries are scanned.
+MAX_SITEMAP_FETCHES = 4
+MAX_SITEMAP_URLS = 50_000
+MAX_SITEMAP_MATCHES = 500
+# Child sitemaps of an index with these tokens (news, blogs, products) rarely hold contact pages
+SITEMAP_SKIP_TOKENS = ("post", "news", "nieuws", "blog", "product", "tag", "categor", "author", "event", "agenda")
+
+T = TypeVar("T")
+
 EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+", re.I)
 HREF_RE = re.compile(r'href=["\']([^"\']+)["\']', re.I)
 MAILTO_RE = re.compile(
@@ -81,27 +122,6 @@ ROLE_RULES = [
     ("Algemeen contact", re.compile(r"(info|contact|gemeente|secretariaat|postbus)", re.I)),
 ]
 
-ROLE_KEYWORDS = {
-    "Functionaris Gegevensbescherming (FG)": [
-        "functionaris gegevensbescherming",
-        "gegevensbescherming",
-        "privacy officer",
-        "privacyfunctionaris",
-        "fg",
-        "dpo",
-    ],
-    "CISO": [
-        "ciso",
-        "informatiebeveiliging",
-        "security officer",
-    ],
-    "CIO": [
-        "cio",
-        "chief information officer",
-        "informatiemanager",
-    ],
-}
-
 GENERIC_LINK_TEXT = {
     "e-mail",
     "email",
@@ -261,21 +281,188 @@ def extract_named_contacts(html: str, org_name: str, url: str, add_linkedin: boo
     return contacts
 
 
-def fetch_html(url: str) -> str | None:
+@dataclass
+class HostStats:
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    skipped: int = 0
+    total_latency: float = 0.0
+    avg_latency: float | None = None
+    delay: float = DEFAULT_DELAY
+    backoff: float = 1.0
+    next_allowed: float = 0.0
+    dead: bool = False
+    dead_reason: str | None = None
+    statuses: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+
+
+class HostHealth:
+    """Tracks latency, errors and status codes per host to pace and short-circuit requests."""
+
+    def __init__(self, base_delay: float = DEFAULT_DELAY) -> None:
+        self.base_delay = base_delay
+        self.hosts: dict[str, HostStats] = {}
+
+    def stats_for(self, url: str) -> HostStats:
+        host = host_key(url)
+        stats = self.hosts.get(host)
+        if stats is None:
+            stats = HostStats(delay=self.base_delay)
+            self.hosts[host] = stats
+        return stats
+
+    def is_dead(self, url: str) -> bool:
+        stats = self.hosts.get(host_key(url))
+        return bool(stats and stats.dead)
+
+    def dead_reason(self, url: str) -> str | None:
+        stats = self.hosts.get(host_key(url))
+        return stats.dead_reason if stats and stats.dead else None
+
+    def wait(self, url: str) -> None:
+        stats = self.stats_for(url)
+        remaining = stats.next_allowed - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def record(self, url: str, latency: float, status: int | None = None, error: str | None = None,
+               retry_after: float | None = None) -> None:
+        stats = self.stats_for(url)
+        stats.requests += 1
+        stats.total_latency += latency
+        if status is not None:
+            stats.statuses[status] += 1
+        if error is not None:
+            stats.errors[error] += 1
+
+        if status == 429:
+            stats.backoff = min(stats.backoff * RATE_LIMIT_BACKOFF, MAX_HOST_DELAY)
+        elif error is None and status is not None and status < 500:
+            stats.consecutive_failures = 0
+            stats.backoff = max(1.0, stats.backoff / RATE_LIMIT_BACKOFF)
+            if stats.avg_latency is None:
+                stats.avg_latency = latency
+            else:
+                stats.avg_latency += LATENCY_SMOOTHING * (latency - stats.avg_latency)
+        else:
+            stats.failures += 1
+            stats.consecutive_failures += 1
+            if error in FATAL_ERRORS:
+                self.mark_dead(stats, error)
+            elif stats.consecutive_failures >= DEAD_AFTER_FAILURES:
+                self.mark_dead(stats, error or f"http {status}")
+
+        adaptive = (stats.avg_latency or 0.0) * LATENCY_DELAY_FACTOR
+        stats.delay = min(MAX_HOST_DELAY, max(self.base_delay, adaptive) * stats.backoff)
+        if retry_after is not None:
+            stats.delay = max(stats.delay, min(retry_after, MAX_HOST_DELAY))
+        stats.next_allowed = time.monotonic() + stats.delay
+
+    def skip(self, url: str) -> None:
+        self.stats_for(url).skipped += 1
+
+    @staticmethod
+    def mark_dead(stats: HostStats, reason: str) -> None:
+        if not stats.dead:
+            stats.dead = True
+            stats.dead_reason = reason
+
+    def report(self, top: int = 10) -> None:
+        if not self.hosts:
+            return
+        dead = [h for h, s in self.hosts.items() if s.dead]
+        requests = sum(s.requests for s in self.hosts.values())
+        skipped = sum(s.skipped for s in self.hosts.values())
+        spent = sum(s.total_latency for s in self.hosts.values())
+        print(f"🌐 {len(self.hosts)} hosts, {requests} requests, {spent:.1f}s waiting on responses")
+        print(f"💀 {len(dead)} dead hosts, {skipped} requests short-circuited")
+        slowest = sorted(self.hosts.items(), key=lambda item: item[1].total_latency, reverse=True)[:top]
+        for host, stats in slowest:
+            avg = stats.total_latency / stats.requests if stats.requests else 0.0
+            state = f"dead ({stats.dead_reason})" if stats.dead else f"delay {stats.delay:.2f}s"
+            codes = ", ".join(f"{code}×{count}" for code, count in stats.statuses.most_common(3))
+            errors = ", ".join(f"{err}×{count}" for err, count in stats.errors.most_common(3))
+            details = "; ".join(part for part in (codes, errors) if part)
+            print(f"   • {host}: {stats.requests} req, {stats.total_latency:.1f}s (avg {avg:.2f}s), {state}"
+                  + (f" [{details}]" if details else ""))
+
+
+def host_key(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}".lower()
+
+
+def classify_error(exc: BaseException) -> str:
+    reason = exc.reason if isinstance(exc, URLError) else exc
+    if isinstance(reason, socket.gaierror):
+        return "dns"
+    if isinstance(reason, (ssl.SSLError, ssl.CertificateError)):
+        return "ssl"
+    if isinstance(reason, (socket.timeout, TimeoutError)):
+        return "timeout"
+    if isinstance(reason, ConnectionRefusedError):
+        return "refused"
+    if isinstance(reason, OSError):
+        return "connection"
+    return "other"
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def fetch(url: str, health: HostHealth | None, read: Callable[[object], T | None]) -> T | None:
+    """Request url with host pacing and health tracking; read() consumes the open response.
+
+    read() must handle malformed content itself, so only network errors count against the host.
+    """
+    if health is not None:
+        if health.is_dead(url):
+            health.skip(url)
+            return None
+        health.wait(url)
     req = Request(url, headers={"User-Agent": USER_AGENT})
+    started = time.monotonic()
+    status = None
+    error = None
+    retry_after = None
     try:
         context = ssl.create_default_context()
         with urlopen(req, timeout=FETCH_TIMEOUT, context=context) as resp:
-            content_type = resp.headers.get("Content-Type", "")
-            if content_type and "text/html" not in content_type:
-                return None
-            raw = resp.read(MAX_HTML_BYTES)
-            charset = "utf-8"
-            if "charset=" in content_type:
-                charset = content_type.split("charset=")[-1].split(";")[0].strip()
-            return raw.decode(charset, errors="ignore")
-    except Exception:
+            status = resp.status
+            return read(resp)
+    except HTTPError as exc:
+        status = exc.code
+        retry_after = parse_retry_after(exc.headers.get("Retry-After") if exc.headers else None)
+        return None
+    except Exception as exc:
+        error = classify_error(exc)
+        return None
+    finally:
+        if health is not None:
+            health.record(url, time.monotonic() - started, status, error, retry_after)
+
+
+def read_html(resp) -> str | None:
+    content_type = resp.headers.get("Content-Type", "")
+    if content_type and "text/html" not in content_type:
         return None
+    raw = resp.read(MAX_HTML_BYTES)
+    charset = "utf-8"
+    if "charset=" in content_type:
+        charset = content_type.split("charset=")[-1].split(";")[0].strip()
+    return raw.decode(charset, errors="ignore")
+
+
+def fetch_html(url: str, health: HostHealth | None = None) -> str | None:
+    return fetch(url, health, read_html)
 
 
 def canonical_base(url: str) -> str | None:
@@ -289,24 +476,24 @@ def canonical_base(url: str) -> str | None:
     return f"{parsed.scheme}://{parsed.netloc}"
 
 
-def collect_base_urls(lead: dict, org: dict | None) -> list[str]:
-    candidates = []
-    for source in (lead, org or {}):
-        for site in source.get("websites", []) or []:
-            base = canonical_base(site)
-            if base:
-                candidates.append(base)
-    if not candidates:
-        emails = normalize_emails(extract_emails(lead.get("contact_emails", [])))
-        if org:
-            emails += normalize_emails(extract_emails(org.get("contact_emails", [])))
-        emails = normalize_emails(emails)
-        for email in emails:
-            domain = email.split("@")[-1]
-            base = canonical_base(domain)
-            if base:
-                candidates.append(base)
-    return list(dict.fromkeys(candidates))
+def collect_base_urls(lead: dict, candidates: dict | None) -> list[str]:
+    """Crawl roots: register websites, else a validated generated guess, else email domains."""
+    candidates = candidates or {}
+    websites = [canonical_base(site) for site in lead.get("websites", []) or []]
+    bases = [base for base in websites if base] + candidates.get("website_bases", [])
+    # Generated guesses from enrich-contacts.py are only used once validated as reachable.
+    guess = lead.get("contact") or {}
+    if not bases and guess.get("website") and guess.get("reachable"):
+        base = canonical_base(guess["website"])
+        if base:
+            bases.append(base)
+    if not bases:
+        bases = candidates.get("email_bases") or [
+            base for base in (canonical_base(email.split("@")[-1])
+                              for email in normalize_emails(extract_emails(lead.get("contact_emails", []))))
+            if base
+        ]
+    return list(dict.fromkeys(bases))
 
 
 def extract_links(html: str, base_url: str) -> list[str]:
@@ -399,79 +586,388 @@ def linkedin_search_url(name: str, org_name: str) -> str:
     return f"https://www.linkedin.com/search/results/all/?keywords={quote_plus(query)}"
 
 
-def enrich_org(name: str, lead: dict, org: dict | None, entry: dict, max_pages: int, delay: float, add_linkedin: bool) -> int:
-    added = 0
-    base_urls = collect_base_urls(lead, org)
-    for base_url in base_urls:
-        homepage = fetch_html(base_url)
-        if homepage is None and base_url.startswith("https://"):
-            homepage = fetch_html(base_url.replace("https://", "http://", 1))
-        if homepage is None:
-            continue
+def site_key(base_url: str) -> str:
+    host = urlparse(base_url).netloc.lower()
+    return host[4:] if host.startswith("www.") else host
 
-        mailto_names = extract_mailto_names(homepage)
-        candidate_urls = [urljoin(base_url, path) for path in KEYWORD_PATHS]
-        candidate_urls += extract_links(homepage, base_url)
-        candidate_urls = list(dict.fromkeys(candidate_urls))[:max_pages]
 
-        for url in candidate_urls:
-            html = fetch_html(url)
-            if html is None:
+def url_path(url: str) -> str:
+    return urlparse(url).path.rstrip("/").lower() or "/"
+
+
+def path_yield(contacts_map: dict) -> Counter:
+    """Count named FG/CISO/CIO contacts per page path found in earlier runs."""
+    counts: Counter = Counter()
+    for entry in contacts_map.values():
+        for contact in entry.get("contacts") or []:
+            if not contact.get("name") or target_role(contact.get("role")) is None:
                 continue
-            html_lower = html.lower()
-            mailto_names.update(extract_mailto_names(html))
-            emails = normalize_emails(EMAIL_RE.findall(html))
-            for email in prioritize_emails(emails):
-                role = role_from_url(url) or role_from_context(html_lower, email) or role_for_email(email)
-                name_guess = mailto_names.get(email)
-                linkedin = None
-                if add_linkedin and name_guess:
-                    linkedin = linkedin_search_url(name_guess, name)
-                contact = {
-                    "role": role,
-                    "name": name_guess,
-                    "email": email,
-                    "linkedin": linkedin,
-                    "notes": f"Found on {url}",
-                }
-                before = len(entry.get("contacts") or [])
-                merge_contact(entry, contact)
-                after = len(entry.get("contacts") or [])
-                if after > before:
-                    added += 1
-            named_contacts = extract_named_contacts(html, name, url, add_linkedin)
-            for contact in named_contacts:
-                before = len(entry.get("contacts") or [])
-                merge_contact(entry, contact)
-                after = len(entry.get("contacts") or [])
-                if after > before:
-                    added += 1
-            time.sleep(delay)
+            note = contact.get("notes") or ""
+            if note.startswith("Found on "):
+                counts[url_path(note[len("Found on "):].strip())] += 1
+    return counts
+
+
+def rank_candidate_urls(urls: list[str], yields: Counter) -> list[str]:
+    unique = list(dict.fromkeys(urls))
+    return sorted(unique, key=lambda url: -yields.get(url_path(url), 0))
+
+
+def lead_value(lead: dict) -> tuple[int, int]:
+    return (lead.get("lead_score") or 0, lead.get("algorithm_count") or 0)
+
+
+@dataclass
+class CrawlPlan:
+    sites: dict[str, str] = field(default_factory=dict)
+    members: dict[str, list[str]] = field(default_factory=dict)
+    pending: dict[str, int] = field(default_factory=dict)
+    values: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+    def schedule(self) -> list[tuple[tuple[int, int], int, str]]:
+        """Priority queue of sites, most valuable organization first (heapq pops the smallest)."""
+        heap = [((-value[0], -value[1]), order, key) for order, (key, value) in enumerate(self.values.items())]
+        heapq.heapify(heap)
+        return heap
+
+
+def plan_crawl(targets: list[tuple[str, dict, dict | None]]) -> CrawlPlan:
+    """Group target organizations by site so every site is crawled once per run."""
+    plan = CrawlPlan()
+    for name, lead, candidates in targets:
+        plan.pending[name] = 0
+        for base_url in collect_base_urls(lead, candidates):
+            key = site_key(base_url)
+            plan.sites.setdefault(key, base_url)
+            # A shared site is worth as much as its most valuable organization
+            plan.values[key] = max(plan.values.get(key, (0, 0)), lead_value(lead))
+            members = plan.members.setdefault(key, [])
+            if name not in members:
+                members.append(name)
+                plan.pending[name] += 1
+    return plan
+
+
+def known_roles(entry: dict) -> set[str]:
+    return {target_role(c.get("role")) for c in entry.get("contacts") or [] if c.get("name")} & TARGET_ROLES
+
+
+def page_roles(url: str, html: str) -> set[str]:
+    """Target roles with a named person on a page, as apply_site would record them."""
+    roles = {contact["role"] for contact in extract_named_contacts(html, "", url, False)}
+    html_lower = html.lower()
+    for email in extract_mailto_names(html):
+        roles.add(role_from_url(url) or role_from_context(html_lower, email) or role_for_email(email))
+    return roles & TARGET_ROLES
+
+
+@dataclass
+class CrawlBudget:
+    """Global wall-clock and request budget for a run (0 = unlimited)."""
+    seconds: float = 0.0
+    requests: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    def exhausted(self, health: HostHealth) -> bool:
+        if self.seconds and time.monotonic() - self.started >= self.seconds:
+            return True
+        return bool(self.requests) and sum(s.requests for s in health.hosts.values()) >= self.requests
+
+
+def keyword_rank(url: str) -> int | None:
+    """Index of the first KEYWORD_LINKS keyword in the URL path (short ones must be a whole path token)."""
+    path = urlparse(url).path.lower()
+    tokens = set(re.split(r"[/._-]+", path))
+    for index, keyword in enumerate(KEYWORD_LINKS):
+        if keyword in tokens or (len(keyword) > 3 and keyword in path):
+            return index
+    return None
+
+
+def sitemap_priority(url: str) -> tuple[int, int]:
+    lower = url.lower()
+    return (int(any(token in lower for token in SITEMAP_SKIP_TOKENS)), len(lower))
+
+
+@dataclass
+class SitemapDocument:
+    valid: bool = False
+    index: bool = False
+    scanned: int = 0
+    pages: list[str] = field(default_factory=list)
+    sitemaps: list[str] = field(default_factory=list)
+
+
+def read_robots(resp) -> RobotFileParser:
+    lines: list[str] = []
+    size = 0
+    for raw in resp:
+        size += len(raw)
+        if size > MAX_ROBOTS_BYTES:
+            break
+        lines.append(raw.decode("utf-8", errors="ignore"))
+    robots = RobotFileParser()
+    robots.parse(lines)
+    return robots
+
+
+def read_sitemap(resp) -> SitemapDocument:
+    """Stream-parse a (gzipped) sitemap or sitemap index, keeping only keyword-matching page URLs."""
+    document = SitemapDocument()
+    stream = io.BufferedReader(resp)
+    if stream.peek(2)[:2] == b"\x1f\x8b":
+        stream = gzip.GzipFile(fileobj=stream)
+    root = None
+    try:
+        for event, element in ET.iterparse(stream, events=("start", "end")):
+            tag = element.tag.rsplit("}", 1)[-1]
+            if root is None:
+                # Soft 404s serve an HTML page with status 200
+                root = element
+                document.valid = tag in ("urlset", "sitemapindex")
+                document.index = tag == "sitemapindex"
+                if not document.valid:
+                    break
+            if event == "start":
+                continue
+            if tag == "loc" and element.text:
+                loc = element.text.strip()
+                if document.index:
+                    document.sitemaps.append(loc)
+                    continue
+                document.scanned += 1
+                if len(document.pages) < MAX_SITEMAP_MATCHES and keyword_rank(loc) is not None:
+                    document.pages.append(loc)
+                if document.scanned >= MAX_SITEMAP_URLS:
+                    break
+            elif tag in ("url", "sitemap"):
+                # Drop finished entries so memory stays flat on large sitemaps
+                root.clear()
+    except (ET.ParseError, EOFError, gzip.BadGzipFile, zlib.error):
+        # Keep whatever was parsed before the document broke off
+        pass
+    return document
+
+
+@dataclass
+class SiteDiscovery:
+    robots: RobotFileParser | None = None
+    requests: int = 0
+    sitemaps: int = 0
+    scanned: int = 0
+    pages: list[str] = field(default_factory=list)
+
+
+def discover_site(base_url: str, health: HostHealth, budget: CrawlBudget | None = None) -> SiteDiscovery:
+    """Fetch robots.txt and the sitemaps it lists (or /sitemap.xml) and collect keyword pages that exist."""
+    discovery = SiteDiscovery()
+    if budget is not None and budget.exhausted(health):
+        return discovery
+    discovery.robots = fetch(urljoin(base_url, "/robots.txt"), health, read_robots)
+    discovery.requests += 1
+    listed = discovery.robots.site_maps() if discovery.robots else None
+    queue = list(dict.fromkeys(listed or [urljoin(base_url, "/sitemap.xml")]))
+    seen: set[str] = set()
+    site = site_key(base_url)
+    while queue and discovery.requests <= MAX_SITEMAP_FETCHES and not health.is_dead(base_url):
+        if budget is not None and budget.exhausted(health):
+            break
+        url = queue.pop(0)
+        if url in seen:
+            continue
+        seen.add(url)
+        document = fetch(url, health, read_sitemap)
+        discovery.requests += 1
+        if document is None or not document.valid:
+            continue
+        discovery.sitemaps += 1
+        discovery.scanned += document.scanned
+        discovery.pages += [page for page in document.pages if site_key(page) == site]
+        queue += sorted(document.sitemaps, key=sitemap_priority)
+    discovery.pages = sorted(
+        dict.fromkeys(discovery.pages),
+        key=lambda url: (keyword_rank(url), url_path(url).count("/"), len(url)),
+    )
+    return discovery
+
+
+@dataclass
+class CrawlMetrics:
+    """Requests per site with sitemap discovery versus blind path guessing.
+
+    avoided counts pages the blind plan would have fetched that neither the sitemap nor the
+    homepage links know about (mostly 404s); saved is avoided minus the discovery requests.
+    """
+    discovery_requests: int = 0
+    page_requests: int = 0
+    pages_found: int = 0
+    avoided: int = 0
+    disallowed: int = 0
+    sitemap_used: bool = False
+    stopped_early: int = 0
+
+    @property
+    def saved(self) -> int:
+        return self.avoided - self.discovery_requests
+
+
+@dataclass
+class CrawledSite:
+    base_url: str
+    mailto_names: dict[str, str]
+    pages: list[tuple[str, str]]
+    metrics: CrawlMetrics = field(default_factory=CrawlMetrics)
+    complete: bool = True
+
+
+def crawl_site(base_url: str, max_pages: int, health: HostHealth, yields: Counter, discover: bool = True,
+               wanted: set[str] | None = None, budget: CrawlBudget | None = None) -> CrawledSite | None:
+    """Crawl the homepage and up to max_pages candidate pages.
+
+    With wanted roles the crawl stops as soon as the pages found so far name all of them; a site
+    cut off by the budget is returned with complete=False.
+    """
+    def out_of_budget() -> bool:
+        return budget is not None and budget.exhausted(health)
+
+    if out_of_budget():
+        return CrawledSite(base_url, {}, [], complete=False)
+    homepage = fetch_html(base_url, health)
+    # Retry over http unless the name does not resolve at all; a refused https port is common on http-only sites
+    if homepage is None and base_url.startswith("https://") and health.dead_reason(base_url) != "dns":
+        if out_of_budget():
+            return CrawledSite(base_url, {}, [], complete=False)
+        base_url = base_url.replace("https://", "http://", 1)
+        homepage = fetch_html(base_url, health)
+    if homepage is None:
+        return None
+
+    links = extract_links(homepage, base_url)
+    guesses = [urljoin(base_url, path) for path in KEYWORD_PATHS]
+    blind_plan = rank_candidate_urls(guesses + links, yields)[:max_pages]
+    metrics = CrawlMetrics()
+
+    discovery = discover_site(base_url, health, budget) if discover else SiteDiscovery()
+    metrics.discovery_requests = discovery.requests
+    if out_of_budget():
+        return CrawledSite(base_url, extract_mailto_names(homepage), [], metrics, complete=False)
+    if discovery.pages:
+        # Only pages the site lists or links to; guesses are kept for sites without a usable sitemap
+        metrics.sitemap_used = True
+        candidate_urls = rank_candidate_urls(discovery.pages + links, yields)
+        known = {url_path(url) for url in discovery.pages + links}
+        metrics.avoided = sum(1 for url in blind_plan if url_path(url) not in known)
+    else:
+        candidate_urls = rank_candidate_urls(guesses + links, yields)
+    if discovery.robots is not None:
+        allowed = [url for url in candidate_urls if discovery.robots.can_fetch(USER_AGENT, url)]
+        metrics.disallowed = len(candidate_urls) - len(allowed)
+        candidate_urls = allowed
+    candidate_urls = candidate_urls[:max_pages]
+
+    pages: list[tuple[str, str]] = []
+    found: set[str] = set()
+    complete = True
+    for index, url in enumerate(candidate_urls):
+        if wanted is not None and wanted <= found:
+            metrics.stopped_early = len(candidate_urls) - index
+            break
+        if out_of_budget():
+            complete = False
+            break
+        if health.is_dead(url):
+            break
+        html = fetch_html(url, health)
+        metrics.page_requests += 1
+        if html is not None:
+            pages.append((url, html))
+            if wanted is not None:
+                found |= page_roles(url, html)
+    metrics.pages_found = len(pages)
+    return CrawledSite(base_url, extract_mailto_names(homepage), pages, metrics, complete)
+
+
+def report_discovery(sites: list[CrawlMetrics]) -> None:
+    if not sites:
+        return
+    with_sitemap = [m for m in sites if m.sitemap_used]
+    discovery = sum(m.discovery_requests for m in sites)
+    avoided = sum(m.avoided for m in sites)
+    fetched = sum(m.page_requests for m in sites)
+    found = sum(m.pages_found for m in sites)
+    print(f"🧭 Sitemaps used for {len(with_sitemap)}/{len(sites)} sites: {discovery} discovery requests, "
+          f"{avoided} guessed pages avoided, net {avoided - discovery:+d} requests")
+    print(f"   {found}/{fetched} page requests returned a page, "
+          f"{sum(m.disallowed for m in sites)} candidates disallowed by robots.txt")
+    stopped = [m for m in sites if m.stopped_early]
+    if stopped:
+        print(f"🎯 Role targets met early on {len(stopped)} sites, "
+              f"{sum(m.stopped_early for m in stopped)} page requests skipped")
+
+
+def apply_site(site: CrawledSite, name: str, entry: dict, add_linkedin: bool) -> int:
+    added = 0
+    mailto_names = dict(site.mailto_names)
+    for url, html in site.pages:
+        html_lower = html.lower()
+        mailto_names.update(extract_mailto_names(html))
+        emails = normalize_emails(EMAIL_RE.findall(html))
+        for email in prioritize_emails(emails):
+            role = role_from_url(url) or role_from_context(html_lower, email) or role_for_email(email)
+            name_guess = mailto_names.get(email)
+            linkedin = None
+            if add_linkedin and name_guess:
+                linkedin = linkedin_search_url(name_guess, name)
+            contact = {
+                "role": role,
+                "name": name_guess,
+                "email": email,
+                "linkedin": linkedin,
+                "notes": f"Found on {url}",
+            }
+            before = len(entry.get("contacts") or [])
+            merge_contact(entry, contact)
+            after = len(entry.get("contacts") or [])
+            if after > before:
+                added += 1
+        named_contacts = extract_named_contacts(html, name, url, add_linkedin)
+        for contact in named_contacts:
+            before = len(entry.get("contacts") or [])
+            merge_contact(entry, contact)
+            after = len(entry.get("contacts") or [])
+            if after > before:
+                added += 1
+    return added
+
+
+def finish_entry(entry: dict) -> None:
     if entry.get("primary_email") is None and entry.get("contacts"):
         emails = [c.get("email") for c in entry["contacts"] if c.get("email")]
         if emails:
             entry["primary_email"] = prioritize_emails(emails)[0]
-    return added
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Online contact enrichment from org websites.")
-    parser.add_argument("--max-pages", type=int, default=DEFAULT_MAX_PAGES, help="Max pages per org base url")
-    parser.add_argument("--delay", type=float, default=DEFAULT_DELAY, help="Delay between requests (seconds)")
-    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help="Limit number of orgs to process (0 = all)")
+    parser.add_argument("--max-pages", type=int, default=DEFAULT_MAX_PAGES, help="Max pages per site, highest-yield paths first")
+    parser.add_argument("--delay", type=float, default=DEFAULT_DELAY, help="Minimum delay between requests to the same host (seconds)")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help="Limit number of orgs to process, highest lead score first (0 = all)")
     parser.add_argument("--start", type=int, default=0, help="Skip the first N leads (for resume)")
     parser.add_argument("--checkpoint", type=int, default=DEFAULT_CHECKPOINT, help="Write progress every N orgs")
     parser.add_argument("--all", action="store_true", help="Process all orgs, not just missing/auto contacts")
     parser.add_argument("--force", action="store_true", help="Re-check orgs even if already checked online")
     parser.add_argument("--no-linkedin", action="store_true", help="Do not add LinkedIn search links")
+    parser.add_argument("--no-sitemaps", action="store_true", help="Guess keyword paths instead of reading robots.txt/sitemaps")
+    parser.add_argument("--no-early-stop", action="store_true", help="Crawl all candidate pages even once FG/CISO/CIO are named")
+    parser.add_argument("--budget-seconds", type=float, default=0, help="Stop the run after this many seconds (0 = unlimited)")
+    parser.add_argument("--budget-requests", type=int, default=0, help="Stop the run after this many requests (0 = unlimited)")
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
     leads_data = json.loads(LEADS_PATH.read_text(encoding="utf-8"))
-    orgs_data = json.loads(ORGS_PATH.read_text(encoding="utf-8"))
-    orgs = orgs_data.get("organizations", {})
+    candidates_by_name = load_contact_index()
 
     if CONTACTS_PATH.exists():
         contacts_payload = json.loads(CONTACTS_PATH.read_text(encoding="utf-8"))
@@ -480,59 +976,112 @@ def main() -> None:
 
     contacts_map = contacts_payload.get("contacts", {})
     total_added = 0
-    processed = 0
     skipped = 0
     leads = leads_data.get("leads", [])
-    total_targets = len(leads)
     run_timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+    health = HostHealth(args.delay)
 
     def save_checkpoint() -> None:
         contacts_payload["generated_date"] = run_timestamp
         contacts_payload["source"] = "Manual research + Algoritmeregister + online org sites"
         contacts_payload["contacts"] = contacts_map
+        assign_entity_ids(contacts_payload)
         CONTACTS_PATH.write_text(
             json.dumps(contacts_payload, indent=2, ensure_ascii=False) + "\n",
             encoding="utf-8"
         )
+        save_contact_summary(contacts_payload)
 
+    assign_entity_ids(contacts_payload)
+    researched = research_keys(contacts_map)
+    targets: list[tuple[str, dict, dict | None]] = []
     for index, lead in enumerate(leads, start=1):
         if args.start and index <= args.start:
             continue
         name = lead.get("name")
         if not name:
             continue
-        entry = contacts_map.get(name)
+        # Research is stored under the name it was first researched under; leads join it on entity_id
+        key = researched.get(lead.get("entity_id"), name)
+        entry = contacts_map.get(key)
         if entry and entry.get("last_checked_online") and not args.force:
             skipped += 1
             continue
         if not args.all and not needs_research(entry):
             skipped += 1
             continue
-        if entry is None:
-            entry = {"primary_email": None, "contacts": []}
-            contacts_map[name] = entry
-        processed += 1
-        if args.limit and processed > args.limit:
-            break
-        print(f"[{processed}/{args.limit or total_targets}] {name}")
-        total_added += enrich_org(
-            name,
-            lead,
-            orgs.get(name),
-            entry,
-            args.max_pages,
-            args.delay,
-            not args.no_linkedin
-        )
+        targets.append((key, lead, candidates_by_name.get(name)))
+    if args.limit:
+        targets = heapq.nlargest(args.limit, targets, key=lambda target: lead_value(target[1]))
+    for key, lead, _ in targets:
+        entry = contacts_map.setdefault(key, {"primary_email": None, "contacts": []})
+        if lead.get("entity_id"):
+            entry.setdefault("entity_id", lead["entity_id"])
+
+    plan = plan_crawl(targets)
+    yields = path_yield(contacts_map)
+    base_count = sum(plan.pending.values())
+    print(f"🗺️  {len(targets)} organizations → {len(plan.sites)} unique sites "
+          f"({base_count - len(plan.sites)} duplicate site crawls avoided)")
+
+    def mark_checked(name: str) -> None:
+        entry = contacts_map[name]
+        finish_entry(entry)
         entry["last_checked_online"] = run_timestamp
+
+    for name, pending in plan.pending.items():
+        if pending == 0:
+            mark_checked(name)
+
+    site_metrics: list[CrawlMetrics] = []
+    budget = CrawlBudget(args.budget_seconds, args.budget_requests)
+    # Sites are crawled most valuable lead first, so a budgeted run covers the leads that matter
+    queue = plan.schedule()
+    processed = 0
+    while queue and not budget.exhausted(health):
+        _, _, key = heapq.heappop(queue)
+        processed += 1
+        members = plan.members[key]
+        print(f"[{processed}/{len(plan.sites)}] {key} ({', '.join(members)})")
+        wanted = None
+        if not args.no_early_stop:
+            wanted = set().union(*(TARGET_ROLES - known_roles(contacts_map[name]) for name in members))
+        if wanted is not None and not wanted:
+            print("   🎯 FG, CISO and CIO already named, skipped")
+            site = None
+        else:
+            site = crawl_site(plan.sites[key], args.max_pages, health, yields, discover=not args.no_sitemaps,
+                              wanted=wanted, budget=budget)
+        if site is not None:
+            metrics = site.metrics
+            site_metrics.append(metrics)
+            source = "sitemap" if metrics.sitemap_used else "guessed paths"
+            print(f"   {metrics.pages_found}/{metrics.page_requests} pages from {source}, "
+                  f"{metrics.discovery_requests} discovery requests, {metrics.saved:+d} requests saved")
+        for name in members:
+            if site is not None:
+                total_added += apply_site(site, name, contacts_map[name], not args.no_linkedin)
+            # A site cut off by the budget is crawled again on the next run
+            if site is not None and not site.complete:
+                continue
+            plan.pending[name] -= 1
+            if plan.pending[name] == 0:
+                mark_checked(name)
         if args.checkpoint and processed % args.checkpoint == 0:
             save_checkpoint()
 
+    if budget.exhausted(health):
+        unchecked = sum(1 for pending in plan.pending.values() if pending > 0)
+        print(f"⏱️  Budget exhausted after {time.monotonic() - budget.started:.0f}s: "
+              f"{len(queue)} sites and {unchecked} organizations left for the next run")
+
     save_checkpoint()
 
     print(f"✅ Added {total_added} contact entries")
     print(f"⏭️  Skipped {skipped} organizations (already checked or not needed)")
-    print(f"💾 Saved to {CONTACTS_PATH}")
+    print(f"💾 Saved to {CONTACTS_PATH} (summary: {SUMMARY_PATH})")
+    report_discovery(site_metrics)
+    health.report()
 
 
 if __name__ == "__main__":
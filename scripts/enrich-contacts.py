@@ -3,21 +3,33 @@
 Enrich leads with contact information.
 - Generates standard contact emails for municipalities
 - Fetches organization pages for contact details
+- Validates generated domains (DNS + HEAD) so the crawler skips dead guesses
 """
 
+from __future__ import annotations
+
+import argparse
 import json
 import re
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Callable
+from urllib.error import HTTPError
+from urllib.parse import urlparse
+from urllib.request import Request, urlopen
 
 # Load current data
 data_path = Path(__file__).parent.parent / 'src' / 'data.json'
 org_path = Path(__file__).parent.parent / 'src' / 'organizations.json'
+cache_path = Path(__file__).parent.parent / 'exports' / 'domain-checks.json'
 
-with open(data_path, 'r') as f:
-    lead_data = json.load(f)
-
-with open(org_path, 'r') as f:
-    org_data = json.load(f)
+USER_AGENT = 'Mozilla/5.0 (compatible; AlgoritmehubContactBot/1.0)'
+CHECK_TIMEOUT = 4
+DEFAULT_WORKERS = 16
+DEFAULT_CACHE_TTL_DAYS = 7
 
 def generate_gemeente_email(name: str) -> dict:
     """Generate standard email patterns for municipalities."""
@@ -122,39 +134,165 @@ def enrich_lead(lead: dict) -> dict:
     
     return lead
 
-# Enrich all leads
-print("🔄 Enriching leads with contact information...")
-enriched_count = 0
-for lead in lead_data['leads']:
-    enrich_lead(lead)
-    if lead.get('contact', {}).get('email'):
-        enriched_count += 1
-
-print(f"✅ {enriched_count}/{len(lead_data['leads'])} leads with contact info")
-
-# Save updated data
-with open(data_path, 'w', encoding='utf-8') as f:
-    json.dump(lead_data, f, indent=2, ensure_ascii=False)
-
-print(f"✅ Saved to {data_path}")
-
-# Also update organizations.json
-for org_name, org in org_data['organizations'].items():
-    # Find matching lead
-    matching_lead = next((l for l in lead_data['leads'] if l['name'] == org_name), None)
-    if matching_lead and matching_lead.get('contact'):
-        org['contact'] = matching_lead['contact']
-
-with open(org_path, 'w', encoding='utf-8') as f:
-    json.dump(org_data, f, indent=2, ensure_ascii=False)
-
-print(f"✅ Saved to {org_path}")
-
-# Show some examples
-print("\n📋 Voorbeeld contactgegevens:")
-print("-" * 60)
-for lead in lead_data['leads'][:10]:
-    contact = lead.get('contact', {})
-    email = contact.get('email', 'N/A')
-    source = contact.get('source', 'unknown')
-    print(f"  {lead['name'][:35]:<35} | {email:<30} [{source}]")
+def resolve_host(host: str) -> bool:
+    """Return True if the host resolves to at least one address."""
+    try:
+        return bool(socket.getaddrinfo(host, None))
+    except (socket.gaierror, UnicodeError):
+        return False
+
+
+def head_status(url: str, timeout: float = CHECK_TIMEOUT) -> int | None:
+    """HEAD the url and return the HTTP status, or None if nothing answered."""
+    req = Request(url, method='HEAD', headers={'User-Agent': USER_AGENT})
+    try:
+        with urlopen(req, timeout=timeout) as resp:
+            return resp.status
+    except HTTPError as exc:
+        return exc.code
+    except Exception:
+        return None
+
+
+def check_domain(target: str, resolver: Callable[[str], bool] = resolve_host,
+                 head: Callable[[str], int | None] = head_status) -> dict:
+    """Check a website url (DNS + HEAD) or a bare email domain (DNS only)."""
+    is_url = '://' in target
+    host = urlparse(target).hostname if is_url else target
+    result = {'dns': bool(host) and resolver(host), 'status': None, 'checked_at': time.time()}
+    if result['dns'] and is_url:
+        result['status'] = head(target)
+        # Any HTTP answer below 500 means the site exists (405 = HEAD not allowed).
+        result['reachable'] = result['status'] is not None and result['status'] < 500
+    else:
+        result['reachable'] = result['dns']
+    return result
+
+
+def load_check_cache(path: Path) -> dict:
+    if path.exists():
+        with open(path, 'r') as f:
+            return json.load(f)
+    return {}
+
+
+def save_check_cache(path: Path, cache: dict) -> None:
+    path.parent.mkdir(exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2, ensure_ascii=False)
+
+
+def validate_targets(targets: list[str], cache: dict, ttl_seconds: float, workers: int = DEFAULT_WORKERS,
+                     check: Callable[[str], dict] = check_domain) -> dict:
+    """Check every target not fresh in the cache with a bounded worker pool."""
+    now = time.time()
+    stale = [
+        t for t in dict.fromkeys(targets)
+        if t not in cache or now - cache[t].get('checked_at', 0) > ttl_seconds
+    ]
+    if stale:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for target, result in zip(stale, pool.map(check, stale)):
+                cache[target] = result
+    return {t: cache[t] for t in targets}
+
+
+def check_targets(contact: dict) -> list[str]:
+    targets = []
+    if contact.get('website'):
+        targets.append(contact['website'])
+    for email in contact.get('email_alternatives') or [contact.get('email')]:
+        if email and '@' in email:
+            targets.append(email.split('@', 1)[1].lower())
+    return targets
+
+
+def annotate_reachability(contact: dict, results: dict) -> None:
+    """Record reachability on the contact; unreachable guesses are dropped by crawl planning."""
+    website = contact.get('website')
+    if website:
+        website_check = results[website]
+        contact['reachable'] = website_check['reachable']
+        contact['http_status'] = website_check['status']
+    emails = [e for e in contact.get('email_alternatives') or [contact.get('email')] if e and '@' in e]
+    if emails:
+        live = [e for e in emails if results[e.split('@', 1)[1].lower()]['dns']]
+        contact['email_domain_resolves'] = bool(live)
+        if live and contact.get('email') not in live:
+            contact['email'] = live[0]
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Enrich leads with contact information.')
+    parser.add_argument('--no-validate', action='store_true', help='Skip DNS/HEAD validation of contact domains')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='Concurrent domain checks')
+    parser.add_argument('--cache-ttl-days', type=float, default=DEFAULT_CACHE_TTL_DAYS,
+                        help='Re-check cached domains older than this')
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None, resolver: Callable[[str], bool] = resolve_host,
+         head: Callable[[str], int | None] = head_status) -> None:
+    """Enrich data.json and organizations.json; resolver and head can be stubbed (see tests/)."""
+    args = parse_args(argv)
+
+    with open(data_path, 'r') as f:
+        lead_data = json.load(f)
+
+    with open(org_path, 'r') as f:
+        org_data = json.load(f)
+
+    # Enrich all leads
+    print("🔄 Enriching leads with contact information...")
+    enriched_count = 0
+    for lead in lead_data['leads']:
+        enrich_lead(lead)
+        if lead.get('contact', {}).get('email'):
+            enriched_count += 1
+
+    print(f"✅ {enriched_count}/{len(lead_data['leads'])} leads with contact info")
+
+    if not args.no_validate:
+        contacts = [lead['contact'] for lead in lead_data['leads'] if lead.get('contact')]
+        targets = [t for contact in contacts for t in check_targets(contact)]
+        print(f"🔎 Validating {len(set(targets))} domains ({args.workers} workers)...")
+        cache = load_check_cache(cache_path)
+        started = time.monotonic()
+        results = validate_targets(targets, cache, args.cache_ttl_days * 86400, args.workers,
+                                   check=partial(check_domain, resolver=resolver, head=head))
+        save_check_cache(cache_path, cache)
+        for contact in contacts:
+            annotate_reachability(contact, results)
+        dead = sum(1 for contact in contacts if contact.get('reachable') is False)
+        print(f"✅ Validated in {time.monotonic() - started:.1f}s: {dead} unreachable websites")
+
+    # Save updated data
+    with open(data_path, 'w', encoding='utf-8') as f:
+        json.dump(lead_data, f, indent=2, ensure_ascii=False)
+
+    print(f"✅ Saved to {data_path}")
+
+    # Also update organizations.json
+    for org_name, org in org_data['organizations'].items():
+        # Find matching lead
+        matching_lead = next((l for l in lead_data['leads'] if l['name'] == org_name), None)
+        if matching_lead and matching_lead.get('contact'):
+            org['contact'] = matching_lead['contact']
+
+    with open(org_path, 'w', encoding='utf-8') as f:
+        json.dump(org_data, f, indent=2, ensure_ascii=False)
+
+    print(f"✅ Saved to {org_path}")
+
+    # Show some examples
+    print("\n📋 Voorbeeld contactgegevens:")
+    print("-" * 60)
+    for lead in lead_data['leads'][:10]:
+        contact = lead.get('contact', {})
+        email = contact.get('email', 'N/A')
+        source = contact.get('source', 'unknown')
+        print(f"  {lead['name'][:35]:<35} | {email:<30} [{source}]")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,103 +1,64 @@
 #!/usr/bin/env python3
 """
 Expand exports/contact-research.json with fallback contact persons for all leads.
-Uses Algoritmeregister contact emails from src/data.json and src/organizations.json.
+Uses the Algoritmeregister contact candidates indexed at ingest (src/contact-candidates.json).
 Preserves existing manual research and only fills missing organizations.
+Also writes the compact dashboard summary (exports/contact-summary.json).
 """
 
 from __future__ import annotations
 
+import argparse
 import json
-import re
+import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable
 
 ROOT = Path(__file__).resolve().parent.parent
 LEADS_PATH = ROOT / "src" / "data.json"
 ORGS_PATH = ROOT / "src" / "organizations.json"
 CONTACTS_PATH = ROOT / "exports" / "contact-research.json"
 
-EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
-EMAIL_FULL_RE = re.compile(r"^[\w.+-]+@[\w-]+\.[\w.-]+$")
-
-ROLE_RULES = [
-    ("Functionaris Gegevensbescherming (FG)", re.compile(r"(^|[._-])(fg|functionaris|gegevensbescherming|privacy|dpo)([._-]|$)")),
-    ("CISO", re.compile(r"(^|[._-])ciso([._-]|$)")),
-    ("CIO", re.compile(r"(^|[._-])cio([._-]|$)")),
-    ("Algoritmeregister contact", re.compile(r"algoritme")),
-    ("Data/Informatiemanagement", re.compile(r"(data|informatie|informatiemanagement)")),
-    ("Algemeen contact", re.compile(r"(info|contact|gemeente|secretariaat|postbus)")),
-]
-
-
-def extract_emails(value: object) -> list[str]:
-    if value is None:
-        return []
-    if isinstance(value, list):
-        emails: list[str] = []
-        for item in value:
-            emails.extend(extract_emails(item))
-        return emails
-    if not isinstance(value, str):
-        return []
-    return EMAIL_RE.findall(value)
-
-
-def normalize_emails(emails: Iterable[str]) -> list[str]:
-    seen = set()
-    result: list[str] = []
-    for email in emails:
-        cleaned = email.strip().lower()
-        if not cleaned or not EMAIL_FULL_RE.match(cleaned):
-            continue
-        if cleaned in seen:
-            continue
-        seen.add(cleaned)
-        result.append(cleaned)
-    return result
-
-
-def role_for_email(email: str) -> tuple[str, int]:
-    local = email.split("@", 1)[0].lower()
-    for index, (role, pattern) in enumerate(ROLE_RULES):
-        if pattern.search(local):
-            return role, index
-    return "Algemeen contact", len(ROLE_RULES)
-
+sys.path.insert(0, str(ROOT))
+from contact_candidates import load_contact_index, org_candidates  # noqa: E402
+from contact_summary import SUMMARY_PATH, assign_entity_ids, research_keys, save_contact_summary  # noqa: E402
 
-def prioritize_emails(emails: list[str]) -> list[str]:
-    return sorted(emails, key=lambda e: (role_for_email(e)[1], e))
 
-
-def build_contacts(emails: list[str], max_contacts: int = 3) -> list[dict]:
-    contacts = []
-    for email in prioritize_emails(emails)[:max_contacts]:
-        role, _ = role_for_email(email)
-        contacts.append({
-            "role": role,
+def build_contacts(candidates: list[dict], max_contacts: int = 3) -> list[dict]:
+    return [
+        {
+            "role": candidate["role"],
             "name": None,
-            "email": email,
+            "email": candidate["email"],
             "linkedin": None,
             "notes": "Afgeleid uit Algoritmeregister",
-        })
-    return contacts
+        }
+        for candidate in candidates[:max_contacts]
+    ]
+
 
+def load_candidates() -> dict[str, dict]:
+    """Contact candidates per organization from the ingest index; rebuilt from organizations.json if absent."""
+    index = load_contact_index()
+    if index:
+        return index
+    orgs = json.loads(ORGS_PATH.read_text(encoding="utf-8")).get("organizations", {})
+    return {name: org_candidates(org) for name, org in orgs.items()}
 
-def collect_emails(lead: dict, org: dict | None) -> list[str]:
-    emails: list[str] = []
-    emails.extend(extract_emails(lead.get("contact_emails", [])))
-    if org:
-        emails.extend(extract_emails(org.get("contact_emails", [])))
-        for algo in org.get("algorithms", []):
-            emails.extend(extract_emails(algo.get("contact_email")))
-    return normalize_emails(emails)
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Fill exports/contact-research.json with register-derived contacts for leads without research."
+    )
+    return parser.parse_args()
 
 
 def main() -> None:
+    parse_args()
     leads_data = json.loads(LEADS_PATH.read_text(encoding="utf-8"))
-    orgs_data = json.loads(ORGS_PATH.read_text(encoding="utf-8"))
-    orgs = orgs_data.get("organizations", {})
+    candidates_by_name = load_candidates()
+    # Join on the canonical organization id when the ingest provided one, by name otherwise
+    candidates_by_id = {c["entity_id"]: c for c in candidates_by_name.values() if c.get("entity_id")}
 
     if CONTACTS_PATH.exists():
         contacts_payload = json.loads(CONTACTS_PATH.read_text(encoding="utf-8"))
@@ -105,26 +66,34 @@ def main() -> None:
         contacts_payload = {"generated_date": "", "source": "", "contacts": {}}
 
     contacts_map = contacts_payload.get("contacts", {})
+    assign_entity_ids(contacts_payload)
+    researched = research_keys(contacts_map)
 
     added = 0
     for lead in leads_data.get("leads", []):
         name = lead.get("name")
         if not name:
             continue
-        if name in contacts_map:
+        # Research may be stored under another spelling of the organization
+        if lead.get("entity_id") in researched or name in contacts_map:
             continue
 
-        org = orgs.get(name)
-        emails = collect_emails(lead, org)
+        candidates = (
+            candidates_by_id.get(lead.get("entity_id"))
+            or candidates_by_name.get(name)
+            or org_candidates({"contact_emails": lead.get("contact_emails", [])})
+        )
+        emails = candidates["emails"]
         entry: dict = {
             "primary_email": None,
             "contacts": [],
         }
+        if lead.get("entity_id"):
+            entry["entity_id"] = lead["entity_id"]
 
         if emails:
-            prioritized = prioritize_emails(emails)
-            entry["primary_email"] = prioritized[0]
-            entry["contacts"] = build_contacts(prioritized)
+            entry["primary_email"] = emails[0]["email"]
+            entry["contacts"] = build_contacts(emails)
         else:
             entry["notes"] = "Geen email gevonden in Algoritmeregister"
 
@@ -134,14 +103,16 @@ def main() -> None:
     contacts_payload["generated_date"] = datetime.now().strftime("%Y-%m-%d %H:%M")
     contacts_payload["source"] = "Manual research (Top 20) + Algoritmeregister derived contacts"
     contacts_payload["contacts"] = contacts_map
+    assign_entity_ids(contacts_payload)
 
     CONTACTS_PATH.write_text(
         json.dumps(contacts_payload, indent=2, ensure_ascii=False) + "\n",
         encoding="utf-8"
     )
+    save_contact_summary(contacts_payload)
 
     print(f"✅ Added contact entries for {added} organizations")
-    print(f"💾 Saved to {CONTACTS_PATH}")
+    print(f"💾 Saved to {CONTACTS_PATH} (summary: {SUMMARY_PATH})")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+Streaming CRM export: every lead joined with its contact-research entries, TenderNed
+signals and score breakdown, written as CSV, NDJSON or Parquet.
+Leads are streamed from src/data.json one object at a time; contacts and tender signals
+are the hash-indexed sides of the join on entity_id, so memory does not grow with the joined row set.
+
+    python scripts/export-crm.py exports/crm.csv
+    python scripts/export-crm.py exports/crm.parquet --filter priority=Hot --filter lead_score>=60
+    python scripts/export-crm.py exports/crm.ndjson --columns name,contact_email,buying_signal --contacts primary
+    python scripts/export-crm.py --benchmark 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import operator
+import random
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Iterator
+
+ROOT = Path(__file__).resolve().parent.parent
+LEADS_PATH = ROOT / "src" / "data.json"
+ENRICHED_PATH = ROOT / "src" / "data_enriched.json"
+CONTACTS_PATH = ROOT / "exports" / "contact-research.json"
+
+CHUNK_SIZE = 1 << 16
+PARQUET_BATCH = 10_000
+
+# Output columns and their types (for Parquet and filter coercion)
+COLUMNS: dict[str, str] = {
+    "entity_id": "str",
+    "name": "str",
+    "type": "str",
+    "priority": "str",
+    "lead_score": "int",
+    "algorithm_count": "int",
+    "impactful_count": "int",
+    "high_risk_count": "int",
+    "has_iama": "bool",
+    "latest_date": "str",
+    "website": "str",
+    "score_algorithms": "int",
+    "score_impactful": "int",
+    "score_high_risk": "int",
+    "score_missing_iama": "int",
+    "score_recency": "int",
+    "score_velocity": "int",
+    "tender_count": "int",
+    "tender_ai": "int",
+    "tender_governance": "int",
+    "tender_ict": "int",
+    "buying_signal": "int",
+    "enriched_lead_score": "int",
+    "primary_email": "str",
+    "contact_rank": "int",
+    "contact_role": "str",
+    "contact_name": "str",
+    "contact_email": "str",
+    "contact_linkedin": "str",
+    "contact_notes": "str",
+}
+LEAD_FIELDS = ["entity_id", "name", "type", "priority", "lead_score", "algorithm_count", "impactful_count",
+               "high_risk_count", "has_iama", "latest_date"]
+TENDER_FIELDS = ["tender_count", "tender_ai", "tender_governance", "tender_ict", "buying_signal"]
+FILTER_RE = re.compile(r"^(\w+)\s*(>=|<=|!=|=|>|<)\s*(.*)$")
+OPERATORS: dict[str, Callable] = {
+    "=": operator.eq, "!=": operator.ne, ">=": operator.ge, "<=": operator.le, ">": operator.gt, "<": operator.lt,
+}
+# Streaming JSON scan: the characters that can change nesting, and a complete string token
+SPECIAL_RE = re.compile(r'["\[\]{}]')
+STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"')
+
+
+def seek_member(handle, key: str) -> tuple[str, str] | None:
+    """Read up to the array or object value of the top-level member `key`.
+
+    Returns the unread text after its opening bracket and the matching closing bracket, or None
+    when the document has no such member. Strings are skipped whole and brackets counted, so the
+    same name in a nested object or inside a string value is not mistaken for the member.
+    """
+    buffer, position, depth = "", 0, 0
+    while True:
+        special = SPECIAL_RE.search(buffer, position)
+        token = None
+        if special and special.group() == '"':
+            token = STRING_RE.match(buffer, special.start())
+        # Read on while the next token or what follows a key may still be cut off by the chunk
+        if special is None or (special.group() == '"' and (token is None or not buffer[token.end():].strip())):
+            chunk = handle.read(CHUNK_SIZE)
+            if not chunk:
+                return None
+            keep = special.start() if special else len(buffer)
+            buffer, position = buffer[keep:] + chunk, 0
+            continue
+        if token is None:
+            depth += 1 if special.group() in "[{" else -1
+            position = special.end()
+            continue
+        position = token.end()
+        rest = buffer[position:].lstrip()
+        if depth != 1 or not rest.startswith(":") or json.loads(token.group()) != key:
+            continue
+        value = rest[1:].lstrip()
+        while not value:
+            chunk = handle.read(CHUNK_SIZE)
+            if not chunk:
+                return None
+            value = chunk.lstrip()
+        if value[0] not in "[{":
+            return None
+        return value[1:], "]" if value[0] == "[" else "}"
+
+
+def iter_json_items(path: Path, key: str) -> Iterator[tuple[str | None, dict]]:
+    """Yield the members of the top-level array or object `key` without loading the whole document.
+
+    Array elements come back as (None, item), object members as (name, value).
+    """
+    decoder = json.JSONDecoder()
+    with path.open("r", encoding="utf-8") as handle:
+        found = seek_member(handle, key)
+        if found is None:
+            return
+        buffer, closing = found
+        while True:
+            buffer = buffer.lstrip().lstrip(",").lstrip()
+            if buffer.startswith(closing):
+                return
+            try:
+                name = None
+                if closing == "}":
+                    name, end = decoder.raw_decode(buffer)
+                    end = buffer.index(":", end) + 1
+                    while buffer[end:end + 1].isspace():
+                        end += 1
+                    item, end = decoder.raw_decode(buffer, end)
+                else:
+                    item, end = decoder.raw_decode(buffer)
+            except (json.JSONDecodeError, ValueError):
+                chunk = handle.read(CHUNK_SIZE)
+                if not chunk:
+                    raise
+                buffer += chunk
+                continue
+            yield name, item
+            buffer = buffer[end:]
+
+
+def iter_json_array(path: Path, key: str) -> Iterator[dict]:
+    return (item for _, item in iter_json_items(path, key))
+
+
+def load_tender_side(path: Path) -> dict[str, tuple]:
+    """Tender fields per lead from data_enriched.json, streamed into a compact hash index."""
+    if not path.exists():
+        return {}
+    return {
+        lead["entity_id"]: tuple(lead.get(field) for field in TENDER_FIELDS) + (lead.get("lead_score"),)
+        for lead in iter_json_array(path, "leads") if lead.get("entity_id")
+    }
+
+
+def load_contact_side(path: Path) -> dict[str, tuple[str | None, list[tuple]]]:
+    """Primary email and (role, name, email, linkedin, notes) tuples per entity_id."""
+    if not path.exists():
+        return {}
+    side = {}
+    for _, entry in iter_json_items(path, "contacts"):
+        if not entry.get("entity_id"):
+            continue
+        people = [
+            (person.get("role"), person.get("name"), person.get("email"), person.get("linkedin"), person.get("notes"))
+            for person in entry.get("contacts", [])
+        ]
+        side[entry["entity_id"]] = (entry.get("primary_email"), people)
+    return side
+
+
+def parse_filter(expression: str) -> Callable[[dict], bool]:
+    match = FILTER_RE.match(expression)
+    if not match or match.group(1) not in COLUMNS:
+        raise SystemExit(f"Invalid filter: {expression!r} (use column=value, column>=number, ...)")
+    column, op, raw = match.groups()
+    kind = COLUMNS[column]
+    value: object = raw
+    if kind == "int":
+        value = float(raw)
+    elif kind == "bool":
+        value = raw.lower() in {"1", "true", "yes"}
+    compare = OPERATORS[op]
+
+    def check(row: dict) -> bool:
+        actual = row.get(column)
+        if actual is None or actual == "":
+            return op == "=" and raw == ""
+        return compare(actual, value)
+    return check
+
+
+def joined_rows(leads: Iterator[dict], tenders: dict[str, tuple], contacts: dict[str, tuple],
+                primary_only: bool) -> Iterator[dict]:
+    """One row per lead x contact (a single row when a lead has no contacts)."""
+    empty_tender = (None,) * (len(TENDER_FIELDS) + 1)
+    for lead in leads:
+        row = {field: lead.get(field) for field in LEAD_FIELDS}
+        row["website"] = (lead.get("websites") or [None])[0]
+        breakdown = lead.get("score_breakdown") or {}
+        for component in ("algorithms", "impactful", "high_risk", "missing_iama", "recency", "velocity"):
+            row[f"score_{component}"] = breakdown.get(component)
+        entity_id = lead.get("entity_id")
+        tender = tenders.get(entity_id) or empty_tender
+        row.update(zip(TENDER_FIELDS, tender))
+        row["enriched_lead_score"] = tender[-1]
+        primary_email, people = contacts.get(entity_id) or (None, [])
+        row["primary_email"] = primary_email
+        if primary_only:
+            people = [person for person in people if person[2] == primary_email][:1] or people[:1]
+        if not people:
+            yield {**row, "contact_rank": None, "contact_role": None, "contact_name": None,
+                   "contact_email": None, "contact_linkedin": None, "contact_notes": None}
+            continue
+        for rank, (role, name, email, linkedin, notes) in enumerate(people, start=1):
+            yield {**row, "contact_rank": rank, "contact_role": role, "contact_name": name,
+                   "contact_email": email, "contact_linkedin": linkedin, "contact_notes": notes}
+
+
+class CsvSink:
+    def __init__(self, path: Path, columns: list[str]) -> None:
+        self.handle = path.open("w", encoding="utf-8", newline="")
+        self.writer = csv.writer(self.handle)
+        self.writer.writerow(columns)
+        self.columns = columns
+
+    def write(self, row: dict) -> None:
+        self.writer.writerow(["" if row[c] is None else row[c] for c in self.columns])
+
+    def close(self) -> None:
+        self.handle.close()
+
+
+class NdjsonSink:
+    def __init__(self, path: Path, columns: list[str]) -> None:
+        self.handle = path.open("w", encoding="utf-8")
+        self.columns = columns
+
+    def write(self, row: dict) -> None:
+        self.handle.write(json.dumps({c: row[c] for c in self.columns}, ensure_ascii=False) + "\n")
+
+    def close(self) -> None:
+        self.handle.close()
+
+
+class ParquetSink:
+    """Row groups of PARQUET_BATCH rows, so only one batch is held in memory."""
+
+    def __init__(self, path: Path, columns: list[str]) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise SystemExit("Parquet export needs pyarrow (pip install pyarrow)") from exc
+        types = {"str": pa.string(), "int": pa.int64(), "bool": pa.bool_()}
+        self.pa = pa
+        self.schema = pa.schema([(c, types[COLUMNS[c]]) for c in columns])
+        self.writer = pq.ParquetWriter(path, self.schema, compression="zstd")
+        self.columns = columns
+        self.batch: dict[str, list] = {c: [] for c in columns}
+        self.size = 0
+
+    def write(self, row: dict) -> None:
+        for column in self.columns:
+            self.batch[column].append(row[column])
+        self.size += 1
+        if self.size >= PARQUET_BATCH:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.size:
+            self.writer.write_table(self.pa.Table.from_pydict(self.batch, schema=self.schema))
+            self.batch = {c: [] for c in self.columns}
+            self.size = 0
+
+    def close(self) -> None:
+        self.flush()
+        self.writer.close()
+
+
+SINKS = {"csv": CsvSink, "ndjson": NdjsonSink, "parquet": ParquetSink}
+
+
+def export(output: Path, fmt: str, columns: list[str], filters: list[Callable[[dict], bool]],
+           primary_only: bool, leads_path: Path = LEADS_PATH, enriched_path: Path = ENRICHED_PATH,
+           contacts_path: Path = CONTACTS_PATH) -> dict:
+    started = time.perf_counter()
+    tenders = load_tender_side(enriched_path)
+    contacts = load_contact_side(contacts_path)
+    sink = SINKS[fmt](output, columns)
+    leads = rows = 0
+    try:
+        for row in joined_rows(iter_json_array(leads_path, "leads"), tenders, contacts, primary_only):
+            if row["contact_rank"] in (None, 1):
+                leads += 1
+            if all(check(row) for check in filters):
+                sink.write(row)
+                rows += 1
+    finally:
+        sink.close()
+    return {"leads": leads, "rows": rows, "seconds": time.perf_counter() - started,
+            "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}
+
+
+def write_synthetic(directory: Path, size: int, contacts_per_lead: int = 3) -> None:
+    """Synthetic data.json / data_enriched.json / contact-research.json written incrementally."""
+    rng = random.Random(7)
+    priorities = ["Hot", "Warm", "Medium", "Low"]
+    contacts: dict[str, dict] = {}
+    with (directory / "data.json").open("w", encoding="utf-8") as leads_out, \
+            (directory / "data_enriched.json").open("w", encoding="utf-8") as enriched_out:
+        leads_out.write('{\n  "total_leads": %d,\n  "leads": [\n' % size)
+        enriched_out.write('{"leads": [')
+        for i in range(size):
+            name = f"Organisatie {i}"
+            lead = {
+                "name": name, "entity_id": f"organisatie-{i}", "type": "Gemeente",
+                "priority": rng.choice(priorities), "lead_score": rng.randrange(100),
+                "algorithm_count": rng.randrange(40), "impactful_count": rng.randrange(10),
+                "high_risk_count": rng.randrange(5), "has_iama": rng.random() < 0.3, "latest_date": "2025-06-01",
+                "websites": [f"https://www.organisatie{i}.nl"],
+                "score_breakdown": {"algorithms": 30, "impactful": 12, "high_risk": 4, "missing_iama": 10,
+                                    "recency": 10, "velocity": 0},
+            }
+            separator = ",\n" if i else ""
+            leads_out.write(separator + json.dumps(lead, indent=2))
+            enriched_out.write(separator + json.dumps({
+                "name": name, "entity_id": lead["entity_id"], "tender_count": rng.randrange(30),
+                "tender_ai": rng.randrange(3), "tender_governance": rng.randrange(3), "tender_ict": rng.randrange(5),
+                "buying_signal": rng.randrange(15), "lead_score": lead["lead_score"],
+            }))
+        leads_out.write("\n  ]\n}\n")
+        enriched_out.write("]}\n")
+    for i in range(size):
+        people = [{"role": "CIO", "name": f"Persoon {i}-{j}", "email": f"p{j}@organisatie{i}.nl",
+                   "linkedin": None, "notes": "Synthetic"} for j in range(contacts_per_lead)]
+        contacts[f"Organisatie {i}"] = {"primary_email": people[0]["email"], "contacts": people,
+                                        "entity_id": f"organisatie-{i}"}
+    with (directory / "contact-research.json").open("w", encoding="utf-8") as handle:
+        json.dump({"contacts": contacts}, handle)
+
+
+def benchmark(size: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        write_synthetic(directory, size)
+        data_mb = (directory / "data.json").stat().st_size / 1024 / 1024
+        print(f"📊 {size} synthetic leads x 3 contacts (data.json {data_mb:.0f} MB)")
+        for fmt in ("csv", "ndjson", "parquet"):
+            # A fresh process per format, so peak RSS reflects the export alone
+            result = subprocess.run(
+                [sys.executable, __file__, str(directory / f"crm.{fmt}"), "--json-stats",
+                 "--leads", str(directory / "data.json"), "--enriched", str(directory / "data_enriched.json"),
+                 "--contacts-file", str(directory / "contact-research.json")],
+                capture_output=True, text=True, check=True,
+            )
+            stats = json.loads(result.stdout.strip().splitlines()[-1])
+            print(f"   • {fmt:<7} {stats['rows']:>8} rows in {stats['seconds']:.1f}s "
+                  f"({stats['rows'] / stats['seconds']:,.0f} rows/s), peak RSS {stats['peak_rss_mb']:.0f} MB")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Stream a joined CRM export of leads, contacts and tender signals.")
+    parser.add_argument("output", nargs="?", type=Path, help="Output file (.csv, .ndjson or .parquet)")
+    parser.add_argument("--format", choices=sorted(SINKS), help="Output format (default: from the file extension)")
+    parser.add_argument("--columns", help=f"Comma-separated columns (default: all). Available: {', '.join(COLUMNS)}")
+    parser.add_argument("--filter", action="append", default=[], help="Row filter like priority=Hot or lead_score>=60")
+    parser.add_argument("--contacts", choices=["all", "primary"], default="all",
+                        help="One row per contact, or only the primary contact per lead")
+    parser.add_argument("--leads", type=Path, default=LEADS_PATH, help="Leads file (src/data.json)")
+    parser.add_argument("--enriched", type=Path, default=ENRICHED_PATH, help="TenderNed-enriched leads file")
+    parser.add_argument("--contacts-file", type=Path, default=CONTACTS_PATH, help="Contact research file")
+    parser.add_argument("--json-stats", action="store_true", help="Print run stats as JSON")
+    parser.add_argument("--benchmark", type=int, metavar="N", help="Export N synthetic leads in every format")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return
+    if args.output is None:
+        raise SystemExit("Output file required")
+    fmt = args.format or args.output.suffix.lstrip(".").lower()
+    if fmt not in SINKS:
+        raise SystemExit(f"Unknown format {fmt!r}; use --format {'/'.join(sorted(SINKS))}")
+    columns = [c.strip() for c in args.columns.split(",")] if args.columns else list(COLUMNS)
+    unknown = [c for c in columns if c not in COLUMNS]
+    if unknown:
+        raise SystemExit(f"Unknown columns: {', '.join(unknown)}")
+
+    stats = export(args.output, fmt, columns, [parse_filter(f) for f in args.filter], args.contacts == "primary",
+                   args.leads, args.enriched, args.contacts_file)
+    if args.json_stats:
+        print(json.dumps(stats))
+        return
+    print(f"✅ Exported {stats['rows']} rows for {stats['leads']} leads to {args.output} "
+          f"in {stats['seconds']:.1f}s (peak RSS {stats['peak_rss_mb']:.0f} MB)")
+
+
+if __name__ == "__main__":
+    main()
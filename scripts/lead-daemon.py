@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Warm lead daemon: loads the register organizations, the TenderNed aggregates and the scoring
+weights once, watches the source files and re-runs only the derivations a change affects.
+
+    register CSV (--csv)           -> ingest -> organizations -> scores -> enrichment -> outputs
+    src/organizations.json         -> organizations -> scores -> enrichment -> outputs
+    src/scoring-weights.json       -> weights -> scores -> enrichment -> outputs
+    public/tenderned_data.xlsx     -> tenders -> enrichment -> outputs
+    exports/contact-research.json  -> contacts -> export
+
+Outputs are src/data.json (scores), src/data_enriched.json (enrichment), exports/top-20-leads.*
+(top-leads) and the --export CRM files (export); --output-dir writes them (with the entity table
+and spend cube) to another directory instead. --benchmark always writes to a temporary one, so
+timing runs leave the tracked files alone. Local commands go over HTTP:
+
+    python scripts/lead-daemon.py --csv "Gepubliceerde algoritmes 2026-1-2.csv" --export exports/crm.csv
+    curl -X POST 'http://127.0.0.1:8766/rebuild?target=weights'
+    curl http://127.0.0.1:8766/status
+    python scripts/lead-daemon.py --benchmark 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from algoritmehub import load_command  # noqa: E402
+from dataset_index import lead_index  # noqa: E402
+from entity_resolution import ENTITIES_PATH, EntityTable  # noqa: E402
+from lead_enrichment import (  # noqa: E402
+    ENRICHED_PATH, LEADS_PATH, TENDERS_PATH, enrich_leads, enriched_output, entity_signals, load_tenders,
+    resolve_lead_ids, tender_aggregates, tender_spend,
+)
+from lead_scoring import ORGS_PATH, WEIGHTS_PATH, build_leads, load_weights  # noqa: E402
+from register_snapshots import DEFAULT_WEEKS  # noqa: E402
+from tender_dedup import dedupe_tenders  # noqa: E402
+from tender_spend import SPEND_PATH, SpendCube, save_spend_cube  # noqa: E402
+from tender_taxonomy import load_matcher  # noqa: E402
+
+CONTACTS_PATH = ROOT / "exports" / "contact-research.json"
+TOP_LEADS_DIR = ROOT / "exports"
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8766
+DEFAULT_INTERVAL = 0.5
+
+# Derivations in dependency order, and the derivations that directly consume each one
+STAGES = ["ingest", "organizations", "weights", "tenders", "contacts", "scores", "enrichment", "top-leads", "export"]
+DEPENDENTS = {
+    "ingest": ["organizations"],
+    "organizations": ["scores"],
+    "weights": ["scores"],
+    "tenders": ["enrichment"],
+    "contacts": ["export"],
+    "scores": ["enrichment"],
+    "enrichment": ["top-leads", "export"],
+    "top-leads": [],
+    "export": [],
+}
+
+
+def affected(changed: set[str]) -> list[str]:
+    """The changed stages plus everything downstream of them, in dependency order."""
+    pending, stages = list(changed), set()
+    while pending:
+        stage = pending.pop()
+        if stage not in stages:
+            stages.add(stage)
+            pending.extend(DEPENDENTS[stage])
+    return [stage for stage in STAGES if stage in stages]
+
+
+class LeadWorkspace:
+    """Resident datasets plus one method per derivation."""
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        self.args = args
+        self.lock = threading.Lock()
+        self.organizations: dict = {}
+        self.meta: dict = {}
+        self.weights: dict = {}
+        self.tenders: pd.DataFrame | None = None
+        self.spend: SpendCube | None = None
+        self.leads: list[dict] = []
+        self.leads_path, self.enriched_path, self.top_leads_dir = LEADS_PATH, ENRICHED_PATH, TOP_LEADS_DIR
+        self.entities_path, self.spend_path = ENTITIES_PATH, SPEND_PATH
+        if args.output_dir:
+            output_dir = Path(args.output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self.leads_path, self.enriched_path = output_dir / LEADS_PATH.name, output_dir / ENRICHED_PATH.name
+            self.top_leads_dir = output_dir
+            self.entities_path, self.spend_path = output_dir / ENTITIES_PATH.name, output_dir / SPEND_PATH.name
+            # Resolution starts from the tracked entity table; new aliases are saved to the copy
+            if ENTITIES_PATH.exists() and not self.entities_path.exists():
+                shutil.copyfile(ENTITIES_PATH, self.entities_path)
+        self.watched = {
+            "organizations": ORGS_PATH,
+            "weights": WEIGHTS_PATH,
+            "tenders": TENDERS_PATH,
+            "contacts": CONTACTS_PATH,
+        }
+        if args.csv:
+            self.watched["ingest"] = Path(args.csv)
+        self.mtimes = self.current_mtimes()
+        self.history: list[dict] = []
+
+    def current_mtimes(self) -> dict[str, float]:
+        return {stage: path.stat().st_mtime if path.exists() else 0 for stage, path in self.watched.items()}
+
+    def changed_sources(self) -> set[str]:
+        mtimes = self.current_mtimes()
+        return {stage for stage, mtime in mtimes.items() if mtime != self.mtimes.get(stage)}
+
+    # Derivations
+
+    def ingest(self) -> None:
+        # Imported on first use: the clustering and search stack is only needed for register changes
+        from register_ingest import CSV_PATH, ingest_register
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            ingest_register(self.args.csv or CSV_PATH, dedup=self.args.dedup_scores,
+                            velocity=self.args.velocity_scores, weeks=self.args.weeks)
+
+    def load_organizations(self) -> None:
+        self.organizations = json.loads(ORGS_PATH.read_text(encoding="utf-8"))["organizations"]
+        if LEADS_PATH.exists():
+            with LEADS_PATH.open("r", encoding="utf-8") as handle:
+                self.meta = {k: v for k, v in json.load(handle).items() if k not in ("leads", "index")}
+
+    def load_weights(self) -> None:
+        self.weights = load_weights()
+
+    def load_tenders(self) -> None:
+        if not TENDERS_PATH.exists():
+            self.tenders, self.spend = None, None
+            return
+        matcher = load_matcher()
+        df, labels = dedupe_tenders(*load_tenders(matcher=matcher))
+        self.tenders = tender_aggregates(df, matcher, labels)
+        entity_table = EntityTable.load(self.entities_path)
+        spend = tender_spend(df, labels, matcher, entity_table)
+        entity_table.save()
+        save_spend_cube(spend, self.spend_path)
+        self.spend = SpendCube(spend)
+
+    def load_contacts(self) -> None:
+        # Contact research is only consumed by the CRM export, which streams it itself
+        pass
+
+    def score(self) -> None:
+        self.leads = build_leads(self.organizations, self.weights, dedup=self.args.dedup_scores,
+                                 velocity=self.args.velocity_scores, weeks=self.args.weeks)
+        output = {
+            "generated_date": datetime.now().strftime("%Y-%m-%d %H:%M"),
+            "source_file": self.meta.get("source_file"),
+            "total_algorithms": self.meta.get("total_algorithms"),
+            "total_leads": len(self.leads),
+            "leads": self.leads,
+            "index": lead_index(self.leads),
+        }
+        with self.leads_path.open("w", encoding="utf-8") as handle:
+            json.dump(output, handle, indent=2, ensure_ascii=False)
+
+    def enrich(self) -> None:
+        if self.tenders is None:
+            return
+        entity_table = EntityTable.load(self.entities_path)
+        leads_df = resolve_lead_ids(pd.DataFrame(self.leads), entity_table)
+        signals = entity_signals(self.tenders, entity_table)
+        entity_table.save()
+        enriched_df, matched_count, enriched_count = enrich_leads(leads_df, signals, self.spend)
+        output = enriched_output(enriched_df, self.meta.get("total_algorithms"), matched_count, enriched_count)
+        with self.enriched_path.open("w", encoding="utf-8") as handle:
+            json.dump(output, handle, indent=2, ensure_ascii=False)
+
+    def top_leads(self) -> None:
+        # The report printed by the command is not useful in the daemon log
+        with contextlib.redirect_stdout(io.StringIO()):
+            load_command("top-leads").generate(self.leads_path, self.top_leads_dir)
+
+    def export(self) -> None:
+        crm = load_command("export-crm")
+        for path in map(Path, self.args.export):
+            crm.export(path, path.suffix.lstrip(".").lower(), list(crm.COLUMNS), [], primary_only=False,
+                       leads_path=self.leads_path, enriched_path=self.enriched_path)
+
+    def rebuild(self, changed: set[str] | None, reason: str = "") -> dict | None:
+        """Run the affected derivations in order and record per-stage timings.
+
+        changed=None rebuilds whatever sources changed on disk, checked under the lock so a
+        change made by a rebuild in progress (the ingest rewrites organizations.json) is not redone.
+        """
+        actions = {
+            "ingest": self.ingest,
+            "organizations": self.load_organizations,
+            "weights": self.load_weights,
+            "tenders": self.load_tenders,
+            "contacts": self.load_contacts,
+            "scores": self.score,
+            "enrichment": self.enrich,
+            "top-leads": self.top_leads,
+            "export": self.export,
+        }
+        with self.lock:
+            if changed is None:
+                changed = self.changed_sources()
+                if not changed:
+                    return None
+                reason = f"changed: {', '.join(sorted(changed))}"
+            started = time.perf_counter()
+            timings: dict[str, float] = {}
+            error = None
+            for stage in affected(changed):
+                stage_started = time.perf_counter()
+                try:
+                    actions[stage]()
+                except Exception as exc:  # keep serving; the next change or command retries
+                    error = f"{stage}: {exc}"
+                    break
+                timings[stage] = round(time.perf_counter() - stage_started, 3)
+            self.mtimes = self.current_mtimes()
+            run = {
+                "reason": reason,
+                "finished": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "seconds": round(time.perf_counter() - started, 3),
+                "stages": timings,
+            }
+            if error:
+                run["error"] = error
+            self.history = (self.history + [run])[-20:]
+        if error:
+            print(f"❌ Rebuild failed at {error} ({reason})")
+        else:
+            print(f"✅ Rebuilt {', '.join(timings)} ({reason}) in {run['seconds']:.2f}s")
+        return run
+
+    def status(self) -> dict:
+        return {
+            "organizations": len(self.organizations),
+            "leads": len(self.leads),
+            "tender_organizations": 0 if self.tenders is None else len(self.tenders),
+            "watched": {stage: str(path) for stage, path in self.watched.items()},
+            "runs": self.history,
+        }
+
+
+def watch(workspace: LeadWorkspace, interval: float, stop: threading.Event) -> None:
+    while not stop.wait(interval):
+        if workspace.changed_sources():
+            # Let the writer finish before reading the file
+            stop.wait(interval)
+            workspace.rebuild(None)
+
+
+def make_handler(workspace: LeadWorkspace) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def send_json(self, status: int, payload: object) -> None:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            if urlparse(self.path).path == "/status":
+                self.send_json(200, workspace.status())
+            else:
+                self.send_json(404, {"error": "unknown endpoint"})
+
+        def do_POST(self) -> None:
+            parsed = urlparse(self.path)
+            if parsed.path != "/rebuild":
+                self.send_json(404, {"error": "unknown endpoint"})
+                return
+            targets = {t for value in parse_qs(parsed.query).get("target", ["scores"]) for t in value.split(",")}
+            unknown = sorted(targets - set(STAGES))
+            if unknown:
+                self.send_json(400, {"error": f"unknown target(s): {', '.join(unknown)}", "targets": STAGES})
+                return
+            run = workspace.rebuild(targets, f"command: {', '.join(sorted(targets))}")
+            self.send_json(500 if "error" in run else 200, run)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    return Handler
+
+
+def benchmark(workspace: LeadWorkspace, runs: int) -> None:
+    """Median latency of a score-only rebuild (weights changed) against the warm workspace."""
+    latencies = []
+    for _ in range(runs):
+        run = workspace.rebuild({"weights"}, "benchmark")
+        if "error" in run:
+            print(f"❌ Rebuild failed: {run['error']}")
+            sys.exit(1)
+        latencies.append(run["seconds"])
+    stages = workspace.history[-1]["stages"]
+    print(f"📊 Score-only rebuild over {runs} runs: median {statistics.median(latencies) * 1000:.0f} ms, "
+          f"max {max(latencies) * 1000:.0f} ms")
+    print(f"   • last run: {', '.join(f'{stage} {seconds * 1000:.0f} ms' for stage, seconds in stages.items())}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Warm lead daemon: rebuild derived lead data on change.")
+    parser.add_argument("--csv", help="Algoritmeregister CSV to watch (a change re-runs the ingest)")
+    parser.add_argument("--export", action="append", default=[], help="CRM export file to keep up to date")
+    parser.add_argument("--dedup-scores", action="store_true", help="Count near-duplicate algorithms once")
+    parser.add_argument("--velocity-scores", action="store_true", help="Include the velocity bonus")
+    parser.add_argument("--weeks", type=int, default=DEFAULT_WEEKS, help="Velocity window in weeks")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="Seconds between file checks")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Interface to bind")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port to listen on")
+    parser.add_argument("--output-dir", type=Path, help="Write outputs here instead of src/ and exports/")
+    parser.add_argument("--benchmark", type=int, metavar="N",
+                        help="Time N score-only rebuilds (outputs go to a temporary directory) and exit")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.benchmark and not args.output_dir:
+        with tempfile.TemporaryDirectory() as output_dir:
+            args.output_dir = Path(output_dir)
+            run(args)
+        return
+    run(args)
+
+
+def run(args: argparse.Namespace) -> None:
+    workspace = LeadWorkspace(args)
+    print("📂 Loading organizations, weights and TenderNed data...")
+    workspace.rebuild({"organizations", "weights", "tenders", "contacts"}, "startup")
+    if args.benchmark:
+        benchmark(workspace, args.benchmark)
+        return
+
+    stop = threading.Event()
+    watcher = threading.Thread(target=watch, args=(workspace, args.interval, stop), daemon=True)
+    watcher.start()
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(workspace))
+    print(f"👀 Watching {len(workspace.watched)} sources; commands on http://{args.host}:{args.port} "
+          f"(POST /rebuild?target=..., GET /status)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
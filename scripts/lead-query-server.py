@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Local lead query service for the dashboards.
+Loads src/data.json, src/organizations.json and exports/contact-research.json into
+indexed in-memory structures and answers filtered, sorted and paginated lead queries
+over HTTP/JSON, so the client only receives one page of results.
+
+    python scripts/lead-query-server.py --port 8765
+    curl 'http://127.0.0.1:8765/leads?type=Gemeente&priority=Hot&sort=impactful_count&page=1'
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+from bisect import bisect_left
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlparse
+
+ROOT = Path(__file__).resolve().parent.parent
+LEADS_PATH = ROOT / "src" / "data.json"
+ORGS_PATH = ROOT / "src" / "organizations.json"
+CONTACTS_PATH = ROOT / "exports" / "contact-research.json"
+
+sys.path.insert(0, str(ROOT))
+from dataset_index import LEAD_SORTS, sort_order  # noqa: E402
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_PER_PAGE = 50
+MAX_PER_PAGE = 500
+
+SORT_KEYS = ("lead_score", "algorithm_count", "impactful_count", "latest_date", "name")
+# Same windows as the recency filter in LeadDashboard
+RECENCY_MONTHS = {"month": 1, "3months": 3, "6months": 6, "year": 12}
+
+
+def months_ago(today: date, months: int) -> date:
+    year, month = divmod(today.year * 12 + today.month - 1 - months, 12)
+    day = today.day
+    while True:
+        try:
+            return date(year, month + 1, day)
+        except ValueError:
+            day -= 1
+
+
+def recency_cutoff(recency: str, today: date | None = None) -> str | None:
+    today = today or date.today()
+    if recency == "week":
+        return (today - timedelta(days=7)).isoformat()
+    if recency in RECENCY_MONTHS:
+        return months_ago(today, RECENCY_MONTHS[recency]).isoformat()
+    return None
+
+
+def trigrams(text: str) -> set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def contact_status(entry: dict | None) -> tuple[list[dict], set[str]]:
+    """Named contacts plus the contact filter buckets (named/email-only/linkedin/none) of an org."""
+    named = [c for c in (entry or {}).get("contacts") or [] if c.get("name")]
+    has_email = bool((entry or {}).get("primary_email"))
+    buckets = set()
+    if named:
+        buckets.add("named")
+    elif has_email:
+        buckets.add("email-only")
+    else:
+        buckets.add("none")
+    if any(c.get("linkedin") for c in named):
+        buckets.add("linkedin")
+    return named, buckets
+
+
+class LeadIndex:
+    """Leads with facet postings, a name trigram index and precomputed sort orders."""
+
+    def __init__(self, leads_data: dict, orgs_data: dict, contacts_data: dict) -> None:
+        self.meta = {k: v for k, v in leads_data.items() if k not in ("leads", "index")}
+        self.leads: list[dict] = leads_data.get("leads", [])
+        self.orgs: dict = orgs_data.get("organizations", {})
+        # Research is stored by the name it was researched under; leads join it on entity_id
+        self.contacts: dict = {
+            entry["entity_id"]: entry for entry in (contacts_data.get("contacts") or {}).values() if entry.get("entity_id")
+        }
+        self.names = [(lead.get("name") or "").lower() for lead in self.leads]
+        self.by_name = {lead.get("name"): i for i, lead in enumerate(self.leads)}
+
+        self.facets: dict[str, dict[str, set[int]]] = {"type": {}, "priority": {}, "contact": {}}
+        self.summaries: list[dict] = []
+        self.grams: dict[str, set[int]] = {}
+        for i, lead in enumerate(self.leads):
+            self.facets["type"].setdefault(lead.get("type") or "", set()).add(i)
+            self.facets["priority"].setdefault(lead.get("priority") or "", set()).add(i)
+            entry = self.contacts.get(lead.get("entity_id"))
+            named, buckets = contact_status(entry)
+            for bucket in buckets:
+                self.facets["contact"].setdefault(bucket, set()).add(i)
+            self.summaries.append({
+                "primary_email": (entry or {}).get("primary_email"),
+                "named_contacts": named,
+            })
+            for gram in trigrams(self.names[i]):
+                self.grams.setdefault(gram, set()).add(i)
+
+        dated = sorted((lead["latest_date"], i) for i, lead in enumerate(self.leads) if lead.get("latest_date"))
+        self.dates = [d for d, _ in dated]
+        self.dated_ids = [i for _, i in dated]
+
+        self.orders: dict[str, list[int]] = {}
+        self.ranks: dict[str, list[int]] = {}
+        ids = range(len(self.leads))
+        # Sort orders shipped with data.json; computed for files written before they existed
+        shipped = (leads_data.get("index") or {}).get("sort", {})
+        for key in LEAD_SORTS:
+            self.orders[key] = shipped.get(key) or sort_order(self.leads, key)
+        self.orders["name"] = sorted(ids, key=lambda i: self.names[i])
+        for key, order in self.orders.items():
+            rank = [0] * len(order)
+            for position, i in enumerate(order):
+                rank[i] = position
+            self.ranks[key] = rank
+
+        self.stats = {
+            "totalLeads": len(self.leads),
+            "hotLeads": len(self.facets["priority"].get("Hot", ())),
+            "warmLeads": len(self.facets["priority"].get("Warm", ())),
+            "totalAlgorithms": self.meta.get("total_algorithms") or 0,
+            "totalImpactful": sum(lead.get("impactful_count") or 0 for lead in self.leads),
+        }
+
+    def search(self, term: str) -> set[int]:
+        term = term.lower()
+        if len(term) < 3:
+            return {i for i, name in enumerate(self.names) if term in name}
+        postings = sorted((self.grams.get(gram, set()) for gram in trigrams(term)), key=len)
+        candidates = set.intersection(*postings) if postings else set()
+        return {i for i in candidates if term in self.names[i]}
+
+    def query(self, params: dict[str, str]) -> dict:
+        filters: list[set[int]] = []
+        for facet in ("type", "priority", "contact"):
+            value = params.get(facet)
+            if value:
+                filters.append(self.facets[facet].get(value, set()))
+        cutoff = recency_cutoff(params.get("recency", ""))
+        if cutoff:
+            filters.append(set(self.dated_ids[bisect_left(self.dates, cutoff):]))
+        if params.get("search"):
+            filters.append(self.search(params["search"]))
+
+        sort = params.get("sort") if params.get("sort") in SORT_KEYS else "lead_score"
+        per_page = max(1, min(MAX_PER_PAGE, int(params.get("per_page") or DEFAULT_PER_PAGE)))
+        page = max(1, int(params.get("page") or 1))
+        start = (page - 1) * per_page
+
+        if filters:
+            matches = set.intersection(*sorted(filters, key=len))
+            total = len(matches)
+            rank = self.ranks[sort]
+            page_ids = sorted(matches, key=rank.__getitem__)[start:start + per_page]
+        else:
+            total = len(self.leads)
+            page_ids = self.orders[sort][start:start + per_page]
+
+        return {
+            "total": total,
+            "page": page,
+            "per_page": per_page,
+            "sort": sort,
+            "stats": self.stats,
+            "leads": [{**self.leads[i], "contact_summary": self.summaries[i]} for i in page_ids],
+        }
+
+    def organization(self, name: str) -> dict | None:
+        if name not in self.by_name and name not in self.orgs:
+            return None
+        index = self.by_name.get(name)
+        lead = self.leads[index] if index is not None else None
+        organization = self.orgs.get(name)
+        entity_id = (lead or organization or {}).get("entity_id")
+        return {
+            "lead": lead,
+            "organization": organization,
+            "contact_research": self.contacts.get(entity_id),
+        }
+
+
+class LeadStore:
+    """Holds the current LeadIndex and rebuilds it when a source file changes."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.mtimes: tuple = ()
+        self.index: LeadIndex | None = None
+
+    def current(self) -> LeadIndex:
+        paths = (LEADS_PATH, ORGS_PATH, CONTACTS_PATH)
+        mtimes = tuple(p.stat().st_mtime if p.exists() else 0 for p in paths)
+        with self.lock:
+            if self.index is None or mtimes != self.mtimes:
+                loaded = [json.loads(p.read_text(encoding="utf-8")) if p.exists() else {} for p in paths]
+                self.index = LeadIndex(*loaded)
+                self.mtimes = mtimes
+                print(f"📚 Indexed {len(self.index.leads)} leads")
+            return self.index
+
+
+def make_handler(store: LeadStore) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def send_json(self, status: int, payload: object) -> None:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Access-Control-Allow-Origin", "*")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            parsed = urlparse(self.path)
+            params = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+            try:
+                index = store.current()
+                if parsed.path == "/leads":
+                    self.send_json(200, index.query(params))
+                elif parsed.path == "/stats":
+                    self.send_json(200, {**index.meta, "stats": index.stats})
+                elif parsed.path.startswith("/organizations/"):
+                    detail = index.organization(unquote(parsed.path[len("/organizations/"):]))
+                    if detail is None:
+                        self.send_json(404, {"error": "organization not found"})
+                    else:
+                        self.send_json(200, detail)
+                else:
+                    self.send_json(404, {"error": "unknown endpoint"})
+            # A source file that is missing or half-written (mid-ingest) cannot be indexed; the
+            # next request retries it. Checked before ValueError, which JSONDecodeError subclasses
+            except (json.JSONDecodeError, OSError) as exc:
+                self.send_json(503, {"error": f"lead data could not be loaded: {exc}"})
+            except ValueError as exc:
+                self.send_json(400, {"error": str(exc)})
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    return Handler
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Local lead query service (HTTP/JSON).")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="Interface to bind")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port to listen on")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    store = LeadStore()
+    store.current()
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(store))
+    print(f"🚀 Lead query service on http://{args.host}:{args.port} (/leads, /stats, /organizations/<name>)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+"""
+Bulk outreach dispatcher.
+Renders src/email-templates.json (the same templates as generateEmailTemplate in
+src/lib/leadTracking.ts) for a lead selection, queues the messages in a persistent SQLite
+send queue keyed by idempotency key, and delivers them with bounded concurrency, a provider
+rate limit and exponential-backoff retries. Re-running a campaign never re-sends a message the
+queue has recorded as sent. A send whose outcome is unknown (timeout, dropped connection, a run
+interrupted mid-send) is retried with the same Idempotency-Key header and Message-ID, so it can
+arrive twice unless the endpoint or mail provider deduplicates on them; /api/send-email does not.
+Local HTTP and SMTP stand-ins for testing live in tests/stand_ins.py.
+
+    python scripts/outreach-dispatch.py --campaign pilot-1 --source top20
+    python scripts/outreach-dispatch.py --campaign pilot-1 --transport smtp --smtp-port 1025
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import smtplib
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from email.message import EmailMessage
+from functools import lru_cache
+from http.client import HTTPException
+from pathlib import Path
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+ROOT = Path(__file__).resolve().parent.parent
+TEMPLATES_PATH = ROOT / "src" / "email-templates.json"
+LEADS_PATH = ROOT / "src" / "data.json"
+TOP_LEADS_PATH = ROOT / "exports" / "top-20-leads.json"
+CONTACTS_PATH = ROOT / "exports" / "contact-research.json"
+QUEUE_PATH = ROOT / "exports" / "outreach-queue.sqlite"
+
+DEFAULT_ENDPOINT = "http://localhost:3000/api/send-email"
+DEFAULT_SENDER = "outreach@algoritmehub.nl"
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RATE = 2.0
+DEFAULT_MAX_ATTEMPTS = 4
+DEFAULT_MAX_WAIT = 60.0
+SEND_TIMEOUT = 15
+BACKOFF_BASE = 2.0
+MAX_BACKOFF = 300.0
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+TAG_RE = re.compile(r"\{\{([#/]?)(\w+)\}\}")
+
+
+# --- Templates -------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def compile_template(source: str) -> tuple:
+    """Parse a template once into text, ("field", name) and ("section", name, children) nodes."""
+    root: list = []
+    stack: list[tuple[str, list]] = []
+    current = root
+    last = 0
+    for match in TAG_RE.finditer(source):
+        kind, name = match.groups()
+        if match.start() > last:
+            current.append(source[last:match.start()])
+        last = match.end()
+        if kind == "#":
+            children: list = []
+            current.append(("section", name, children))
+            stack.append((name, current))
+            current = children
+        elif kind == "/":
+            if not stack or stack[-1][0] != name:
+                raise ValueError(f"Unbalanced template section: {name}")
+            current = stack.pop()[1]
+        else:
+            current.append(("field", name))
+    if stack:
+        raise ValueError(f"Unclosed template section: {stack[-1][0]}")
+    if last < len(source):
+        current.append(source[last:])
+    return freeze(root)
+
+
+def freeze(nodes: list) -> tuple:
+    return tuple(
+        ("section", node[1], freeze(node[2])) if isinstance(node, tuple) and node[0] == "section" else node
+        for node in nodes
+    )
+
+
+def render(nodes: tuple, context: dict) -> str:
+    parts = []
+    for node in nodes:
+        if isinstance(node, str):
+            parts.append(node)
+        elif node[0] == "field":
+            value = context.get(node[1])
+            parts.append("" if value is None else str(value))
+        elif context.get(node[1]):
+            parts.append(render(node[2], context))
+    return "".join(parts)
+
+
+def template_context(lead: dict) -> dict:
+    """Same fields and flags as emailTemplateContext in src/lib/leadTracking.ts."""
+    algorithm_count = lead.get("algorithm_count", 0)
+    impactful_count = lead.get("impactful_count", 0)
+    return {
+        "name": lead["name"],
+        "algorithm_count": algorithm_count,
+        "impactful_count": impactful_count,
+        "plural": algorithm_count > 1,
+        "has_impactful": impactful_count > 0,
+        "missing_iama": not lead.get("has_iama") and impactful_count > 0,
+    }
+
+
+def render_email(template: dict, lead: dict) -> tuple[str, str]:
+    context = template_context(lead)
+    return render(compile_template(template["subject"]), context), render(compile_template(template["body"]), context)
+
+
+# --- Lead selection --------------------------------------------------------
+
+def load_json(path: Path) -> dict:
+    with path.open("r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def select_leads(source: str, priorities: set[str], limit: int | None) -> list[dict]:
+    if source == "top20":
+        data = load_json(TOP_LEADS_PATH)
+        leads = data.get("quick_wins", []) + data.get("strategic_targets", [])
+    else:
+        leads = load_json(LEADS_PATH).get("leads", [])
+    if priorities:
+        leads = [lead for lead in leads if lead.get("priority") in priorities]
+    return leads[:limit] if limit else leads
+
+
+def recipient_for(lead: dict, contacts: dict) -> str | None:
+    """Researched primary email first, then a named contact, then the register contact email.
+
+    contacts maps entity_id to the research entry (see research_by_entity).
+    """
+    entry = contacts.get(lead.get("entity_id")) or {}
+    if entry.get("primary_email"):
+        return entry["primary_email"]
+    for person in entry.get("contacts", []):
+        if person.get("email"):
+            return person["email"]
+    emails = lead.get("contact_emails") or []
+    return emails[0] if emails else None
+
+
+def research_by_entity(research: dict) -> dict:
+    """Contact research entries by entity_id (the research file is keyed by organization name)."""
+    return {entry["entity_id"]: entry for entry in research.values() if entry.get("entity_id")}
+
+
+def idempotency_key(campaign: str, template_id: str, lead_name: str, recipient: str) -> str:
+    return hashlib.sha1(f"{campaign}\x1f{template_id}\x1f{lead_name}\x1f{recipient.lower()}".encode("utf-8")).hexdigest()
+
+
+# --- Persistent queue ------------------------------------------------------
+
+class SendQueue:
+    """SQLite-backed queue; only the dispatcher thread touches the connection."""
+
+    def __init__(self, path: Path = QUEUE_PATH) -> None:
+        path.parent.mkdir(exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            """CREATE TABLE IF NOT EXISTS messages (
+                idempotency_key TEXT PRIMARY KEY,
+                campaign TEXT NOT NULL,
+                lead TEXT NOT NULL,
+                recipient TEXT NOT NULL,
+                subject TEXT NOT NULL,
+                body TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'queued',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL DEFAULT 0,
+                last_error TEXT,
+                queued_at TEXT NOT NULL,
+                sent_at TEXT
+            )"""
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS messages_due ON messages (campaign, status, next_attempt_at)")
+        self.conn.commit()
+
+    def enqueue(self, messages: list[dict]) -> int:
+        """Insert new messages; existing idempotency keys are left untouched. Returns the number added."""
+        before = self.conn.total_changes
+        now = datetime.now().isoformat(timespec="seconds")
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO messages (idempotency_key, campaign, lead, recipient, subject, body, queued_at) "
+            "VALUES (:idempotency_key, :campaign, :lead, :recipient, :subject, :body, :queued_at)",
+            [{**message, "queued_at": now} for message in messages],
+        )
+        self.conn.commit()
+        return self.conn.total_changes - before
+
+    def recover(self, campaign: str) -> None:
+        """Messages left 'sending' by an interrupted run go back to the queue; they may already have arrived."""
+        self.conn.execute("UPDATE messages SET status = 'queued' WHERE campaign = ? AND status = 'sending'", (campaign,))
+        self.conn.commit()
+
+    def claim(self, campaign: str, limit: int, now: float) -> list[dict]:
+        rows = self.conn.execute(
+            "SELECT idempotency_key, lead, recipient, subject, body, attempts FROM messages "
+            "WHERE campaign = ? AND status = 'queued' AND next_attempt_at <= ? ORDER BY next_attempt_at LIMIT ?",
+            (campaign, now, limit),
+        ).fetchall()
+        self.conn.executemany(
+            "UPDATE messages SET status = 'sending' WHERE idempotency_key = ?", [(row[0],) for row in rows]
+        )
+        self.conn.commit()
+        keys = ("idempotency_key", "lead", "recipient", "subject", "body", "attempts")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def next_due(self, campaign: str) -> float | None:
+        row = self.conn.execute(
+            "SELECT MIN(next_attempt_at) FROM messages WHERE campaign = ? AND status = 'queued'", (campaign,)
+        ).fetchone()
+        return row[0]
+
+    def mark_sent(self, key: str) -> None:
+        self.conn.execute(
+            "UPDATE messages SET status = 'sent', attempts = attempts + 1, last_error = NULL, sent_at = ? "
+            "WHERE idempotency_key = ?",
+            (datetime.now().isoformat(timespec="seconds"), key),
+        )
+        self.conn.commit()
+
+    def mark_error(self, key: str, error: str, retry_at: float | None) -> None:
+        if retry_at is None:
+            self.conn.execute(
+                "UPDATE messages SET status = 'failed', attempts = attempts + 1, last_error = ? WHERE idempotency_key = ?",
+                (error, key),
+            )
+        else:
+            self.conn.execute(
+                "UPDATE messages SET status = 'queued', attempts = attempts + 1, last_error = ?, next_attempt_at = ? "
+                "WHERE idempotency_key = ?",
+                (error, retry_at, key),
+            )
+        self.conn.commit()
+
+    def counts(self, campaign: str) -> dict[str, int]:
+        rows = self.conn.execute(
+            "SELECT status, COUNT(*) FROM messages WHERE campaign = ? GROUP BY status", (campaign,)
+        ).fetchall()
+        return dict(rows)
+
+
+# --- Delivery --------------------------------------------------------------
+
+class SendError(Exception):
+    def __init__(self, message: str, retryable: bool, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+class RateLimiter:
+    """Token bucket shared by all worker threads."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+
+
+class HttpTransport:
+    """POSTs the same payload as Top20Dashboard to /api/send-email, plus an Idempotency-Key header."""
+
+    def __init__(self, endpoint: str) -> None:
+        self.endpoint = endpoint
+
+    def send(self, message: dict) -> None:
+        payload = json.dumps({
+            "to": message["recipient"],
+            "subject": message["subject"],
+            "body": message["body"],
+            "leadName": message["lead"],
+        }).encode("utf-8")
+        request = Request(self.endpoint, data=payload, method="POST", headers={
+            "Content-Type": "application/json",
+            "Idempotency-Key": message["idempotency_key"],
+        })
+        try:
+            with urlopen(request, timeout=SEND_TIMEOUT) as response:
+                response.read()
+        except HTTPError as exc:
+            retry_after = exc.headers.get("Retry-After") if exc.headers else None
+            raise SendError(
+                f"HTTP {exc.code}",
+                retryable=exc.code in RETRYABLE_STATUS,
+                retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None,
+            ) from exc
+        except (URLError, HTTPException, OSError) as exc:
+            # Connection drops, truncated bodies (IncompleteRead) and timeouts: the send may be retried
+            raise SendError(str(getattr(exc, "reason", exc)) or type(exc).__name__, retryable=True) from exc
+
+
+class SmtpTransport:
+    """Plain SMTP delivery with one connection per worker thread."""
+
+    def __init__(self, host: str, port: int, sender: str) -> None:
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.local = threading.local()
+
+    def connection(self) -> smtplib.SMTP:
+        if getattr(self.local, "smtp", None) is None:
+            self.local.smtp = smtplib.SMTP(self.host, self.port, timeout=SEND_TIMEOUT)
+        return self.local.smtp
+
+    def send(self, message: dict) -> None:
+        email = EmailMessage()
+        email["From"] = self.sender
+        email["To"] = message["recipient"]
+        email["Subject"] = message["subject"]
+        email["Message-ID"] = f"<{message['idempotency_key']}@algoritmehub.nl>"
+        email.set_content(message["body"])
+        try:
+            self.connection().send_message(email)
+        except smtplib.SMTPResponseException as exc:
+            self.local.smtp = None
+            raise SendError(f"SMTP {exc.smtp_code}", retryable=400 <= exc.smtp_code < 500) from exc
+        except (smtplib.SMTPException, OSError) as exc:
+            self.local.smtp = None
+            raise SendError(str(exc), retryable=True) from exc
+
+
+def backoff(attempts: int, retry_after: float | None) -> float:
+    """Seconds until the next attempt: Retry-After if given, else exponential with jitter."""
+    if retry_after is not None:
+        return min(retry_after, MAX_BACKOFF)
+    return min(MAX_BACKOFF, BACKOFF_BASE ** attempts) * random.uniform(0.5, 1.0)
+
+
+@dataclass
+class DispatchStats:
+    sent: int = 0
+    retries: int = 0
+    failed: int = 0
+    latencies: list[float] = field(default_factory=list)
+    errors: dict[str, int] = field(default_factory=dict)
+
+    def report(self, elapsed: float) -> str:
+        latencies = sorted(self.latencies)
+        p50 = latencies[len(latencies) // 2] * 1000 if latencies else 0
+        p95 = latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0
+        lines = [
+            f"   • sent: {self.sent}, retried attempts: {self.retries}, failed: {self.failed}",
+            f"   • throughput: {self.sent / max(elapsed, 1e-9):.1f} msg/s over {elapsed:.1f}s, "
+            f"latency p50 {p50:.0f} ms / p95 {p95:.0f} ms",
+        ]
+        if self.errors:
+            top = ", ".join(f"{error} x{count}" for error, count in sorted(self.errors.items(), key=lambda i: -i[1])[:5])
+            lines.append(f"   • errors: {top}")
+        return "\n".join(lines)
+
+
+def timed_send(transport: HttpTransport | SmtpTransport, limiter: RateLimiter, message: dict) -> float:
+    limiter.acquire()
+    started = time.perf_counter()
+    transport.send(message)
+    return time.perf_counter() - started
+
+
+def dispatch(queue: SendQueue, campaign: str, transport: HttpTransport | SmtpTransport, concurrency: int,
+             rate: float, max_attempts: int, max_wait: float) -> DispatchStats:
+    """Deliver due messages until the campaign queue is drained (or only far-off retries remain)."""
+    stats = DispatchStats()
+    # No burst: the provider limit holds from the first send, even with every worker ready
+    limiter = RateLimiter(rate)
+    queue.recover(campaign)
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        in_flight: dict = {}
+        while True:
+            free = concurrency * 2 - len(in_flight)
+            if free > 0:
+                for message in queue.claim(campaign, free, time.time()):
+                    in_flight[pool.submit(timed_send, transport, limiter, message)] = message
+            if not in_flight:
+                next_due = queue.next_due(campaign)
+                if next_due is None or next_due - time.time() > max_wait:
+                    break
+                time.sleep(max(0.0, next_due - time.time()))
+                continue
+            done, _ = wait(in_flight, timeout=1.0, return_when=FIRST_COMPLETED)
+            for future in done:
+                message = in_flight.pop(future)
+                try:
+                    stats.latencies.append(future.result())
+                    queue.mark_sent(message["idempotency_key"])
+                    stats.sent += 1
+                except SendError as exc:
+                    attempts = message["attempts"] + 1
+                    stats.errors[str(exc)] = stats.errors.get(str(exc), 0) + 1
+                    if exc.retryable and attempts < max_attempts:
+                        queue.mark_error(message["idempotency_key"], str(exc),
+                                         time.time() + backoff(attempts, exc.retry_after))
+                        stats.retries += 1
+                    else:
+                        queue.mark_error(message["idempotency_key"], str(exc), None)
+                        stats.failed += 1
+    return stats
+
+
+# --- CLI -------------------------------------------------------------------
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Render and send outreach emails through a rate-limited queue.")
+    parser.add_argument("--campaign", required=True, help="Campaign name (part of every idempotency key)")
+    parser.add_argument("--template", default="intro", help="Template id in src/email-templates.json")
+    parser.add_argument("--source", choices=["top20", "all"], default="top20",
+                        help="exports/top-20-leads.json or every lead in src/data.json")
+    parser.add_argument("--priority", action="append", default=[], help="Only leads with this priority (repeatable)")
+    parser.add_argument("--limit", type=int, help="Maximum number of leads")
+    parser.add_argument("--dry-run", action="store_true", help="Render and enqueue only, do not send")
+    parser.add_argument("--transport", choices=["http", "smtp"], default="http", help="Delivery transport")
+    parser.add_argument("--endpoint", default=DEFAULT_ENDPOINT, help="Send endpoint for the http transport")
+    parser.add_argument("--smtp-host", default="localhost", help="SMTP host for the smtp transport")
+    parser.add_argument("--smtp-port", type=int, default=1025, help="SMTP port for the smtp transport")
+    parser.add_argument("--sender", default=DEFAULT_SENDER, help="From address for the smtp transport")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="Parallel sends")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE, help="Provider rate limit in messages/second")
+    parser.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS, help="Attempts before a message fails")
+    parser.add_argument("--max-wait", type=float, default=DEFAULT_MAX_WAIT,
+                        help="Stop when the next retry is further away than this many seconds")
+    parser.add_argument("--queue", type=Path, default=QUEUE_PATH, help="SQLite queue file")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    template = load_json(TEMPLATES_PATH)["templates"][args.template]
+    contacts = research_by_entity(load_json(CONTACTS_PATH).get("contacts", {})) if CONTACTS_PATH.exists() else {}
+    leads = select_leads(args.source, set(args.priority), args.limit)
+
+    started = time.perf_counter()
+    messages, missing = [], 0
+    for lead in leads:
+        recipient = recipient_for(lead, contacts)
+        if not recipient:
+            missing += 1
+            continue
+        subject, body = render_email(template, lead)
+        messages.append({
+            "idempotency_key": idempotency_key(args.campaign, args.template, lead["name"], recipient),
+            "campaign": args.campaign,
+            "lead": lead["name"],
+            "recipient": recipient,
+            "subject": subject,
+            "body": body,
+        })
+    rendered = time.perf_counter() - started
+
+    queue = SendQueue(args.queue)
+    added = queue.enqueue(messages)
+    print(f"📨 Campaign '{args.campaign}': {len(messages)} rendered in {rendered * 1000:.0f} ms, "
+          f"{added} queued, {len(messages) - added} already known, {missing} leads without email")
+    if args.dry_run:
+        print(f"   • queue: {queue.counts(args.campaign)}")
+        return
+
+    if args.transport == "smtp":
+        transport: HttpTransport | SmtpTransport = SmtpTransport(args.smtp_host, args.smtp_port, args.sender)
+    else:
+        transport = HttpTransport(args.endpoint)
+
+    started = time.perf_counter()
+    stats = dispatch(queue, args.campaign, transport, args.concurrency, args.rate, args.max_attempts, args.max_wait)
+    print(f"\n📈 Dispatch summary:")
+    print(stats.report(time.perf_counter() - started))
+    print(f"   • queue: {queue.counts(args.campaign)}")
+
+
+if __name__ == "__main__":
+    main()
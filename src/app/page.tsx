@@ -2,6 +2,12 @@ import { TabsContainer } from '@/components/TabsContainer';
 // Use updated Algoritmeregister data from 2026-01-02
 import leadData from '@/data.json';
 import { LeadData } from '@/types/lead';
+import { LEAD_QUERY_URL } from '@/lib/leadQuery';
+
+// With a lead query service the lead list is served page by page, so it is not shipped to the client
+const data: LeadData = LEAD_QUERY_URL
+  ? { ...(leadData as LeadData), leads: [], index: undefined }
+  : (leadData as LeadData);
 
 export default function HomePage() {
   return (
@@ -23,7 +29,7 @@ export default function HomePage() {
             </span>
           </div>
           <div className="text-sm text-slate-500">
-            Bijgewerkt: {new Date((leadData as LeadData).generated_date).toLocaleDateString('nl-NL', {
+            Bijgewerkt: {new Date(data.generated_date).toLocaleDateString('nl-NL', {
               day: 'numeric',
               month: 'long',
               year: 'numeric'
@@ -34,7 +40,7 @@ export default function HomePage() {
 
       {/* Main Content with Tabs */}
       <main className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-8">
-        <TabsContainer data={leadData as LeadData} />
+        <TabsContainer data={data} />
       </main>
 
       {/* Footer */}
@@ -1,27 +1,14 @@
 'use client';
 
-import { useState, useMemo } from 'react';
+import { useState, useMemo, useEffect } from 'react';
 import { OrganizationDetail } from './OrganizationDetail';
-import contactResearchData from '../../exports/contact-research.json';
-
-interface ContactPerson {
-    role: string;
-    name: string | null;
-    email: string | null;
-    linkedin: string | null;
-    notes: string | null;
-}
-
-interface OrgContactData {
-    primary_email: string | null;
-    contacts: ContactPerson[];
-    notes?: string;
-}
-
-const contactResearch = contactResearchData as { contacts: Record<string, OrgContactData> };
+import { LEAD_QUERY_URL, LeadQueryParams, LeadQueryResult, loadLeadData, queryLeads } from '@/lib/leadQuery';
+import { DatasetIndex, facetCount, facetMask, selectRows } from '@/lib/datasetIndex';
+import { ContactSummary, contactSummaries, summarizeContacts } from '@/lib/contactResearch';
 
 interface Lead {
     name: string;
+    entity_id?: string | null;
     type: string;
     algorithm_count: number;
     impactful_count: number;
@@ -40,13 +27,18 @@ interface LeadData {
     total_algorithms: number;
     total_leads: number;
     leads: Lead[];
+    index?: DatasetIndex;
 }
 
 interface LeadDashboardProps {
     data: LeadData;
 }
 
-export function LeadDashboard({ data }: LeadDashboardProps) {
+export function LeadDashboard({ data: shippedData }: LeadDashboardProps) {
+    // With a query service the page ships without the lead list; it is fetched only if the service fails
+    const [data, setData] = useState<LeadData>(shippedData);
+    const [remoteFailed, setRemoteFailed] = useState(false);
+    const filterLocally = !LEAD_QUERY_URL || remoteFailed;
     const [searchTerm, setSearchTerm] = useState('');
     const [typeFilter, setTypeFilter] = useState('');
     const [priorityFilter, setPriorityFilter] = useState('');
@@ -56,19 +48,59 @@ export function LeadDashboard({ data }: LeadDashboardProps) {
     const [selectedOrg, setSelectedOrg] = useState<string | null>(null);
     const [currentPage, setCurrentPage] = useState(1);
     const itemsPerPage = 50;
+    const [remoteResult, setRemoteResult] = useState<LeadQueryResult | null>(null);
+
+    // With a lead query service configured, filtering, sorting and paging happen server-side
+    useEffect(() => {
+        if (filterLocally) return;
+        const controller = new AbortController();
+        queryLeads({
+            search: searchTerm,
+            type: typeFilter,
+            priority: priorityFilter,
+            recency: recencyFilter,
+            contact: contactFilter,
+            sort: sortBy as LeadQueryParams['sort'],
+            page: currentPage,
+            per_page: itemsPerPage,
+        }, controller.signal)
+            .then(setRemoteResult)
+            .catch(() => {
+                if (controller.signal.aborted) return;
+                // Service unreachable: fall back to client-side filtering
+                setRemoteResult(null);
+                setRemoteFailed(true);
+            });
+        return () => controller.abort();
+    }, [filterLocally, searchTerm, typeFilter, priorityFilter, recencyFilter, contactFilter, sortBy, currentPage]);
+
+    useEffect(() => {
+        if (remoteFailed && data.leads.length === 0) {
+            loadLeadData().then(full => setData(full as LeadData));
+        }
+    }, [remoteFailed, data.leads.length]);
 
     // Calculate stats
-    const stats = useMemo(() => ({
+    const stats = useMemo(() => remoteResult ? remoteResult.stats : ({
         totalLeads: data.leads.length,
-        hotLeads: data.leads.filter(l => l.priority === 'Hot').length,
-        warmLeads: data.leads.filter(l => l.priority === 'Warm').length,
+        hotLeads: data.index ? facetCount(data.index, 'priority', 'Hot') : data.leads.filter(l => l.priority === 'Hot').length,
+        warmLeads: data.index ? facetCount(data.index, 'priority', 'Warm') : data.leads.filter(l => l.priority === 'Warm').length,
         totalAlgorithms: data.total_algorithms || 0,
         totalImpactful: data.leads.reduce((sum, l) => sum + (l.impactful_count || 0), 0),
-    }), [data]);
+    }), [data, remoteResult]);
 
     // Filter and sort leads
     const filteredLeads = useMemo(() => {
-        let result = [...data.leads];
+        if (!filterLocally) return [];
+        // Shipped index: intersect facet postings and walk the precomputed order instead of filtering and sorting
+        const order = data.index?.sort?.[sortBy];
+        const useIndex = !!data.index && (!!order || sortBy === 'name');
+        let result = useIndex
+            ? selectRows(order, data.leads.length, facetMask(data.index!, data.leads.length, {
+                type: typeFilter,
+                priority: priorityFilter,
+            })).map(row => data.leads[row])
+            : [...data.leads];
 
         if (searchTerm) {
             result = result.filter(l =>
@@ -76,11 +108,11 @@ export function LeadDashboard({ data }: LeadDashboardProps) {
             );
         }
 
-        if (typeFilter) {
+        if (typeFilter && !useIndex) {
             result = result.filter(l => l.type === typeFilter);
         }
 
-        if (priorityFilter) {
+        if (priorityFilter && !useIndex) {
             result = result.filter(l => l.priority === priorityFilter);
         }
 
@@ -105,21 +137,22 @@ export function LeadDashboard({ data }: LeadDashboardProps) {
         // Contact filter
         if (contactFilter) {
             result = result.filter(l => {
-                const orgContact = contactResearch.contacts[l.name];
-                const namedContacts = orgContact?.contacts.filter(c => c.name) || [];
-                const hasEmail = !!orgContact?.primary_email;
-                const hasLinkedIn = namedContacts.some(c => c.linkedin);
+                const summary = l.entity_id ? contactSummaries[l.entity_id] : undefined;
+                const named = summary?.named || 0;
+                const hasEmail = !!summary?.primary_email;
 
                 switch (contactFilter) {
-                    case 'named': return namedContacts.length > 0;
-                    case 'email-only': return hasEmail && namedContacts.length === 0;
-                    case 'linkedin': return hasLinkedIn;
-                    case 'none': return !hasEmail && namedContacts.length === 0;
+                    case 'named': return named > 0;
+                    case 'email-only': return hasEmail && named === 0;
+                    case 'linkedin': return !!summary?.linkedin;
+                    case 'none': return !hasEmail && named === 0;
                     default: return true;
                 }
             });
         }
 
+        if (order) return result;
+
         result.sort((a, b) => {
             switch (sortBy) {
                 case 'lead_score': return b.lead_score - a.lead_score;
@@ -135,7 +168,9 @@ export function LeadDashboard({ data }: LeadDashboardProps) {
         });
 
         return result;
-    }, [data.leads, searchTerm, typeFilter, priorityFilter, recencyFilter, contactFilter, sortBy]);
+    }, [filterLocally, data.leads, data.index, searchTerm, typeFilter, priorityFilter, recencyFilter, contactFilter, sortBy]);
+
+    const resultCount = remoteResult ? remoteResult.total : filteredLeads.length;
 
     const formatDate = (dateStr: string | null) => {
         if (!dateStr) return '-';
@@ -246,7 +281,7 @@ export function LeadDashboard({ data }: LeadDashboardProps) {
                     <option value="name">Naam</option>
                 </select>
                 <span className="text-sm text-slate-500">
-                    {filteredLeads.length} resultaten
+                    {resultCount} resultaten
                 </span>
             </div>
 
@@ -267,14 +302,15 @@ export function LeadDashboard({ data }: LeadDashboardProps) {
                     </thead>
                     <tbody>
                         {(() => {
-                            const totalPages = Math.ceil(filteredLeads.length / itemsPerPage);
                             const startIndex = (currentPage - 1) * itemsPerPage;
-                            const pagedLeads = filteredLeads.slice(startIndex, startIndex + itemsPerPage);
+                            const pagedLeads: Array<Lead & { contact_summary?: LeadQueryResult['leads'][number]['contact_summary'] }> =
+                                remoteResult ? remoteResult.leads : filteredLeads.slice(startIndex, startIndex + itemsPerPage);
                             return pagedLeads.map((lead) => {
-                                const orgContact = contactResearch.contacts[lead.name];
-                                const namedContacts = orgContact?.contacts.filter(c => c.name) || [];
-                                const primaryContact = namedContacts[0];
-                                const linkedInContact = namedContacts.find(c => c.linkedin);
+                                const summary: ContactSummary = lead.contact_summary
+                                    ? summarizeContacts({ primary_email: lead.contact_summary.primary_email, contacts: lead.contact_summary.named_contacts })
+                                    : (lead.entity_id && contactSummaries[lead.entity_id]) || {};
+                                const primaryEmail = summary.primary_email;
+                                const namedCount = summary.named || 0;
 
                                 return (
                                     <tr
@@ -292,16 +328,16 @@ export function LeadDashboard({ data }: LeadDashboardProps) {
                                         </td>
                                         {/* Contactpersoon Column */}
                                         <td className="px-4 py-2">
-                                            {primaryContact ? (
+                                            {namedCount > 0 ? (
                                                 <div>
-                                                    <div className="text-sm font-medium text-slate-700 truncate" title={primaryContact.name || ''}>
-                                                        {primaryContact.name}
+                                                    <div className="text-sm font-medium text-slate-700 truncate" title={summary.name || ''}>
+                                                        {summary.name}
                                                     </div>
-                                                    <div className="text-xs text-slate-400 truncate" title={primaryContact.role}>
-                                                        {primaryContact.role}
+                                                    <div className="text-xs text-slate-400 truncate" title={summary.role}>
+                                                        {summary.role}
                                                     </div>
-                                                    {namedContacts.length > 1 && (
-                                                        <span className="inline-flex items-center px-1.5 py-0.5 rounded-full text-xs font-medium bg-slate-100 text-slate-600">+{namedContacts.length - 1}</span>
+                                                    {namedCount > 1 && (
+                                                        <span className="inline-flex items-center px-1.5 py-0.5 rounded-full text-xs font-medium bg-slate-100 text-slate-600">+{namedCount - 1}</span>
                                                     )}
                                                 </div>
                                             ) : (
@@ -310,13 +346,13 @@ export function LeadDashboard({ data }: LeadDashboardProps) {
                                         </td>
                                         {/* Email Column */}
                                         <td className="px-4 py-2">
-                                            {orgContact?.primary_email ? (
+                                            {primaryEmail ? (
                                                 <a
-                                                    href={`mailto:${orgContact.primary_email}`}
+                                                    href={`mailto:${primaryEmail}`}
                                                     className="text-sm text-blue-600 hover:underline block truncate"
-                                                    title={orgContact.primary_email}
+                                                    title={primaryEmail}
                                                 >
-                                                    {orgContact.primary_email}
+                                                    {primaryEmail}
                                                 </a>
                                             ) : (
                                                 <span className="text-xs text-slate-300">—</span>
@@ -324,13 +360,13 @@ export function LeadDashboard({ data }: LeadDashboardProps) {
                                         </td>
                                         {/* LinkedIn Column */}
                                         <td className="px-4 py-2 text-center">
-                                            {linkedInContact?.linkedin ? (
+                                            {summary.linkedin ? (
                                                 <a
-                                                    href={linkedInContact.linkedin}
+                                                    href={summary.linkedin}
                                                     target="_blank"
                                                     rel="noopener noreferrer"
                                                     className="inline-flex items-center justify-center text-blue-600 hover:text-blue-800"
-                                                    title={`${linkedInContact.name} - LinkedIn`}
+                                                    title={`${summary.linkedin_name} - LinkedIn`}
                                                 >
                                                     <svg className="w-5 h-5" fill="currentColor" viewBox="0 0 24 24">
                                                         <path d="M20.447 20.452h-3.554v-5.569c0-1.328-.027-3.037-1.852-3.037-1.853 0-2.136 1.445-2.136 2.939v5.667H9.351V9h3.414v1.561h.046c.477-.9 1.637-1.85 3.37-1.85 3.601 0 4.267 2.37 4.267 5.455v6.286zM5.337 7.433c-1.144 0-2.063-.926-2.063-2.065 0-1.138.92-2.063 2.063-2.063 1.14 0 2.064.925 2.064 2.063 0 1.139-.925 2.065-2.064 2.065zm1.782 13.019H3.555V9h3.564v11.452zM22.225 0H1.771C.792 0 0 .774 0 1.729v20.542C0 23.227.792 24 1.771 24h20.451C23.2 24 24 23.227 24 22.271V1.729C24 .774 23.2 0 22.222 0h.003z" />
@@ -367,10 +403,10 @@ export function LeadDashboard({ data }: LeadDashboardProps) {
                 </table>
 
                 {/* Pagination Controls */}
-                {filteredLeads.length > itemsPerPage && (
+                {resultCount > itemsPerPage && (
                     <div className="border-t border-slate-200 px-4 py-3 bg-slate-50 flex items-center justify-between">
                         <span className="text-sm text-slate-500">
-                            Pagina {currentPage} van {Math.ceil(filteredLeads.length / itemsPerPage)} ({filteredLeads.length} resultaten)
+                            Pagina {currentPage} van {Math.ceil(resultCount / itemsPerPage)} ({resultCount} resultaten)
                         </span>
                         <div className="flex gap-2">
                             <button
@@ -388,15 +424,15 @@ export function LeadDashboard({ data }: LeadDashboardProps) {
                                 ‹ Vorige
                             </button>
                             <button
-                                onClick={() => setCurrentPage(Math.min(Math.ceil(filteredLeads.length / itemsPerPage), currentPage + 1))}
-                                disabled={currentPage === Math.ceil(filteredLeads.length / itemsPerPage)}
+                                onClick={() => setCurrentPage(Math.min(Math.ceil(resultCount / itemsPerPage), currentPage + 1))}
+                                disabled={currentPage === Math.ceil(resultCount / itemsPerPage)}
                                 className="px-3 py-1 text-sm bg-white border border-slate-200 rounded hover:bg-slate-100 disabled:opacity-50 disabled:cursor-not-allowed"
                             >
                                 Volgende ›
                             </button>
                             <button
-                                onClick={() => setCurrentPage(Math.ceil(filteredLeads.length / itemsPerPage))}
-                                disabled={currentPage === Math.ceil(filteredLeads.length / itemsPerPage)}
+                                onClick={() => setCurrentPage(Math.ceil(resultCount / itemsPerPage))}
+                                disabled={currentPage === Math.ceil(resultCount / itemsPerPage)}
                                 className="px-3 py-1 text-sm bg-white border border-slate-200 rounded hover:bg-slate-100 disabled:opacity-50 disabled:cursor-not-allowed"
                             >
                                 »
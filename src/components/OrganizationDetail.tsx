@@ -2,26 +2,9 @@
 
 import { useState, useMemo, useEffect } from 'react';
 import organizationsData from '@/organizations.json';
-import contactResearchData from '../../exports/contact-research.json';
 import { ContactEditor } from './ContactEditor';
 import { getOrgCustomContacts, OrganizationContacts } from '@/lib/contactManagement';
-
-interface ContactPerson {
-    role: string;
-    name: string | null;
-    email: string | null;
-    linkedin: string | null;
-    notes: string | null;
-}
-
-interface OrgContactData {
-    primary_email: string | null;
-    contacts: ContactPerson[];
-    notes?: string;
-    phone?: string;
-}
-
-const contactResearch = contactResearchData as { contacts: Record<string, OrgContactData> };
+import { useContactResearch } from '@/lib/contactResearch';
 
 interface Algorithm {
     name: string;
@@ -39,6 +22,7 @@ interface Algorithm {
 
 interface Organization {
     name: string;
+    entity_id?: string | null;
     algorithm_count: number;
     impactful_count: number;
     high_risk_count: number;
@@ -63,6 +47,8 @@ export function OrganizationDetail({ orgName, onClose }: OrganizationDetailProps
     const [statusFilter, setStatusFilter] = useState('');
     const [showContactEditor, setShowContactEditor] = useState(false);
     const [customContacts, setCustomContacts] = useState<OrganizationContacts | null>(null);
+    // Full contact research is a separate chunk, fetched when a detail view first opens
+    const research = useContactResearch(data.organizations[orgName]?.entity_id);
 
     // Load custom contacts on mount and when editor closes
     useEffect(() => {
@@ -378,38 +364,38 @@ export function OrganizationDetail({ orgName, onClose }: OrganizationDetailProps
                                 </div>
                             )}
 
-                            {contactResearch.contacts[orgName] ? (
+                            {research ? (
                                 <>
                                     {/* Primary Contact Info */}
                                     <div className="bg-gradient-to-r from-indigo-50 to-blue-50 rounded-lg p-4">
                                         <h3 className="font-semibold text-slate-800 mb-3">📧 Contact Informatie</h3>
                                         <div className="space-y-2">
-                                            {contactResearch.contacts[orgName].primary_email && (
+                                            {research.primary_email && (
                                                 <div className="flex items-center gap-2">
                                                     <span className="text-sm text-slate-500">Email:</span>
                                                     <a
-                                                        href={`mailto:${contactResearch.contacts[orgName].primary_email}`}
+                                                        href={`mailto:${research.primary_email}`}
                                                         className="text-blue-600 hover:underline"
                                                     >
-                                                        {contactResearch.contacts[orgName].primary_email}
+                                                        {research.primary_email}
                                                     </a>
                                                 </div>
                                             )}
-                                            {contactResearch.contacts[orgName].phone && (
+                                            {research.phone && (
                                                 <div className="flex items-center gap-2">
                                                     <span className="text-sm text-slate-500">Telefoon:</span>
-                                                    <span className="text-slate-700">{contactResearch.contacts[orgName].phone}</span>
+                                                    <span className="text-slate-700">{research.phone}</span>
                                                 </div>
                                             )}
                                         </div>
                                     </div>
 
                                     {/* Contact Persons */}
-                                    {contactResearch.contacts[orgName].contacts.length > 0 ? (
+                                    {research.contacts.length > 0 ? (
                                         <div>
                                             <h3 className="font-semibold text-slate-800 mb-3">👤 Contactpersonen (onderzoek)</h3>
                                             <div className="grid gap-3 md:grid-cols-2">
-                                                {contactResearch.contacts[orgName].contacts.map((contact, idx) => (
+                                                {research.contacts.map((contact, idx) => (
                                                     <div key={idx} className="bg-white border border-slate-200 rounded-lg p-4 shadow-sm">
                                                         <div className="flex items-start justify-between">
                                                             <div className="flex-1">
@@ -452,9 +438,9 @@ export function OrganizationDetail({ orgName, onClose }: OrganizationDetailProps
                                         </div>
                                     )}
 
-                                    {contactResearch.contacts[orgName].notes && (
+                                    {research.notes && (
                                         <div className="bg-amber-50 rounded-lg p-4 text-sm text-amber-800">
-                                            💡 {contactResearch.contacts[orgName].notes}
+                                            💡 {research.notes}
                                         </div>
                                     )}
                                 </>
@@ -2,6 +2,7 @@
 
 import { useState, useMemo } from 'react';
 import tenderData from '@/tenders.json';
+import { DatasetIndex, facetMask, selectRows } from '@/lib/datasetIndex';
 
 interface Tender {
     'ID publicatie': number;
@@ -13,9 +14,10 @@ interface Tender {
     'URL TenderNed': string;
     category: 'AI' | 'Governance' | 'ICT';
     year: number;
+    publications?: { id: number; date: string | null; type?: string }[];
 }
 
-const data = tenderData as { stats: any; tenders: Tender[] };
+const data = tenderData as { stats: any; tenders: Tender[]; index?: DatasetIndex };
 
 export function TenderExplorer() {
     const [searchTerm, setSearchTerm] = useState('');
@@ -25,22 +27,33 @@ export function TenderExplorer() {
     const [currentPage, setCurrentPage] = useState(1);
     const itemsPerPage = 25;
 
-    // Get unique values for filters
+    // Get unique values for filters (facet keys of the shipped index when present)
     const years = useMemo(() =>
-        [...new Set(data.tenders.map(t => t.year))].sort((a, b) => b - a),
+        (data.index
+            ? Object.keys(data.index.facets.year ?? {}).map(Number)
+            : [...new Set(data.tenders.map(t => t.year))]
+        ).sort((a, b) => b - a),
         []
     );
 
     const organizations = useMemo(() =>
-        [...new Set(data.tenders.map(t => t['Naam Aanbestedende dienst']))]
-            .filter(Boolean)
-            .sort(),
+        (data.index
+            ? Object.keys(data.index.facets.organization ?? {})
+            : [...new Set(data.tenders.map(t => t['Naam Aanbestedende dienst']))].filter(Boolean)
+        ).sort(),
         []
     );
 
     // Filter tenders
     const filteredTenders = useMemo(() => {
-        let result = [...data.tenders];
+        // Shipped index: intersect facet postings instead of scanning every tender per filter
+        let result = data.index
+            ? selectRows(undefined, data.tenders.length, facetMask(data.index, data.tenders.length, {
+                category: categoryFilter,
+                year: yearFilter,
+                organization: orgFilter,
+            })).map(row => data.tenders[row])
+            : [...data.tenders];
 
         if (searchTerm) {
             const term = searchTerm.toLowerCase();
@@ -51,6 +64,8 @@ export function TenderExplorer() {
             );
         }
 
+        if (data.index) return result;
+
         if (categoryFilter) {
             result = result.filter(t => t.category === categoryFilter);
         }
@@ -2,7 +2,6 @@
 
 import { useState, useEffect } from 'react';
 import topLeadsData from '../../exports/top-20-leads.json';
-import contactResearchData from '../../exports/contact-research.json';
 import { OrganizationDetail } from './OrganizationDetail';
 import {
     LeadStatus,
@@ -11,9 +10,11 @@ import {
     saveLeadTracking,
     generateEmailTemplate
 } from '@/lib/leadTracking';
+import { contactSummaries, useContactResearch } from '@/lib/contactResearch';
 
 interface TopLead {
     name: string;
+    entity_id?: string | null;
     type: string;
     algorithm_count: number;
     impactful_count: number;
@@ -42,31 +43,16 @@ interface TopLeadsData {
     strategic_targets: TopLead[];
 }
 
-interface ContactPerson {
-    role: string;
-    name: string | null;
-    email: string | null;
-    linkedin: string | null;
-    notes: string | null;
-}
-
-interface OrgContactData {
-    primary_email: string | null;
-    contacts: ContactPerson[];
-    notes?: string;
-}
-
-interface ContactResearchData {
-    contacts: Record<string, OrgContactData>;
-}
-
 const data = topLeadsData as unknown as TopLeadsData;
-const contactResearch = contactResearchData as unknown as ContactResearchData;
 
 export function Top20Dashboard() {
     const [selectedOrg, setSelectedOrg] = useState<string | null>(null);
     const [activeTab, setActiveTab] = useState<'quick_wins' | 'strategic'>('quick_wins');
     const [expandedLead, setExpandedLead] = useState<string | null>(null);
+    // Full research (notes, all contacts) only for the expanded lead
+    const expandedContacts = useContactResearch(
+        [...data.quick_wins, ...data.strategic_targets].find(lead => lead.name === expandedLead)?.entity_id
+    );
     const [trackingData, setTrackingData] = useState<Record<string, { status: LeadStatus; notes: string }>>({});
     const [editingNotes, setEditingNotes] = useState<string | null>(null);
     const [notesText, setNotesText] = useState('');
@@ -262,10 +248,7 @@ export function Top20Dashboard() {
                         {leads.map((lead, index) => {
                             const status = getLeadStatus(lead.name);
                             const config = statusConfig[status];
-                            const orgContact = contactResearch.contacts[lead.name];
-                            const namedContacts = orgContact?.contacts.filter(c => c.name) || [];
-                            const primaryContact = namedContacts[0];
-                            const linkedInContact = namedContacts.find(c => c.linkedin);
+                            const summary = (lead.entity_id && contactSummaries[lead.entity_id]) || {};
 
                             return (
                                 <>
@@ -281,13 +264,13 @@ export function Top20Dashboard() {
                                         </td>
                                         {/* Contactpersoon Column */}
                                         <td className="px-4 py-2">
-                                            {primaryContact ? (
+                                            {summary.named ? (
                                                 <div>
-                                                    <div className="text-sm font-medium text-slate-700 truncate" title={primaryContact.name || ''}>
-                                                        {primaryContact.name}
+                                                    <div className="text-sm font-medium text-slate-700 truncate" title={summary.name || ''}>
+                                                        {summary.name}
                                                     </div>
-                                                    <div className="text-xs text-slate-400 truncate" title={primaryContact.role}>
-                                                        {primaryContact.role}
+                                                    <div className="text-xs text-slate-400 truncate" title={summary.role}>
+                                                        {summary.role}
                                                     </div>
                                                 </div>
                                             ) : (
@@ -296,14 +279,14 @@ export function Top20Dashboard() {
                                         </td>
                                         {/* Email Column */}
                                         <td className="px-4 py-2">
-                                            {orgContact?.primary_email ? (
+                                            {summary.primary_email ? (
                                                 <a
-                                                    href={`mailto:${orgContact.primary_email}`}
+                                                    href={`mailto:${summary.primary_email}`}
                                                     className="text-sm text-blue-600 hover:underline block truncate"
-                                                    title={orgContact.primary_email}
+                                                    title={summary.primary_email}
                                                     onClick={(e) => e.stopPropagation()}
                                                 >
-                                                    {orgContact.primary_email}
+                                                    {summary.primary_email}
                                                 </a>
                                             ) : (
                                                 <span className="text-xs text-slate-300">—</span>
@@ -311,13 +294,13 @@ export function Top20Dashboard() {
                                         </td>
                                         {/* LinkedIn Column */}
                                         <td className="px-4 py-2 text-center">
-                                            {linkedInContact?.linkedin ? (
+                                            {summary.linkedin ? (
                                                 <a
-                                                    href={linkedInContact.linkedin}
+                                                    href={summary.linkedin}
                                                     target="_blank"
                                                     rel="noopener noreferrer"
                                                     className="inline-flex items-center justify-center text-blue-600 hover:text-blue-800"
-                                                    title={`${linkedInContact.name} - LinkedIn`}
+                                                    title={`${summary.linkedin_name} - LinkedIn`}
                                                     onClick={(e) => e.stopPropagation()}
                                                 >
                                                     <svg className="w-5 h-5" fill="currentColor" viewBox="0 0 24 24">
@@ -462,11 +445,11 @@ export function Top20Dashboard() {
                                                 </div>
 
                                                 {/* Contactpersonen Section */}
-                                                {contactResearch.contacts[lead.name]?.contacts && contactResearch.contacts[lead.name].contacts.length > 0 && (
+                                                {expandedContacts?.contacts && expandedContacts.contacts.length > 0 && (
                                                     <div className="mt-4 pt-4 border-t border-slate-200">
                                                         <h4 className="text-xs font-medium text-slate-500 uppercase mb-3">👤 Contactpersonen (onderzoek)</h4>
                                                         <div className="grid gap-2 md:grid-cols-2">
-                                                            {contactResearch.contacts[lead.name].contacts.map((contact, idx) => (
+                                                            {expandedContacts.contacts.map((contact, idx) => (
                                                                 <div key={idx} className="bg-white p-3 rounded-lg border border-slate-200">
                                                                     <div className="flex items-start justify-between">
                                                                         <div>
@@ -0,0 +1,136 @@
+// Contact research - compact per-organization summary for lead rows, full research loaded on demand
+
+import { useEffect, useState } from 'react';
+import contactSummaryData from '../../exports/contact-summary.json';
+
+export interface ContactPerson {
+    role: string;
+    name: string | null;
+    email: string | null;
+    linkedin: string | null;
+    notes: string | null;
+}
+
+export interface OrgContactData {
+    entity_id?: string;
+    primary_email: string | null;
+    contacts: ContactPerson[];
+    notes?: string;
+    phone?: string;
+    last_checked_online?: string;
+}
+
+// Written by contact_summary.py; empty fields are omitted
+export interface ContactSummary {
+    primary_email?: string;
+    named?: number;
+    name?: string;
+    role?: string;
+    linkedin?: string;
+    linkedin_name?: string;
+    last_checked?: string;
+}
+
+// Keyed by entity_id, like the leads and organizations they are joined to
+export const contactSummaries = (contactSummaryData as { contacts: Record<string, ContactSummary> }).contacts;
+
+// Role priority of contact_candidates.ROLE_RULES, best first
+const ROLE_NAMES = [
+    'Functionaris Gegevensbescherming (FG)',
+    'CISO',
+    'CIO',
+    'Algoritmeregister contact',
+    'Data/Informatiemanagement',
+    'Algemeen contact',
+];
+
+// contact_candidates.ROLE_KEYWORDS: job titles of the target roles, matched as whole words
+const ROLE_KEYWORDS: Record<string, string[]> = {
+    'Functionaris Gegevensbescherming (FG)': [
+        'functionaris gegevensbescherming', 'gegevensbescherming', 'privacy officer', 'privacyfunctionaris', 'fg', 'dpo',
+    ],
+    'CISO': ['ciso', 'informatiebeveiliging', 'security officer'],
+    'CIO': ['cio', 'chief information officer', 'informatiemanager'],
+};
+
+const TARGET_ROLE_PATTERNS: Array<[string, RegExp]> = Object.entries(ROLE_KEYWORDS).map(([role, keywords]) => [
+    role,
+    new RegExp(`\\b(${keywords.map(k => k.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')).join('|')})\\b`, 'i'),
+]);
+
+// ROLE_RULES of the other roles, matched against the role written like an email local-part
+const OTHER_ROLE_RULES: Array<[number, RegExp]> = [
+    [3, /algoritme/],
+    [4, /(data|informatie|informatiemanagement)/],
+    [5, /(info|contact|gemeente|secretariaat|postbus)/],
+];
+
+// Same as contact_candidates.target_role: the FG/CISO/CIO role a free-text role stands for
+export function targetRole(role: string | null | undefined): string | null {
+    if (!role) return null;
+    if (Object.hasOwn(ROLE_KEYWORDS, role)) return role;
+    return TARGET_ROLE_PATTERNS.find(([, pattern]) => pattern.test(role))?.[0] ?? null;
+}
+
+// Same as contact_candidates.role_rank: target roles by title keyword, other roles by local-part rules
+export function roleRank(role: string | null | undefined): number {
+    const target = targetRole(role);
+    if (target) return ROLE_NAMES.indexOf(target);
+    const local = (role ?? '').toLowerCase().replace(/[^a-z0-9]+/g, '.');
+    const rule = OTHER_ROLE_RULES.find(([, pattern]) => pattern.test(local));
+    return rule ? rule[0] : ROLE_NAMES.length;
+}
+
+// Same projection as contact_summary.py, for entries that arrive in full (query server)
+export function summarizeContacts(entry: { primary_email: string | null; contacts: ContactPerson[] }): ContactSummary {
+    const named = entry.contacts.filter(c => c.name);
+    // Highest role priority wins; research order within a role
+    const best = named.reduce<ContactPerson | undefined>(
+        (top, c) => (!top || roleRank(c.role) < roleRank(top.role) ? c : top), undefined
+    ) ?? entry.contacts[0];
+    const linked = named.find(c => c.linkedin);
+    return {
+        primary_email: entry.primary_email ?? undefined,
+        named: named.length,
+        name: best?.name ?? undefined,
+        role: best?.role,
+        linkedin: linked?.linkedin ?? undefined,
+        linkedin_name: linked?.name ?? undefined,
+    };
+}
+
+let research: Promise<Record<string, OrgContactData>> | null = null;
+
+// Full exports/contact-research.json as a separate chunk, fetched once on first use and indexed by
+// entity_id (the file itself is keyed by organization name for the maintenance scripts)
+export function loadContactResearch(): Promise<Record<string, OrgContactData>> {
+    if (!research) {
+        research = import('../../exports/contact-research.json').then(module => {
+            const contacts = (module.default as unknown as { contacts: Record<string, OrgContactData> }).contacts;
+            const byEntity: Record<string, OrgContactData> = {};
+            for (const entry of Object.values(contacts)) {
+                if (entry.entity_id) byEntity[entry.entity_id] = entry;
+            }
+            return byEntity;
+        });
+    }
+    return research;
+}
+
+// Full research entry of an organization; undefined while loading or when there is none
+export function useContactResearch(entityId: string | null | undefined): OrgContactData | undefined {
+    const [entry, setEntry] = useState<OrgContactData | undefined>(undefined);
+
+    useEffect(() => {
+        let active = true;
+        setEntry(undefined);
+        if (entityId) {
+            loadContactResearch().then(contacts => {
+                if (active) setEntry(contacts[entityId]);
+            });
+        }
+        return () => { active = false; };
+    }, [entityId]);
+
+    return entry;
+}
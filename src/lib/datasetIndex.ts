@@ -0,0 +1,49 @@
+// Precomputed sort orders and facet postings shipped with data.json and tenders.json (dataset_index.py)
+
+export interface DatasetIndex {
+    // Row positions per sort key, best first
+    sort?: Record<string, number[]>;
+    // Row positions per facet value; counts are the posting lengths
+    facets: Record<string, Record<string, number[]>>;
+}
+
+// Number of rows with a facet value (0 when absent)
+export function facetCount(index: DatasetIndex, facet: string, value: string): number {
+    return index.facets[facet]?.[value]?.length ?? 0;
+}
+
+// Rows matching every selected facet value as a membership mask; null when nothing is selected
+export function facetMask(index: DatasetIndex, size: number, selection: Record<string, string>): Uint8Array | null {
+    const active = Object.entries(selection).filter(([, value]) => value);
+    if (active.length === 0) return null;
+    // Count matched facets per row; a row survives if it matched all of them in turn
+    const matched = new Uint8Array(size);
+    active.forEach(([facet, value], step) => {
+        for (const row of index.facets[facet]?.[value] ?? []) {
+            if (matched[row] === step) matched[row] = step + 1;
+        }
+    });
+    for (let row = 0; row < size; row++) {
+        matched[row] = matched[row] === active.length ? 1 : 0;
+    }
+    return matched;
+}
+
+// Row positions in a precomputed order (natural order without one), limited to the mask and predicate
+export function selectRows(
+    order: number[] | undefined,
+    size: number,
+    mask: Uint8Array | null,
+    keep?: (row: number) => boolean,
+): number[] {
+    const rows: number[] = [];
+    const visit = (row: number) => {
+        if ((mask === null || mask[row]) && (!keep || keep(row))) rows.push(row);
+    };
+    if (order) {
+        order.forEach(visit);
+    } else {
+        for (let row = 0; row < size; row++) visit(row);
+    }
+    return rows;
+}
@@ -0,0 +1,62 @@
+// Lead query client - talks to scripts/lead-query-server.py for server-side filtering and paging
+
+import type { Lead } from '@/types/lead';
+
+export interface LeadQueryParams {
+    search?: string;
+    type?: string;
+    priority?: string;
+    recency?: string;
+    contact?: string;
+    sort?: 'lead_score' | 'algorithm_count' | 'impactful_count' | 'latest_date' | 'name';
+    page?: number;
+    per_page?: number;
+}
+
+export interface LeadContactSummary {
+    primary_email: string | null;
+    named_contacts: Array<{
+        role: string;
+        name: string | null;
+        email: string | null;
+        linkedin: string | null;
+        notes: string | null;
+    }>;
+}
+
+export interface LeadQueryResult {
+    total: number;
+    page: number;
+    per_page: number;
+    sort: string;
+    stats: {
+        totalLeads: number;
+        hotLeads: number;
+        warmLeads: number;
+        totalAlgorithms: number;
+        totalImpactful: number;
+    };
+    // Under its own key: leads in data.json may carry an unrelated `contact` from enrich-contacts.py
+    leads: Array<Lead & { contact_summary: LeadContactSummary }>;
+}
+
+// Base URL of the local query service; unset means the dashboard filters client-side
+export const LEAD_QUERY_URL = process.env.NEXT_PUBLIC_LEAD_QUERY_URL || '';
+
+// Fetch one page of leads matching the filters
+export async function queryLeads(params: LeadQueryParams, signal?: AbortSignal): Promise<LeadQueryResult> {
+    const query = new URLSearchParams();
+    Object.entries(params).forEach(([key, value]) => {
+        if (value !== undefined && value !== '') query.set(key, String(value));
+    });
+    const response = await fetch(`${LEAD_QUERY_URL}/leads?${query.toString()}`, { signal });
+    if (!response.ok) {
+        throw new Error(`Lead query failed: ${response.status}`);
+    }
+    return response.json();
+}
+
+// Full lead list as a separate chunk, for client-side filtering when the service is unreachable
+export async function loadLeadData(): Promise<unknown> {
+    return (await import('@/data.json')).default;
+}
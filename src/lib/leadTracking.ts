@@ -1,6 +1,7 @@
 'use client';
 
 import { useState, useEffect } from 'react';
+import emailTemplates from '@/email-templates.json';
 
 // Lead tracking statuses
 export type LeadStatus = 'new' | 'contacted' | 'replied' | 'meeting' | 'proposal' | 'won' | 'lost';
@@ -75,6 +76,74 @@ export function useLeadTracking(leadName: string) {
     return { tracking, updateTracking };
 }
 
+// Email templates - shared with scripts/outreach-dispatch.py via src/email-templates.json
+type TemplateNode = string | { field: string } | { section: string; children: TemplateNode[] };
+
+const TAG_RE = /\{\{([#/]?)(\w+)\}\}/g;
+const compiledTemplates = new Map<string, TemplateNode[]>();
+
+// Parse a template once into text, field and section nodes
+function compileTemplate(source: string): TemplateNode[] {
+    const cached = compiledTemplates.get(source);
+    if (cached) return cached;
+
+    const root: TemplateNode[] = [];
+    const stack: Array<{ section: string; children: TemplateNode[] }> = [];
+    let current = root;
+    let last = 0;
+    for (const match of source.matchAll(TAG_RE)) {
+        const [tag, kind, name] = match;
+        const index = match.index ?? 0;
+        if (index > last) current.push(source.slice(last, index));
+        last = index + tag.length;
+        if (kind === '#') {
+            const section = { section: name, children: [] as TemplateNode[] };
+            current.push(section);
+            stack.push(section);
+            current = section.children;
+        } else if (kind === '/') {
+            if (stack.pop()?.section !== name) throw new Error(`Unbalanced template section: ${name}`);
+            current = stack.length ? stack[stack.length - 1].children : root;
+        } else {
+            current.push({ field: name });
+        }
+    }
+    if (stack.length) throw new Error(`Unclosed template section: ${stack[stack.length - 1].section}`);
+    if (last < source.length) current.push(source.slice(last));
+
+    compiledTemplates.set(source, root);
+    return root;
+}
+
+function renderNodes(nodes: TemplateNode[], context: Record<string, unknown>): string {
+    return nodes.map(node => {
+        if (typeof node === 'string') return node;
+        if ('field' in node) return String(context[node.field] ?? '');
+        return context[node.section] ? renderNodes(node.children, context) : '';
+    }).join('');
+}
+
+export function renderTemplate(source: string, context: Record<string, unknown>): string {
+    return renderNodes(compileTemplate(source), context);
+}
+
+// Template fields and flags for a lead
+export function emailTemplateContext(lead: {
+    name: string;
+    algorithm_count: number;
+    impactful_count: number;
+    has_iama: boolean;
+}): Record<string, unknown> {
+    return {
+        name: lead.name,
+        algorithm_count: lead.algorithm_count,
+        impactful_count: lead.impactful_count,
+        plural: lead.algorithm_count > 1,
+        has_impactful: lead.impactful_count > 0,
+        missing_iama: !lead.has_iama && lead.impactful_count > 0,
+    };
+}
+
 // Email template generator
 export function generateEmailTemplate(lead: {
     name: string;
@@ -82,26 +151,11 @@ export function generateEmailTemplate(lead: {
     impactful_count: number;
     has_iama: boolean;
     contact_emails?: string[];
-}): { subject: string; body: string } {
-    const subject = `AI Governance ondersteuning voor ${lead.name}`;
-
-    const body = `Beste collega,
-
-Ik zag dat ${lead.name} ${lead.algorithm_count} algoritme${lead.algorithm_count > 1 ? 's' : ''} heeft gepubliceerd in het Algoritmeregister${lead.impactful_count > 0 ? `, waarvan ${lead.impactful_count} als impactvol aangemerkt` : ''}.
-
-${!lead.has_iama && lead.impactful_count > 0 ? `Ik merk dat er nog geen IAMA documentatie beschikbaar is. Een Impact Assessment Mensenrechten en Algoritmes (IAMA) is verplicht voor impactvolle algoritmes onder de EU AI Act die vanaf augustus 2025 van kracht wordt.
-
-` : ''}Wij van Algoritmehub helpen overheidsorganisaties met:
-• AI governance en compliance tooling
-• IAMA begeleiding en documentatie
-• Algoritmeregister management
-
-Zou u interesse hebben in een kort gesprek van 15 minuten om te bespreken hoe we ${lead.name} kunnen ondersteunen?
-
-Met vriendelijke groet,
-
-[Jouw naam]
-Algoritmehub`;
-
-    return { subject, body };
+}, templateId = 'intro'): { subject: string; body: string } {
+    const template = emailTemplates.templates[templateId as keyof typeof emailTemplates.templates];
+    const context = emailTemplateContext(lead);
+    return {
+        subject: renderTemplate(template.subject, context),
+        body: renderTemplate(template.body, context),
+    };
 }
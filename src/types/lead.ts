@@ -1,6 +1,9 @@
 // Lead data types - updated for Algoritmeregister 2026-01-02 format
+import type { DatasetIndex } from '@/lib/datasetIndex';
+
 export interface Lead {
     name: string;
+    entity_id?: string | null; // canonical organization id (src/organization-entities.json)
     type: string;
     algorithm_count: number;
     impactful_count: number;
@@ -9,6 +12,7 @@ export interface Lead {
     latest_date: string | null;
     first_date: string | null;
     lead_score: number;
+    score_breakdown?: Record<string, number>; // points per scoring component (sums to lead_score before capping)
     priority: string;
     categories: Record<string, number | undefined>;
     recent_algorithms: Array<{
@@ -28,6 +32,7 @@ export interface Lead {
     tender_governance?: number;
     tender_ict?: number;
     buying_signal?: number;
+    tender_value?: number;
     lead_score_original?: number;
 }
 
@@ -39,4 +44,6 @@ export interface LeadData {
     matched_with_tenderned?: number;
     enriched_with_signals?: number;
     leads: Lead[];
+    // Precomputed sort orders and facet postings (dataset_index.py)
+    index?: DatasetIndex;
 }
@@ -0,0 +1,106 @@
+// Shared TenderNed keyword taxonomy (Node counterpart of tender_taxonomy.py).
+// Compiles src/tender-taxonomy.json into one matcher and caches labels per publication ID.
+const crypto = require('crypto');
+const fs = require('fs');
+const path = require('path');
+
+const TAXONOMY_PATH = path.join(__dirname, 'src', 'tender-taxonomy.json');
+const GOLDEN_PATH = path.join(__dirname, 'src', 'tender-taxonomy.golden.json');
+const CACHE_PATH = path.join(__dirname, 'exports', 'tender-classifications.json');
+
+// Python's \w and \b are Unicode-aware; JavaScript's stay ASCII-only even with the u flag, so both are
+// spelled out with Unicode properties (letters, numbers and underscore, as Python's str.isalnum)
+const WORD = '\\p{L}\\p{N}_';
+
+function unicodeWords(pattern) {
+    let inClass = false;
+    return pattern.replace(/\\.|\[|\]/g, token => {
+        if (token === '[') inClass = true;
+        else if (token === ']') inClass = false;
+        else if (token === '\\w') return inClass ? WORD : `[${WORD}]`;
+        else if (token === '\\b' && !inClass) return `(?:(?<=[${WORD}])(?![${WORD}])|(?<![${WORD}])(?=[${WORD}]))`;
+        return token;
+    });
+}
+
+function compile(patterns) {
+    if (!patterns || patterns.length === 0) return null;
+    // u: Unicode case folding and code points, as Python's re.IGNORECASE on str
+    return new RegExp(patterns.map(p => `(?:${unicodeWords(p)})`).join('|'), 'iu');
+}
+
+function loadMatcher(taxonomyPath = TAXONOMY_PATH) {
+    const raw = fs.readFileSync(taxonomyPath);
+    const taxonomy = JSON.parse(raw.toString('utf-8'));
+    const categories = taxonomy.categories.map(c => c.name);
+    const exclude = compile(taxonomy.exclude);
+    const patterns = taxonomy.categories.map(c => compile(c.patterns));
+
+    // Labels are bitmasks in taxonomy category order, identical to the Python matcher
+    function labels(text) {
+        const textLower = String(text || '').toLowerCase();
+        if (exclude && exclude.test(textLower)) return 0;
+        let mask = 0;
+        patterns.forEach((pattern, index) => {
+            if (pattern.test(textLower)) mask |= 1 << index;
+        });
+        return mask;
+    }
+
+    return {
+        version: crypto.createHash('sha1').update(raw).digest('hex'),
+        searchFields: taxonomy.search_fields || [],
+        categories,
+        labels,
+        bit: category => 1 << categories.indexOf(category),
+        names: mask => categories.filter((_, index) => mask & (1 << index)),
+    };
+}
+
+function loadCache(matcher, cachePath = CACHE_PATH) {
+    if (!fs.existsSync(cachePath)) return {};
+    const cache = JSON.parse(fs.readFileSync(cachePath, 'utf-8'));
+    return cache.taxonomy === matcher.version ? cache.labels || {} : {};
+}
+
+function saveCache(matcher, labels, cachePath = CACHE_PATH) {
+    fs.mkdirSync(path.dirname(cachePath), { recursive: true });
+    fs.writeFileSync(cachePath, JSON.stringify({ taxonomy: matcher.version, labels }));
+}
+
+// Label a tender row, classifying only publication IDs missing from the cache
+function classifyTender(tender, matcher, cache) {
+    const id = tender['ID publicatie'];
+    const key = id === undefined || id === null ? null : String(id);
+    if (key !== null && key in cache) return cache[key];
+    const text = matcher.searchFields
+        .map(field => tender[field])
+        .filter(value => value !== undefined && value !== null)
+        .join(' ');
+    const mask = matcher.labels(text);
+    if (key !== null) cache[key] = mask;
+    return mask;
+}
+
+function checkGolden(matcher, goldenPath = GOLDEN_PATH) {
+    const { cases } = JSON.parse(fs.readFileSync(goldenPath, 'utf-8'));
+    let failures = 0;
+    cases.forEach(c => {
+        const got = matcher.names(matcher.labels(c.text));
+        if (JSON.stringify(got) !== JSON.stringify(c.categories)) {
+            failures++;
+            console.log(`❌ ${JSON.stringify(c.text)}: expected ${JSON.stringify(c.categories)}, got ${JSON.stringify(got)}`);
+        }
+    });
+    console.log(`✅ ${cases.length - failures}/${cases.length} golden cases pass`);
+    return failures;
+}
+
+module.exports = { loadMatcher, loadCache, saveCache, classifyTender, checkGolden };
+
+if (require.main === module) {
+    if (process.argv.includes('--check')) {
+        process.exit(checkGolden(loadMatcher()) ? 1 : 0);
+    }
+    console.log('Usage: node tender-taxonomy.js --check');
+}
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Group TenderNed publications into procurements.
+TenderNed publishes several records per procurement (prior notice, announcement, corrections,
+award). Publications are keyed by a hash of the normalized organization and reference number,
+or organization and title when there is no reference. Without a reference every new announcement of a
+title is a new procurement (recurring tenders are announced under the same title each year); only
+corrections and awards, and an announcement within PROCUREMENT_WINDOW_DAYS of its prior notice, join
+the procurement before them. Each procurement keeps one canonical record (identified by its
+announcement, with the latest known estimated value) plus its publication history.
+
+    python tender_dedup.py --tenders public/tenderned_data.xlsx
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import re
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from entity_resolution import normalize
+
+ROOT = Path(__file__).resolve().parent
+
+ID_COLUMN = 'ID publicatie'
+DATE_COLUMN = 'Publicatiedatum'
+TITLE_COLUMN = 'Naam aanbesteding'
+TYPE_COLUMN = 'Type publicatie'
+# Procurement references, most specific first; exports without them fall back to the title
+REFERENCE_COLUMNS = ['Referentienummer', 'Kenmerk', 'Interne referentie']
+PROCUREMENT_WINDOW_DAYS = 365
+# "Rectificatie: ...", "Gunning - ..." and similar prefixes added to follow-up publications
+TITLE_PREFIX_RE = re.compile(
+    r'^(?:(?:rectificatie|correctie|wijziging|gunning|gegunde opdracht|aankondiging|vooraankondiging)\b\W*)+'
+)
+FOLLOW_UP_RE = r'rectificatie|correctie|wijziging|gunning|gegund'
+PRIOR_NOTICE_RE = r'vooraankondiging'
+# Fields later publications may correct (awards add the value); everything else comes from the announcement
+CARRY_FORWARD_COLUMNS = ['Geraamde waarde in EUR']
+
+
+def org_column(df: pd.DataFrame) -> str:
+    org_col = 'Naam Aanbestedende dienst'
+    if org_col not in df.columns:
+        org_col = 'Officiële naam Aanbestedende dienst'
+    return org_col
+
+
+def normalize_title(title: str) -> str:
+    return TITLE_PREFIX_RE.sub('', normalize(title)).strip()
+
+
+def normalized(values: pd.Series, normalizer=normalize) -> pd.Series:
+    """Normalize each distinct value once; missing values become ''."""
+    text = values.astype(object).where(values.notna(), '').astype(str)
+    return text.map({value: normalizer(value) for value in text.unique()})
+
+
+def publication_kind(df: pd.DataFrame, pattern: str) -> pd.Series:
+    """Publications whose type contains pattern or whose title starts with it."""
+    title = df[TITLE_COLUMN].fillna('').astype(str) if TITLE_COLUMN in df.columns else pd.Series('', index=df.index)
+    flags = title.str.lower().str.match(pattern)
+    if TYPE_COLUMN in df.columns:
+        # The streaming reader keeps the type categorical, where '' is not a category
+        flags |= df[TYPE_COLUMN].astype(object).fillna('').astype(str).str.lower().str.contains(pattern)
+    return flags
+
+
+def follow_ups(df: pd.DataFrame) -> pd.Series:
+    """Corrections and award notices; these never open a procurement."""
+    return publication_kind(df, FOLLOW_UP_RE)
+
+
+def procurement_keys(df: pd.DataFrame) -> tuple[pd.Series, pd.Series]:
+    """Dedup key per publication and whether it came from a reference number.
+
+    Publications without reference and title are only themselves (keyed by their ID).
+    """
+    keys = normalized(df[org_column(df)]) + '|'
+    reference = pd.Series('', index=df.index)
+    for column in REFERENCE_COLUMNS:
+        if column in df.columns:
+            reference = reference.where(reference != '', normalized(df[column]))
+    has_reference = reference != ''
+    title = normalized(df[TITLE_COLUMN], normalize_title) if TITLE_COLUMN in df.columns else pd.Series('', index=df.index)
+    own = 'id:' + df[ID_COLUMN].astype(str)
+    return keys + np.where(has_reference, 'ref:' + reference, np.where(title != '', 'title:' + title, own)), has_reference
+
+
+def dedupe_tenders(df: pd.DataFrame, labels: pd.Series | None = None) -> tuple[pd.DataFrame, pd.Series | None]:
+    """One canonical row per procurement, with category labels OR-ed over its publications.
+
+    Adds procurement_id, publication_count and publications ([{id, date, type}], oldest first).
+    """
+    if df.empty:
+        canonical = df.assign(publication_count=pd.Series(dtype='int64'), procurement_id=pd.Series(dtype=object),
+                              publications=pd.Series(dtype=object)).reset_index(drop=True)
+        return canonical, (None if labels is None else pd.Series(dtype='int64'))
+    keys, has_reference = procurement_keys(df)
+    dates = pd.to_datetime(df[DATE_COLUMN], errors='coerce')
+    order = pd.DataFrame({'key': keys, 'date': dates, 'ref': has_reference, 'follow_up': follow_ups(df),
+                          'prior_notice': publication_kind(df, PRIOR_NOTICE_RE)})
+    order = order.sort_values(['key', 'date'], kind='stable')
+
+    same_key = order['key'].eq(order['key'].shift())
+    gap = order['date'].diff().dt.days
+    announces = same_key & order['prior_notice'].shift(fill_value=False) & (gap <= PROCUREMENT_WINDOW_DAYS)
+    # A reference number identifies the procurement; under a title every new announcement is a new
+    # procurement, except corrections and awards and the announcement that follows its prior notice
+    starts = ~same_key | (~order['ref'] & ~order['follow_up'] & ~announces)
+    group = starts.cumsum().to_numpy() - 1
+    rows = df.loc[order.index]
+    first = np.flatnonzero(starts.to_numpy())
+
+    # The announcement identifies the procurement (ID, date, title, URL); only value-type fields take
+    # the latest non-null value, so corrections and awards carry them forward
+    canonical = rows.iloc[first].reset_index(drop=True)
+    carried = [column for column in CARRY_FORWARD_COLUMNS if column in rows.columns]
+    if carried:
+        latest = rows[carried].groupby(group, sort=False).last().reset_index(drop=True)
+        canonical[carried] = latest.where(latest.notna(), canonical[carried])
+    canonical['publication_count'] = np.diff(np.append(first, len(rows)))
+    canonical['procurement_id'] = [
+        hashlib.blake2b(f'{key}|{publication}'.encode('utf-8'), digest_size=8).hexdigest()
+        for key, publication in zip(order['key'].to_numpy()[first], canonical[ID_COLUMN])
+    ]
+
+    history: list[list[dict]] = [[] for _ in first]
+    types = rows[TYPE_COLUMN].to_numpy() if TYPE_COLUMN in rows.columns else None
+    for position, (index, publication, date) in enumerate(zip(group, rows[ID_COLUMN], order['date'])):
+        entry = {'id': publication, 'date': None if pd.isna(date) else date.strftime('%Y-%m-%d')}
+        if types is not None and not pd.isna(types[position]):
+            entry['type'] = types[position]
+        history[index].append(entry)
+    canonical['publications'] = history
+    canonical = canonical.reset_index(drop=True)
+
+    merged_labels = None
+    if labels is not None:
+        masks = labels.loc[order.index].to_numpy(dtype=np.int64)
+        merged_labels = pd.Series(np.bitwise_or.reduceat(masks, first) if len(masks) else masks,
+                                  index=canonical.index)
+
+    print(f"🧾 {len(df)} publications -> {len(canonical)} procurements "
+          f"({len(df) - len(canonical)} follow-up publications folded)")
+    return canonical, merged_labels
+
+
+def main() -> None:
+    # Imported here: lead_enrichment itself builds on this module
+    from lead_enrichment import TENDERS_PATH, load_tenders
+
+    parser = argparse.ArgumentParser(description='Group TenderNed publications into procurements.')
+    parser.add_argument('--tenders', type=Path, default=TENDERS_PATH, help='TenderNed Excel export')
+    parser.add_argument('--top', type=int, default=10, help='Show the N procurements with most publications')
+    args = parser.parse_args()
+
+    df, _ = load_tenders(args.tenders)
+    canonical, _ = dedupe_tenders(df)
+    org_col = org_column(canonical)
+    print(f"   • {int((canonical['publication_count'] > 1).sum())} procurements with several publications")
+    for _, row in canonical.nlargest(args.top, 'publication_count', keep='first').iterrows():
+        if row['publication_count'] < 2:
+            break
+        dates = ', '.join(p['date'] or '?' for p in row['publications'])
+        print(f"   {row['publication_count']}× {row[org_col]}: {row[TITLE_COLUMN]} ({dates})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Extract AI and governance related tenders from TenderNed for browser display (src/tenders.json).
+Uses the shared tender taxonomy (word boundary matching to avoid false positives).
+Publications of one procurement (announcement, corrections, award) are exported as one tender.
+
+    python algoritmehub.py extract-tenders --tenders public/tenderned_data.xlsx
+"""
+from __future__ import annotations
+
+import argparse
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from dataset_index import tender_index
+from lead_enrichment import TENDERS_PATH, load_tenders
+from tender_dedup import dedupe_tenders
+from tender_taxonomy import TenderMatcher, classify_frame, load_matcher
+
+ROOT = Path(__file__).resolve().parent
+OUTPUT_PATH = ROOT / 'src' / 'tenders.json'
+
+COLUMNS_TO_KEEP = [
+    'ID publicatie',
+    'Publicatiedatum',
+    'Naam Aanbestedende dienst',
+    'Naam aanbesteding',
+    'Korte beschrijving opdracht',
+    'Geraamde waarde in EUR',
+    'URL TenderNed',
+    'category'
+]
+
+
+def relevant_tenders(df: pd.DataFrame, matcher: TenderMatcher | None = None,
+                     labels: pd.Series | None = None) -> list[dict]:
+    """AI / Governance / ICT tenders as display records."""
+    # Categorize each tender with the shared taxonomy (src/tender-taxonomy.json),
+    # reusing cached labels for publications classified in earlier runs
+    matcher = matcher or load_matcher()
+    if labels is None:
+        labels = pd.Series(classify_frame(df, matcher), index=df.index)
+    df, labels = dedupe_tenders(df, labels)
+    df = df.assign(category=[matcher.primary(mask) for mask in labels])
+
+    relevant_df = df[df['category'].notna()]
+    print(f"📊 Found {len(relevant_df)} relevant tenders (AI/Governance/ICT)")
+
+    # Keep only columns that exist
+    available_cols = [c for c in COLUMNS_TO_KEEP if c in relevant_df.columns]
+    export_df = relevant_df[available_cols].copy()
+
+    # Convert dates to string for JSON
+    if 'Publicatiedatum' in export_df.columns:
+        export_df['Publicatiedatum'] = pd.to_datetime(export_df['Publicatiedatum'], errors='coerce')
+        # Nullable integer: a missing date must not turn every year into a float (2024.0)
+        export_df['year'] = export_df['Publicatiedatum'].dt.year.astype('Int64')
+        export_df['Publicatiedatum'] = export_df['Publicatiedatum'].dt.strftime('%Y-%m-%d')
+
+    # Clean up values and limit description length
+    if 'Korte beschrijving opdracht' in export_df.columns:
+        export_df['Korte beschrijving opdracht'] = export_df['Korte beschrijving opdracht'].fillna('').apply(
+            lambda x: str(x)[:300] + '...' if len(str(x)) > 300 else str(x)
+        )
+
+    tenders = export_df.to_dict(orient='records')
+    # Clean NaN values
+    for tender in tenders:
+        for key in tender:
+            if pd.isna(tender[key]):
+                tender[key] = None
+    # Publication history only where there is more than the original announcement
+    for tender, publications in zip(tenders, relevant_df['publications']):
+        if len(publications) > 1:
+            tender['publications'] = publications
+    return tenders
+
+
+def tender_stats(tenders: list[dict]) -> dict:
+    return {
+        'total': len(tenders),
+        'publications': sum(len(t.get('publications', [t])) for t in tenders),
+        'ai': len([t for t in tenders if t.get('category') == 'AI']),
+        'governance': len([t for t in tenders if t.get('category') == 'Governance']),
+        'ict': len([t for t in tenders if t.get('category') == 'ICT']),
+        'years': sorted(set(t.get('year') for t in tenders if t.get('year'))),
+        'organizations': len(set(t.get('Naam Aanbestedende dienst') for t in tenders if t.get('Naam Aanbestedende dienst'))),
+    }
+
+
+def extract_tenders(tenders_path: Path = TENDERS_PATH, output_path: Path = OUTPUT_PATH) -> dict:
+    print("📂 Loading TenderNed Excel file...")
+    matcher = load_matcher()
+    df, labels = load_tenders(tenders_path, matcher)
+    print(f"✅ Loaded {len(df)} tenders")
+
+    tenders = relevant_tenders(df, matcher, labels)
+    stats = tender_stats(tenders)
+    output = {
+        'generated_date': datetime.now().strftime('%Y-%m-%d'),
+        'stats': stats,
+        'tenders': tenders,
+        # Facet postings for the tender browser
+        'index': tender_index(tenders),
+    }
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(output, f, indent=2, ensure_ascii=False)
+
+    print(f"\n📈 Export Summary:")
+    print(f"   • Total relevant tenders: {stats['total']} ({stats['publications']} publications)")
+    print(f"   • AI-related: {stats['ai']}")
+    print(f"   • Governance-related: {stats['governance']}")
+    print(f"   • ICT-related: {stats['ict']}")
+    print(f"   • Unique organizations: {stats['organizations']}")
+    print(f"   • Year range: {min(stats['years'])} - {max(stats['years'])}")
+    print(f"\n💾 Saved to: {output_path}")
+    print(f"   File size: {len(json.dumps(output)) / 1024 / 1024:.1f} MB")
+    print("\n✅ Done!")
+    return output
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Extract AI/governance/ICT tenders for the tender browser.')
+    parser.add_argument('--tenders', type=Path, default=TENDERS_PATH, help='TenderNed Excel export')
+    parser.add_argument('--output', type=Path, default=OUTPUT_PATH, help='Output JSON')
+    args = parser.parse_args()
+    extract_tenders(args.tenders, args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Low-memory streaming reader for the TenderNed workbook.
+The data sheet is iterated in openpyxl read-only mode and only the columns the pipeline uses are
+kept, with categorical organization names and typed dates and values. Rows are classified with the
+tender taxonomy in chunks while they stream, so long texts that are only needed for classification
+('Omschrijving opdracht') are never held for the whole sheet.
+
+    python tender_reader.py --benchmark
+    python tender_reader.py --benchmark --rows 100000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
+
+from tender_dedup import DATE_COLUMN, ID_COLUMN, REFERENCE_COLUMNS, TITLE_COLUMN, TYPE_COLUMN
+from tender_taxonomy import (
+    CACHE_PATH, TenderMatcher, classify_frame, classify_rows, load_cache, load_matcher, save_cache,
+)
+
+ROOT = Path(__file__).resolve().parent
+TENDERS_PATH = ROOT / 'public' / 'tenderned_data.xlsx'
+
+TENDER_SHEET = 1
+VALUE_COLUMN = 'Geraamde waarde in EUR'
+ORG_COLUMNS = ['Naam Aanbestedende dienst', 'Officiële naam Aanbestedende dienst']
+# Columns used by enrichment, extraction, dedup and the spend cube; everything else is dropped while reading
+KEEP_COLUMNS = [
+    ID_COLUMN, DATE_COLUMN, *ORG_COLUMNS, TITLE_COLUMN, 'Korte beschrijving opdracht', VALUE_COLUMN,
+    'URL TenderNed', TYPE_COLUMN, *REFERENCE_COLUMNS,
+]
+CATEGORY_COLUMNS = [*ORG_COLUMNS, TYPE_COLUMN]
+CHUNK_SIZE = 5000
+
+
+def iter_sheet(path: Path, sheet: int = TENDER_SHEET) -> Iterator[tuple]:
+    """Rows of a worksheet as value tuples (header first), without loading the workbook."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        yield from workbook.worksheets[sheet].iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def tender_frame(columns: dict[str, list]) -> pd.DataFrame:
+    """Typed DataFrame from column lists; each list is released as soon as its column is built."""
+    data = {}
+    for name in list(columns):
+        values = columns.pop(name)
+        if name in CATEGORY_COLUMNS:
+            data[name] = pd.Categorical(values)
+        elif name == DATE_COLUMN:
+            data[name] = pd.to_datetime(pd.Series(values, dtype=object), errors='coerce')
+        elif name == VALUE_COLUMN:
+            data[name] = pd.to_numeric(pd.Series(values, dtype=object), errors='coerce')
+        else:
+            data[name] = pd.Series(values)
+        del values
+    return pd.DataFrame(data)
+
+
+def read_tenders(path: Path = TENDERS_PATH, matcher: TenderMatcher | None = None, cache_path: Path = CACHE_PATH,
+                 chunk_size: int = CHUNK_SIZE) -> tuple[pd.DataFrame, pd.Series | None]:
+    """Stream the data sheet into a compact DataFrame, plus taxonomy labels when a matcher is given."""
+    rows = iter_sheet(path)
+    header = ['' if name is None else str(name) for name in next(rows, ())]
+    keep = [(index, name) for index, name in enumerate(header) if name in KEEP_COLUMNS]
+    columns: dict[str, list] = {name: [] for _, name in keep}
+
+    search = [header.index(field) for field in matcher.search_fields if field in header] if matcher else []
+    id_index = header.index(ID_COLUMN) if ID_COLUMN in header else None
+    cache = load_cache(matcher, cache_path) if matcher else {}
+    cached = len(cache)
+    masks: list[int] = []
+    chunk: list[tuple[object, tuple]] = []
+
+    for row in rows:
+        if all(value is None for value in row):
+            continue
+        width = len(row)
+        for index, name in keep:
+            columns[name].append(row[index] if index < width else None)
+        if matcher is None:
+            continue
+        chunk.append((row[id_index] if id_index is not None and id_index < width else None,
+                      tuple(row[index] for index in search if index < width)))
+        if len(chunk) >= chunk_size:
+            masks += classify_rows(chunk, matcher, cache)
+            chunk.clear()
+
+    df = tender_frame(columns)
+    if matcher is None:
+        return df, None
+    masks += classify_rows(chunk, matcher, cache)
+    print(f"🏷️  Classified {len(cache) - cached} new tenders ({cached} cached)")
+    save_cache(matcher, cache, cache_path)
+    return df, pd.Series(masks, index=df.index, dtype='int64')
+
+
+def write_synthetic(path: Path, rows: int) -> None:
+    """Workbook shaped like the TenderNed export, with long descriptions."""
+    from openpyxl import Workbook
+
+    rng = random.Random(7)
+    words = ['software', 'ict', 'algoritme', 'kunstmatige', 'intelligentie', 'privacy', 'audit',
+             'onderhoud', 'cloud', 'data', 'advies', 'levering', 'diensten', 'gemeente', 'beheer', 'systeem']
+    organizations = [f'Gemeente {i}' for i in range(400)]
+    workbook = Workbook(write_only=True)
+    workbook.create_sheet('Info').append(['Synthetic TenderNed export'])
+    sheet = workbook.create_sheet('Data')
+    sheet.append([ID_COLUMN, DATE_COLUMN, 'Naam Aanbestedende dienst', TITLE_COLUMN, 'Korte beschrijving opdracht',
+                  'Omschrijving opdracht', VALUE_COLUMN, 'URL TenderNed', TYPE_COLUMN, 'Land', 'CPV code', 'Procedure'])
+    for index in range(rows):
+        sheet.append([
+            index,
+            f'{rng.randint(2016, 2025)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}',
+            rng.choice(organizations),
+            ' '.join(rng.choices(words, k=4)),
+            ' '.join(rng.choices(words, k=25)),
+            ' '.join(rng.choices(words, k=300)),
+            rng.choice([None, 10000, 250000, 1200000]),
+            f'https://www.tenderned.nl/aankondigingen/overzicht/{index}',
+            # Real exports leave the type blank on some publications
+            rng.choice(['Aankondiging van een opdracht', 'Rectificatie', 'Aankondiging van een gegunde opdracht', None]),
+            'NL',
+            '72000000-5',
+            'Openbaar',
+        ])
+    workbook.save(path)
+
+
+def measure(mode: str, path: Path, cache_path: Path) -> dict:
+    """Load and classify the workbook the old way (pandas) or streaming; run in a fresh process."""
+    started = time.perf_counter()
+    matcher = load_matcher()
+    if mode == 'pandas':
+        df = pd.read_excel(path, sheet_name=TENDER_SHEET)
+        labels = classify_frame(df, matcher, cache_path=cache_path)
+    else:
+        df, labels = read_tenders(path, matcher, cache_path=cache_path)
+    return {
+        'mode': mode,
+        'rows': len(df),
+        'labelled': int(sum(1 for mask in labels if mask)),
+        'seconds': round(time.perf_counter() - started, 2),
+        'frame_mb': round(df.memory_usage(deep=True).sum() / 1024 / 1024, 1),
+        # ru_maxrss is in kilobytes on Linux
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def benchmark(path: Path | None, rows: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        if path is None:
+            path = Path(tmp) / 'tenderned_synthetic.xlsx'
+            print(f"📝 Writing a synthetic workbook with {rows} tenders...")
+            write_synthetic(path, rows)
+        print(f"📊 Peak memory loading {path.name} ({path.stat().st_size / 1024 / 1024:.1f} MB)")
+        for mode in ('pandas', 'stream'):
+            # Each mode classifies from an empty cache in its own process, so peaks do not mix
+            cache_path = Path(tmp) / f'classifications-{mode}.json'
+            result = subprocess.run(
+                [sys.executable, __file__, '--measure', mode, '--tenders', str(path), '--cache', str(cache_path)],
+                capture_output=True, text=True, check=True, cwd=ROOT,
+            )
+            stats = json.loads(result.stdout.strip().splitlines()[-1])
+            label = 'pd.read_excel + classify' if mode == 'pandas' else 'streaming reader'
+            print(f"   {label:<25} {stats['rows']} rows, {stats['labelled']} labelled, {stats['seconds']:.1f}s, "
+                  f"frame {stats['frame_mb']} MB, peak RSS {stats['peak_rss_mb']} MB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Stream the TenderNed workbook and measure peak memory.')
+    parser.add_argument('--tenders', type=Path, help='Workbook to measure (default: a synthetic one)')
+    parser.add_argument('--rows', type=int, default=50000, help='Rows in the synthetic workbook')
+    parser.add_argument('--benchmark', action='store_true', help='Compare peak memory of pandas and streaming reads')
+    parser.add_argument('--measure', choices=['pandas', 'stream'], help=argparse.SUPPRESS)
+    parser.add_argument('--cache', type=Path, default=CACHE_PATH, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.measure, args.tenders or TENDERS_PATH, args.cache)))
+        return
+    if args.benchmark:
+        benchmark(args.tenders, args.rows)
+        return
+    df, labels = read_tenders(args.tenders or TENDERS_PATH, load_matcher())
+    print(f"✅ {len(df)} tenders, {int((labels > 0).sum())} labelled, "
+          f"{df.memory_usage(deep=True).sum() / 1024 / 1024:.1f} MB in memory")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Procurement spend cube from TenderNed estimated values.
+Tenders are aggregated per organization x year x category, including 'all' rollups, in one
+vectorized groupby: tender count, tenders with an estimate, total estimated value and value
+percentiles. The cube is stored as compact JSON (src/tender-spend.json); reading a cell is a
+dictionary lookup on cube[org][f'{year}|{category}'].
+
+    python tender_spend.py "Gemeente Utrecht" --year 2024
+    python tender_spend.py --benchmark 200000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent
+SPEND_PATH = ROOT / 'src' / 'tender-spend.json'
+
+VALUE_COLUMN = 'Geraamde waarde in EUR'
+ALL = 'all'
+UNKNOWN_YEAR = 'unknown'
+OTHER_CATEGORY = 'Overig'
+QUANTILES = {'p25': 0.25, 'p50': 0.5, 'p75': 0.75, 'p90': 0.9}
+FIELDS = ['count', 'valued', 'total', *QUANTILES]
+
+
+def spend_frame(df: pd.DataFrame, labels: pd.Series, categories: list[str], org_keys: pd.Series) -> pd.DataFrame:
+    """One row per tender: organization key, year, primary category and estimated value (NaN if absent)."""
+    masks = labels.to_numpy(dtype=np.int64)
+    # Primary category = first matching category in taxonomy order
+    category = np.select([(masks & (1 << i)) > 0 for i in range(len(categories))], categories, default=OTHER_CATEGORY)
+    year = pd.to_datetime(df['Publicatiedatum'], errors='coerce').dt.year
+    value = pd.to_numeric(df[VALUE_COLUMN], errors='coerce') if VALUE_COLUMN in df.columns else np.nan
+    frame = pd.DataFrame({
+        'org': org_keys.to_numpy(),
+        'year': year.astype('Int64').astype(str).replace('<NA>', UNKNOWN_YEAR).to_numpy(),
+        'category': category,
+        'value': value,
+    })
+    # Zero or negative estimates mean "not provided"
+    frame.loc[frame['value'] <= 0, 'value'] = np.nan
+    return frame.dropna(subset=['org'])
+
+
+def build_spend_cube(frame: pd.DataFrame) -> pd.DataFrame:
+    """Count, valued count, total and percentiles per (org, year, category), with 'all' rollups."""
+    if frame.empty:
+        index = pd.MultiIndex.from_arrays([[], [], []], names=['org', 'year', 'category'])
+        return pd.DataFrame({field: pd.Series(dtype='float64') for field in FIELDS}, index=index)
+    rollups = pd.concat([
+        frame,
+        frame.assign(year=ALL),
+        frame.assign(category=ALL),
+        frame.assign(year=ALL, category=ALL),
+    ], ignore_index=True)
+    grouped = rollups.groupby(['org', 'year', 'category'], sort=True)['value']
+    cube = pd.DataFrame({'count': grouped.size(), 'valued': grouped.count(), 'total': grouped.sum(min_count=1)})
+    percentiles = grouped.quantile(list(QUANTILES.values())).unstack()
+    percentiles.columns = list(QUANTILES)
+    return cube.join(percentiles)
+
+
+def cube_payload(cube: pd.DataFrame, names: dict[str, str] | None = None) -> dict:
+    """Compact JSON form: per organization, 'year|category' -> [count, valued, total, p25, p50, p75, p90]."""
+    values = cube[FIELDS].round(0)
+    organizations: dict[str, dict[str, list]] = {}
+    for (org, year, category), row in zip(values.index, values.itertuples(index=False, name=None)):
+        organizations.setdefault(org, {})[f'{year}|{category}'] = [
+            None if pd.isna(v) else int(v) for v in row
+        ]
+    index = cube.index
+    return {
+        'generated_date': datetime.now().strftime('%Y-%m-%d %H:%M'),
+        'fields': FIELDS,
+        'years': sorted(set(index.get_level_values('year')) - {ALL}),
+        'categories': sorted(set(index.get_level_values('category')) - {ALL}),
+        'names': names or {},
+        'organizations': organizations,
+    }
+
+
+def save_spend_cube(payload: dict, path: Path = SPEND_PATH) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(',', ':'))
+    print(f"💶 Spend cube: {sum(len(cells) for cells in payload['organizations'].values())} cells for "
+          f"{len(payload['organizations'])} organizations ({len(payload['years'])} years, "
+          f"{len(payload['categories'])} categories)")
+
+
+class SpendCube:
+    """O(1) spend lookups per organization key (entity_id, or the TenderNed name when unresolved)."""
+
+    def __init__(self, payload: dict) -> None:
+        self.fields = payload.get('fields', FIELDS)
+        self.years = payload.get('years', [])
+        self.categories = payload.get('categories', [])
+        self.names = payload.get('names', {})
+        self.organizations: dict[str, dict[str, list]] = payload.get('organizations', {})
+
+    @classmethod
+    def load(cls, path: Path = SPEND_PATH) -> SpendCube:
+        if not path.exists():
+            return cls({})
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def cell(self, org: str | None, year: str | int = ALL, category: str = ALL) -> dict | None:
+        cells = self.organizations.get(org) if org else None
+        values = cells.get(f'{year}|{category}') if cells else None
+        return dict(zip(self.fields, values)) if values else None
+
+    def total(self, org: str | None, year: str | int = ALL, category: str = ALL) -> int:
+        cell = self.cell(org, year, category)
+        return (cell or {}).get('total') or 0
+
+
+def synthetic_frame(size: int, organizations: int = 2000) -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    return pd.DataFrame({
+        'org': rng.integers(0, organizations, size).astype(str),
+        'year': rng.integers(2016, 2026, size).astype(str),
+        'category': rng.choice(['AI', 'Governance', 'ICT', OTHER_CATEGORY], size, p=[0.05, 0.1, 0.25, 0.6]),
+        'value': np.where(rng.random(size) < 0.7, rng.lognormal(11, 1.5, size), np.nan),
+    })
+
+
+def benchmark(size: int) -> None:
+    frame = synthetic_frame(size)
+    started = time.perf_counter()
+    cube = build_spend_cube(frame)
+    build_seconds = time.perf_counter() - started
+    payload = cube_payload(cube)
+    spend = SpendCube(json.loads(json.dumps(payload, separators=(',', ':'))))
+    size_mb = len(json.dumps(payload, separators=(',', ':'))) / 1024 / 1024
+
+    rng = random.Random(7)
+    keys = [(str(rng.randrange(2000)), rng.choice([ALL, *map(str, range(2016, 2026))]),
+             rng.choice([ALL, 'AI', 'ICT'])) for _ in range(100_000)]
+    started = time.perf_counter()
+    for org, year, category in keys:
+        spend.cell(org, year, category)
+    lookup_seconds = time.perf_counter() - started
+    print(f"📊 {size} tenders -> {len(cube)} cells in {build_seconds:.2f}s ({size_mb:.1f} MB JSON); "
+          f"{len(keys) / lookup_seconds:,.0f} lookups/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Look up procurement spend per organization.')
+    parser.add_argument('organizations', nargs='*', help='Entity ids or TenderNed organization names')
+    parser.add_argument('--year', default=ALL, help='Year (default: all)')
+    parser.add_argument('--category', default=ALL, help='Category (default: all)')
+    parser.add_argument('--benchmark', type=int, metavar='N', help='Build a cube over N synthetic tenders')
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark)
+        return
+    spend = SpendCube.load()
+    by_name = {name: key for key, name in spend.names.items()}
+    for org in args.organizations:
+        key = org if org in spend.organizations else by_name.get(org, org)
+        cell = spend.cell(key, args.year, args.category)
+        print(f"   {org} ({args.year}, {args.category}): {cell if cell else 'no tenders'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Shared TenderNed keyword taxonomy.
+Compiles src/tender-taxonomy.json into one matcher and caches labels per publication ID.
+The Node counterpart is tender-taxonomy.js; both are checked against src/tender-taxonomy.golden.json.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Iterable
+
+ROOT = Path(__file__).resolve().parent
+TAXONOMY_PATH = ROOT / 'src' / 'tender-taxonomy.json'
+GOLDEN_PATH = ROOT / 'src' / 'tender-taxonomy.golden.json'
+CACHE_PATH = ROOT / 'exports' / 'tender-classifications.json'
+
+
+class TenderMatcher:
+    """Classifies tender text; labels are bitmasks in taxonomy category order."""
+
+    def __init__(self, taxonomy: dict, version: str = '') -> None:
+        self.version = version
+        self.search_fields = taxonomy.get('search_fields', [])
+        self.categories = [c['name'] for c in taxonomy['categories']]
+        self.exclude = self._compile(taxonomy.get('exclude', []))
+        self.patterns = [self._compile(c['patterns']) for c in taxonomy['categories']]
+
+    @staticmethod
+    def _compile(patterns: list[str]) -> re.Pattern | None:
+        if not patterns:
+            return None
+        return re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE)
+
+    def bit(self, category: str) -> int:
+        return 1 << self.categories.index(category)
+
+    def labels(self, text: str) -> int:
+        text_lower = text.lower()
+        # An exclusion anywhere in the text vetoes every category
+        if self.exclude is not None and self.exclude.search(text_lower):
+            return 0
+        mask = 0
+        for index, pattern in enumerate(self.patterns):
+            if pattern.search(text_lower):
+                mask |= 1 << index
+        return mask
+
+    def names(self, mask: int) -> list[str]:
+        return [name for index, name in enumerate(self.categories) if mask & (1 << index)]
+
+    def primary(self, mask: int) -> str | None:
+        names = self.names(mask)
+        return names[0] if names else None
+
+
+def load_matcher(path: Path = TAXONOMY_PATH) -> TenderMatcher:
+    raw = path.read_bytes()
+    return TenderMatcher(json.loads(raw), hashlib.sha1(raw).hexdigest())
+
+
+def search_text(values: Iterable) -> str:
+    """Join search field values, skipping empty cells (None/NaN)."""
+    return ' '.join(str(v) for v in values if v is not None and v == v)
+
+
+def load_cache(matcher: TenderMatcher, path: Path = CACHE_PATH) -> dict[str, int]:
+    if not path.exists():
+        return {}
+    with open(path, 'r') as f:
+        cache = json.load(f)
+    # Labels from an older taxonomy are stale
+    if cache.get('taxonomy') != matcher.version:
+        return {}
+    return cache.get('labels', {})
+
+
+def save_cache(matcher: TenderMatcher, labels: dict[str, int], path: Path = CACHE_PATH) -> None:
+    path.parent.mkdir(exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'taxonomy': matcher.version, 'labels': labels}, f, separators=(',', ':'))
+
+
+def cache_key(pub_id: object) -> str | None:
+    """Publication ID as a cache key; pandas reads integer IDs as floats once the column has blanks."""
+    if pub_id is None or pub_id != pub_id:
+        return None
+    if isinstance(pub_id, float) and pub_id.is_integer():
+        pub_id = int(pub_id)
+    return str(pub_id)
+
+
+def classify_rows(rows: Iterable[tuple[object, tuple]], matcher: TenderMatcher,
+                  cache: dict[str, int]) -> list[int]:
+    """Label (publication_id, field_values) rows, classifying only IDs missing from the cache."""
+    masks = []
+    for pub_id, values in rows:
+        key = cache_key(pub_id)
+        if key is not None and key in cache:
+            masks.append(cache[key])
+            continue
+        mask = matcher.labels(search_text(values))
+        if key is not None:
+            cache[key] = mask
+        masks.append(mask)
+    return masks
+
+
+def classify_frame(df, matcher: TenderMatcher, id_col: str = 'ID publicatie',
+                   cache_path: Path = CACHE_PATH) -> list[int]:
+    """Label every row of a TenderNed DataFrame and persist the cache."""
+    cols = [c for c in matcher.search_fields if c in df.columns]
+    ids = df[id_col] if id_col in df.columns else [None] * len(df)
+    cache = load_cache(matcher, cache_path)
+    before = len(cache)
+    masks = classify_rows(zip(ids, df[cols].itertuples(index=False, name=None)), matcher, cache)
+    print(f"🏷️  Classified {len(cache) - before} new tenders ({before} cached)")
+    save_cache(matcher, cache, cache_path)
+    return masks
+
+
+def check_golden(matcher: TenderMatcher, path: Path = GOLDEN_PATH) -> int:
+    with open(path, 'r') as f:
+        cases = json.load(f)['cases']
+    failures = 0
+    for case in cases:
+        got = matcher.names(matcher.labels(case['text']))
+        if got != case['categories']:
+            failures += 1
+            print(f"❌ {case['text']!r}: expected {case['categories']}, got {got}")
+    print(f"✅ {len(cases) - failures}/{len(cases)} golden cases pass")
+    return failures
+
+
+if __name__ == '__main__':
+    if '--check' in sys.argv[1:]:
+        sys.exit(1 if check_golden(load_matcher()) else 0)
+    print('Usage: python tender_taxonomy.py --check')
@@ -0,0 +1,22 @@
+"""Shared test setup: repo modules are importable and scripts/*.py can be loaded by file name."""
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def load_script(name: str):
+    """Import scripts/<name>.py (hyphenated file names are not importable) as module <name>."""
+    module_name = name.replace('-', '_')
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, ROOT / 'scripts' / f'{name}.py')
+    module = importlib.util.module_from_spec(spec)
+    # Dataclasses look their module up while the class body is built
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
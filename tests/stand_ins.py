@@ -0,0 +1,186 @@
+"""Local stand-ins for network services: the outreach transports and an organization website.
+
+The /api/send-email endpoint and the minimal SMTP server answer from a script of responses (then
+succeed) and record what was delivered, so tests can check retries, rate limits and duplicate
+deliveries without network access. The website serves fixed pages and records every request.
+"""
+from __future__ import annotations
+
+import json
+import socketserver
+import threading
+import time
+from email import message_from_bytes
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Scripted HTTP response that sends headers for a longer body than it writes (IncompleteRead)
+TRUNCATE = 'truncate'
+
+
+class HttpStandIn:
+    """/api/send-email stand-in; script entries are a status, (status, headers) or TRUNCATE."""
+
+    def __init__(self, script: list | None = None) -> None:
+        self.script = list(script or [])
+        self.delivered: list[str] = []
+        self.requests: list[float] = []
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self.handler())
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.server.server_port}/api/send-email'
+
+    def next_response(self) -> object:
+        with self.lock:
+            self.requests.append(time.monotonic())
+            return self.script.pop(0) if self.script else 200
+
+    def handler(self) -> type[BaseHTTPRequestHandler]:
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                payload = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+                response = stand_in.next_response()
+                status, headers = response if isinstance(response, tuple) else (response, {})
+                if status == TRUNCATE:
+                    self.send_response(200)
+                    self.send_header('Content-Length', '100')
+                    self.end_headers()
+                    self.wfile.write(b'{"ok"')
+                    self.close_connection = True
+                    return
+                if status == 200:
+                    with stand_in.lock:
+                        stand_in.delivered.append(self.headers.get('Idempotency-Key') or payload['to'])
+                body = json.dumps({'ok': status == 200}).encode('utf-8')
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        return Handler
+
+    def __enter__(self) -> HttpStandIn:
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class SmtpStandIn:
+    """Minimal SMTP server; script entries are the reply code to a finished DATA command."""
+
+    def __init__(self, script: list[int] | None = None) -> None:
+        self.script = list(script or [])
+        self.delivered: list[str] = []
+        self.lock = threading.Lock()
+        self.server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), self.handler())
+        self.server.daemon_threads = True
+
+    @property
+    def port(self) -> int:
+        return self.server.server_address[1]
+
+    def accept(self, data: bytes) -> int:
+        with self.lock:
+            code = self.script.pop(0) if self.script else 250
+            if code == 250:
+                self.delivered.append(message_from_bytes(data)['Message-ID'])
+            return code
+
+    def handler(self) -> type[socketserver.StreamRequestHandler]:
+        stand_in = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def reply(self, line: str) -> None:
+                self.wfile.write(f'{line}\r\n'.encode('ascii'))
+
+            def handle(self) -> None:
+                self.reply('220 stand-in ESMTP')
+                for raw in self.rfile:
+                    command = raw.decode('ascii', errors='replace').strip().upper()
+                    if command.startswith(('EHLO', 'HELO')):
+                        self.reply('250 stand-in')
+                    elif command.startswith(('MAIL', 'RCPT', 'RSET', 'NOOP')):
+                        self.reply('250 OK')
+                    elif command == 'DATA':
+                        self.reply('354 End data with <CR><LF>.<CR><LF>')
+                        lines = []
+                        for data_line in self.rfile:
+                            if data_line in (b'.\r\n', b'.\n'):
+                                break
+                            lines.append(data_line[1:] if data_line.startswith(b'..') else data_line)
+                        code = stand_in.accept(b''.join(lines))
+                        self.reply(f'{code} {"OK" if code == 250 else "stand-in failure"}')
+                    elif command == 'QUIT':
+                        self.reply('221 Bye')
+                        return
+                    else:
+                        self.reply('502 Command not implemented')
+
+        return Handler
+
+    def __enter__(self) -> SmtpStandIn:
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class SiteStandIn:
+    """Organization website; pages maps a path to its HTML or to (content type, bytes), others are 404s."""
+
+    def __init__(self, pages: dict[str, object] | None = None) -> None:
+        self.pages = dict(pages or {})
+        self.requested: list[str] = []
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self.handler())
+
+    @property
+    def base_url(self) -> str:
+        return f'http://127.0.0.1:{self.server.server_port}'
+
+    def response(self, path: str) -> tuple[int, str, bytes]:
+        self.requested.append(path)
+        page = self.pages.get(path)
+        if page is None:
+            return 404, 'text/html', b'<html>Niet gevonden</html>'
+        if isinstance(page, str):
+            return 200, 'text/html; charset=utf-8', page.encode('utf-8')
+        return 200, *page
+
+    def handler(self) -> type[BaseHTTPRequestHandler]:
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                status, content_type, body = stand_in.response(self.path)
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        return Handler
+
+    def __enter__(self) -> SiteStandIn:
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,18 @@
+"""Database build of analytics_db.py from the shipped JSON sources."""
+from __future__ import annotations
+
+import json
+import sqlite3
+
+import analytics_db
+
+
+def test_repeated_tender_rows_are_counted_not_dropped(tmp_path):
+    path = tmp_path / 'algoritmehub.sqlite'
+    analytics_db.build_database(path, workbook=None)
+    tenders = json.loads(analytics_db.TENDERS_JSON_PATH.read_text(encoding='utf-8'))['tenders']
+    with sqlite3.connect(path) as conn:
+        rows, copies = conn.execute('SELECT COUNT(*), SUM(copies) FROM tenders').fetchone()
+        assert rows == len({tender['ID publicatie'] for tender in tenders})
+        assert copies == len(tenders)
+        assert analytics_db.check(conn)
@@ -0,0 +1,44 @@
+"""Role classification of contact_candidates.py and the contact picked by contact_summary.py."""
+from __future__ import annotations
+
+import pytest
+
+from contact_candidates import role_for_email, role_rank, target_role
+from contact_summary import contact_summary
+
+
+@pytest.mark.parametrize('role, rank', [
+    ('Functionaris Gegevensbescherming (FG)', 0),
+    ('Privacy officer', 0),
+    ('Adviseur informatiebeveiliging', 1),
+    # Spelled-out titles are the role they name, not a general contact for containing "info"
+    ('Chief Information Officer', 2),
+    ('CIO (Chief Information Officer)', 2),
+    ('Beleidsmedewerker algoritmes', 3),
+    ('Data/Informatiemanagement', 4),
+    ('Algemeen contact', 5),
+    # "fg" and "cio" only count as whole words, as in the crawler
+    ('Fiscalist FGR', 6),
+    ('Sociaal werker', 6),
+    (None, 6),
+])
+def test_role_rank(role, rank):
+    assert role_rank(role) == rank
+
+
+def test_role_rank_agrees_with_target_role():
+    for role in ['Chief Information Officer', 'Security officer', 'Privacyfunctionaris', 'DPO']:
+        assert role_rank(role) == ['Functionaris Gegevensbescherming (FG)', 'CISO', 'CIO'].index(target_role(role))
+
+
+def test_email_local_parts_keep_their_rules():
+    assert role_for_email('fg@gemeente.nl') == ('Functionaris Gegevensbescherming (FG)', 0)
+    assert role_for_email('info@gemeente.nl') == ('Algemeen contact', 5)
+
+
+def test_summary_prefers_the_spelled_out_cio():
+    entry = {'primary_email': 'info@gemeente.nl', 'contacts': [
+        {'role': 'Algemeen contact', 'name': 'Receptie'},
+        {'role': 'Chief Information Officer', 'name': 'Karel Smit'},
+    ]}
+    assert contact_summary(entry)['name'] == 'Karel Smit'
@@ -0,0 +1,107 @@
+"""Domain validation of scripts/enrich-contacts.py against a stub resolver and a local HTTP server."""
+from __future__ import annotations
+
+import importlib.util
+import json
+import threading
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_script():
+    spec = importlib.util.spec_from_file_location('enrich_contacts', ROOT / 'scripts' / 'enrich-contacts.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+enrich_contacts = load_script()
+
+
+class StatusHandler(BaseHTTPRequestHandler):
+    """HEAD /<status> answers with that status."""
+
+    def do_HEAD(self) -> None:
+        self.send_response(int(self.path.strip('/') or 200))
+        self.end_headers()
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), StatusHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_address[1]}'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class StubResolver:
+    """Resolves only the given hosts and records every lookup."""
+
+    def __init__(self, hosts: set[str]) -> None:
+        self.hosts = hosts
+        self.lookups: list[str] = []
+
+    def __call__(self, host: str) -> bool:
+        self.lookups.append(host)
+        return host in self.hosts
+
+
+def test_validate_targets(server):
+    resolver = StubResolver({'127.0.0.1', 'gemeente.nl'})
+    check = partial(enrich_contacts.check_domain, resolver=resolver, head=enrich_contacts.head_status)
+    targets = [f'{server}/200', f'{server}/405', f'{server}/503', 'https://dead.invalid/', 'gemeente.nl', 'nergens.nl']
+    results = enrich_contacts.validate_targets(targets, {}, ttl_seconds=3600, workers=4, check=check)
+
+    ok = results[f'{server}/200']
+    assert (ok['dns'], ok['status'], ok['reachable']) == (True, 200, True)
+    # HEAD not allowed still means the site exists; server errors do not
+    assert results[f'{server}/405']['reachable'] is True
+    assert (results[f'{server}/503']['status'], results[f'{server}/503']['reachable']) == (503, False)
+    # Unresolved hosts are never requested
+    dead = results['https://dead.invalid/']
+    assert (dead['dns'], dead['status'], dead['reachable']) == (False, None, False)
+    assert results['gemeente.nl']['reachable'] is True
+    assert results['nergens.nl']['reachable'] is False
+
+
+def test_validate_targets_uses_fresh_cache():
+    resolver = StubResolver({'gemeente.nl'})
+    check = partial(enrich_contacts.check_domain, resolver=resolver, head=lambda url: 200)
+    cache: dict = {}
+    enrich_contacts.validate_targets(['gemeente.nl'], cache, ttl_seconds=3600, check=check)
+    enrich_contacts.validate_targets(['gemeente.nl'], cache, ttl_seconds=3600, check=check)
+    assert resolver.lookups == ['gemeente.nl']
+
+    cache['gemeente.nl']['checked_at'] -= 7200
+    enrich_contacts.validate_targets(['gemeente.nl'], cache, ttl_seconds=3600, check=check)
+    assert resolver.lookups == ['gemeente.nl', 'gemeente.nl']
+
+
+def test_main_threads_hooks(tmp_path, monkeypatch):
+    leads = {'leads': [{'name': 'Gemeente Utrecht', 'type': 'Gemeente'}]}
+    (tmp_path / 'data.json').write_text(json.dumps(leads), encoding='utf-8')
+    (tmp_path / 'organizations.json').write_text(json.dumps({'organizations': {}}), encoding='utf-8')
+    monkeypatch.setattr(enrich_contacts, 'data_path', tmp_path / 'data.json')
+    monkeypatch.setattr(enrich_contacts, 'org_path', tmp_path / 'organizations.json')
+    monkeypatch.setattr(enrich_contacts, 'cache_path', tmp_path / 'domain-checks.json')
+
+    resolver = StubResolver(set())
+    heads: list[str] = []
+    enrich_contacts.main(['--workers', '2'], resolver=resolver,
+                         head=lambda url: heads.append(url) or 200)
+
+    contact = json.loads((tmp_path / 'data.json').read_text(encoding='utf-8'))['leads'][0]['contact']
+    assert resolver.lookups, 'main must validate through the injected resolver'
+    assert heads == []
+    assert contact['email_domain_resolves'] is False
+    assert (tmp_path / 'domain-checks.json').exists()
@@ -0,0 +1,274 @@
+"""Host health, discovery and crawl planning of scripts/enrich-contacts-online.py."""
+from __future__ import annotations
+
+import gzip
+import heapq
+import io
+import time
+from collections import Counter
+
+import pytest
+
+from conftest import load_script
+from stand_ins import SiteStandIn
+
+online = load_script('enrich-contacts-online')
+
+
+class FakeSite:
+    """fetch_html stand-in: https fails with the given error, http serves a homepage."""
+
+    def __init__(self, https_error: str) -> None:
+        self.https_error = https_error
+        self.requested: list[str] = []
+
+    def __call__(self, url: str, health) -> str | None:
+        self.requested.append(url)
+        if url.startswith('https://'):
+            health.record(url, 0.01, error=self.https_error)
+            return None
+        health.record(url, 0.01, status=200)
+        return '<html><a href="mailto:fg@gemeente.nl">Jan Jansen</a></html>'
+
+
+def test_host_health_is_per_scheme():
+    health = online.HostHealth(base_delay=0)
+    health.record('https://gemeente.nl/', 0.01, error='refused')
+    assert health.is_dead('https://gemeente.nl/contact')
+    assert not health.is_dead('http://gemeente.nl/contact')
+    assert health.dead_reason('https://gemeente.nl/') == 'refused'
+
+
+def test_refused_https_falls_back_to_http(monkeypatch):
+    site = FakeSite('refused')
+    monkeypatch.setattr(online, 'fetch_html', site)
+    crawled = online.crawl_site('https://gemeente.nl', 0, online.HostHealth(base_delay=0), Counter(), discover=False)
+    assert site.requested == ['https://gemeente.nl', 'http://gemeente.nl']
+    assert crawled.base_url == 'http://gemeente.nl'
+    assert crawled.mailto_names == {'fg@gemeente.nl': 'Jan Jansen'}
+
+
+def test_unresolved_host_is_not_retried_over_http(monkeypatch):
+    site = FakeSite('dns')
+    monkeypatch.setattr(online, 'fetch_html', site)
+    assert online.crawl_site('https://gemeente.nl', 0, online.HostHealth(base_delay=0), Counter(),
+                             discover=False) is None
+    assert site.requested == ['https://gemeente.nl']
+
+
+def urlset(*urls: str) -> str:
+    locs = ''.join(f'<url><loc>{url}</loc></url>' for url in urls)
+    return f'<?xml version="1.0"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{locs}</urlset>'
+
+
+def sitemap_index(*urls: str) -> str:
+    locs = ''.join(f'<sitemap><loc>{url}</loc></sitemap>' for url in urls)
+    return f'<?xml version="1.0"?><sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{locs}</sitemapindex>'
+
+
+def xml(text: str) -> tuple[str, bytes]:
+    return 'application/xml', text.encode('utf-8')
+
+
+@pytest.mark.parametrize('compress', [False, True], ids=['plain', 'gzip'])
+def test_read_sitemap_detects_gzip_by_content(compress):
+    raw = urlset('https://gemeente.nl/', 'https://gemeente.nl/contact', 'https://gemeente.nl/nieuws/1').encode()
+    document = online.read_sitemap(io.BytesIO(gzip.compress(raw) if compress else raw))
+    assert (document.valid, document.index, document.scanned) == (True, False, 3)
+    assert document.pages == ['https://gemeente.nl/contact']
+
+
+def test_read_sitemap_keeps_entries_before_a_broken_download():
+    raw = gzip.compress(urlset(*(f'https://gemeente.nl/contact/{i}' for i in range(5000))).encode())
+    document = online.read_sitemap(io.BytesIO(raw[:len(raw) // 2]))
+    assert document.valid
+    assert 0 < document.scanned < 5000
+
+
+def test_read_sitemap_rejects_soft_404():
+    document = online.read_sitemap(io.BytesIO(b'<html><body>Pagina niet gevonden</body></html>'))
+    assert not document.valid
+    assert document.pages == []
+
+
+def test_read_sitemap_caps_scanned_urls(monkeypatch):
+    monkeypatch.setattr(online, 'MAX_SITEMAP_URLS', 5)
+    monkeypatch.setattr(online, 'MAX_SITEMAP_MATCHES', 3)
+    document = online.read_sitemap(io.BytesIO(urlset(*(f'https://gemeente.nl/contact/{i}' for i in range(20))).encode()))
+    assert document.scanned == 5
+    assert len(document.pages) == 3
+
+
+def test_discover_site_follows_robots_and_sitemap_index():
+    with SiteStandIn() as site:
+        base = site.base_url
+        site.pages['/robots.txt'] = ('text/plain', f'User-agent: *\nDisallow: /intern\nSitemap: {base}/sitemap_index.xml\n'.encode())
+        # The news sitemap sorts last and is missing; the page sitemap is gzipped
+        site.pages['/sitemap_index.xml'] = xml(sitemap_index(f'{base}/sitemap-news.xml', f'{base}/sitemap-pages.xml.gz'))
+        site.pages['/sitemap-pages.xml.gz'] = ('application/x-gzip', gzip.compress(urlset(
+            f'{base}/', f'{base}/contact', f'{base}/privacy/functionaris-gegevensbescherming', f'{base}/nieuws/item-1',
+            f'{base}/intern/contact', 'https://elders.nl/contact',
+        ).encode()))
+        discovery = online.discover_site(base, online.HostHealth(base_delay=0))
+
+    assert site.requested == ['/robots.txt', '/sitemap_index.xml', '/sitemap-pages.xml.gz', '/sitemap-news.xml']
+    assert (discovery.requests, discovery.sitemaps, discovery.scanned) == (4, 2, 6)
+    # Keyword pages of this site only, best keyword and shallowest first
+    assert discovery.pages == [
+        f'{base}/privacy/functionaris-gegevensbescherming', f'{base}/contact', f'{base}/intern/contact',
+    ]
+    assert not discovery.robots.can_fetch(online.USER_AGENT, f'{base}/intern/contact')
+
+
+def test_discover_site_without_robots_tries_sitemap_xml():
+    with SiteStandIn({'/sitemap.xml': '<html>Welkom</html>'}) as site:
+        discovery = online.discover_site(site.base_url, online.HostHealth(base_delay=0))
+    assert site.requested == ['/robots.txt', '/sitemap.xml']
+    assert (discovery.requests, discovery.sitemaps, discovery.pages) == (2, 0, [])
+
+
+def test_discover_site_caps_sitemap_fetches():
+    with SiteStandIn() as site:
+        base = site.base_url
+        site.pages['/sitemap.xml'] = xml(sitemap_index(*(f'{base}/sitemap-{i}.xml' for i in range(10))))
+        for i in range(10):
+            site.pages[f'/sitemap-{i}.xml'] = xml(urlset(f'{base}/contact-{i}'))
+        discovery = online.discover_site(base, online.HostHealth(base_delay=0))
+    assert discovery.requests == online.MAX_SITEMAP_FETCHES + 1
+    assert len(site.requested) == discovery.requests
+
+
+def test_sitemap_crawl_saves_guessed_requests():
+    homepage = '<html><a href="/over-ons">Over ons</a><a href="mailto:info@gemeente.nl">Mail</a></html>'
+    with SiteStandIn() as site:
+        base = site.base_url
+        site.pages.update({
+            '/': homepage,
+            '/robots.txt': ('text/plain', b'User-agent: *\nDisallow: /intern\n'),
+            '/sitemap.xml': xml(urlset(f'{base}/contact', f'{base}/privacy', f'{base}/intern/contact')),
+            '/contact': '<html>Contact</html>',
+            '/privacy': '<html>Privacy</html>',
+            '/over-ons': '<html>Over ons</html>',
+        })
+        crawled = online.crawl_site(base, 4, online.HostHealth(base_delay=0), Counter())
+        discovered = list(site.requested)
+        site.requested.clear()
+        guessed = online.crawl_site(base, 4, online.HostHealth(base_delay=0), Counter(), discover=False)
+
+    metrics = crawled.metrics
+    assert discovered == ['/', '/robots.txt', '/sitemap.xml', '/privacy', '/contact', '/over-ons']
+    assert (metrics.discovery_requests, metrics.page_requests, metrics.pages_found) == (2, 3, 3)
+    assert metrics.sitemap_used and metrics.disallowed == 1
+    # The blind plan guesses /contact, /contacten, /contactgegevens and /contactformulier; three do not exist
+    assert (metrics.avoided, metrics.saved) == (3, 1)
+    assert site.requested == ['/', '/contact', '/contacten', '/contactgegevens', '/contactformulier']
+    assert (guessed.metrics.page_requests, guessed.metrics.pages_found) == (4, 1)
+
+
+def lead(score: int, algorithms: int, *websites: str) -> dict:
+    return {'lead_score': score, 'algorithm_count': algorithms, 'websites': list(websites)}
+
+
+def test_crawl_plan_schedules_most_valuable_site_first():
+    plan = online.plan_crawl([
+        ('Gemeente A', lead(40, 3, 'https://www.gemeente-a.nl'), None),
+        ('Gemeente B', lead(90, 1, 'https://gemeente-b.nl'), None),
+        # Shares the site of A (without www) and lifts it to its own value
+        ('Regio A', lead(60, 8, 'https://gemeente-a.nl/regio'), None),
+        ('Gemeente C', lead(60, 2, 'https://gemeente-c.nl'), None),
+        ('Gemeente D', lead(99, 9), None),
+    ])
+    assert plan.members['gemeente-a.nl'] == ['Gemeente A', 'Regio A']
+    assert plan.values['gemeente-a.nl'] == (60, 8)
+    # No site to crawl: D is done without a request
+    assert plan.pending == {'Gemeente A': 1, 'Gemeente B': 1, 'Regio A': 1, 'Gemeente C': 1, 'Gemeente D': 0}
+
+    queue = plan.schedule()
+    order = [heapq.heappop(queue)[2] for _ in range(len(queue))]
+    assert order == ['gemeente-b.nl', 'gemeente-a.nl', 'gemeente-c.nl']
+
+
+@pytest.mark.parametrize('role, target', [
+    ('CIO (Chief Information Officer)', 'CIO'),
+    ('Chief Information Officer', 'CIO'),
+    ('Beleidsadviseur informatiebeveiliging', 'CISO'),
+    ('Privacy officer', 'Functionaris Gegevensbescherming (FG)'),
+    ('Functionaris Gegevensbescherming (FG)', 'Functionaris Gegevensbescherming (FG)'),
+    # Keywords are whole words: "fg" inside a word or "cio" in "sociaal" are no match
+    ('Fiscalist FGR', None),
+    ('Sociaal domein', None),
+    ('Algemeen contact', None),
+    (None, None),
+])
+def test_target_role(role, target):
+    assert online.target_role(role) == target
+
+
+def test_known_roles_needs_a_named_contact():
+    entry = {'contacts': [
+        {'role': 'CIO (Chief Information Officer)', 'name': 'Karel Smit'},
+        {'role': 'CISO', 'name': None, 'email': 'ciso@gemeente.nl'},
+        {'role': 'Algemeen contact', 'name': 'Receptie'},
+    ]}
+    assert online.known_roles(entry) == {'CIO'}
+
+
+def plain_site(site: SiteStandIn) -> None:
+    site.pages.update({
+        '/': '<html>Welkom</html>',
+        '/robots.txt': ('text/plain', b'User-agent: *\n'),
+        '/sitemap.xml': xml(urlset(*(f'{site.base_url}{path}'
+                                     for path in ('/contact', '/privacy', '/bestuur', '/organisatie')))),
+        '/privacy': '<html><p>Functionaris gegevensbescherming: Jan de Vries</p><p>CISO: Petra Bakker</p></html>',
+        '/contact': '<html>Contact</html>',
+        '/bestuur': '<html>Bestuur</html>',
+        '/organisatie': '<html>Organisatie</html>',
+    })
+
+
+def test_crawl_stops_once_wanted_roles_are_named():
+    wanted = {'Functionaris Gegevensbescherming (FG)', 'CISO'}
+    with SiteStandIn() as site:
+        plain_site(site)
+        crawled = online.crawl_site(site.base_url, 4, online.HostHealth(base_delay=0), Counter(), wanted=wanted)
+        everything = online.crawl_site(site.base_url, 4, online.HostHealth(base_delay=0), Counter())
+    assert [url.rsplit('/', 1)[-1] for url, _ in crawled.pages] == ['privacy']
+    assert (crawled.metrics.page_requests, crawled.metrics.stopped_early) == (1, 3)
+    assert crawled.complete
+    assert (everything.metrics.page_requests, everything.metrics.stopped_early) == (4, 0)
+    # The CIO is never found, so that crawl reads every candidate page
+    with SiteStandIn() as site:
+        plain_site(site)
+        crawled = online.crawl_site(site.base_url, 4, online.HostHealth(base_delay=0), Counter(),
+                                    wanted=wanted | {'CIO'})
+    assert crawled.metrics.page_requests == 4
+
+
+def test_request_budget_cuts_a_crawl_short():
+    with SiteStandIn() as site:
+        plain_site(site)
+        health = online.HostHealth(base_delay=0)
+        crawled = online.crawl_site(site.base_url, 4, health, Counter(), discover=False,
+                                    budget=online.CrawlBudget(requests=3))
+    # Homepage and two pages, then the budget is spent
+    assert len(site.requested) == 3
+    assert crawled.metrics.page_requests == 2
+    assert not crawled.complete
+
+
+def test_budget_spent_during_discovery_returns_an_incomplete_site():
+    with SiteStandIn() as site:
+        plain_site(site)
+        crawled = online.crawl_site(site.base_url, 4, online.HostHealth(base_delay=0), Counter(),
+                                    budget=online.CrawlBudget(requests=2))
+    assert site.requested == ['/', '/robots.txt']
+    assert (crawled.pages, crawled.complete) == ([], False)
+
+
+def test_exhausted_budget_makes_no_requests():
+    with SiteStandIn() as site:
+        plain_site(site)
+        budget = online.CrawlBudget(seconds=1.0, started=time.monotonic() - 5)
+        crawled = online.crawl_site(site.base_url, 4, online.HostHealth(base_delay=0), Counter(), budget=budget)
+    assert site.requested == []
+    assert not crawled.complete
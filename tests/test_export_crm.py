@@ -0,0 +1,75 @@
+"""Streaming JSON reader of scripts/export-crm.py."""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from conftest import ROOT, load_script
+
+crm = load_script('export-crm')
+
+DOCUMENT = {
+    'generated_date': '2026-01-02',
+    # The member name appears in a string value and in nested objects before the real member
+    'source': '"leads": ["not", "these"]',
+    'meta': {'leads': [{'name': 'nested'}], 'note': 'escaped \\" quote and [brackets]'},
+    'leads': [
+        {'name': 'Gemeente Súdwest-Fryslân', 'leads': ['inner'], 'score': 12},
+        {'name': 'Waterschap "De Dommel"', 'tags': ['{', '}'], 'score': 7},
+        {'name': 'Provincie Zeeland', 'score': 3},
+    ],
+    'contacts': {
+        'Gemeente Utrecht': {'primary_email': 'info@utrecht.nl', 'contacts': [{'role': 'CIO'}]},
+        'Gemeente Ede': {'primary_email': None, 'contacts': []},
+    },
+    'total': 3,
+}
+
+
+def write(tmp_path, document: object, indent: int | None = 2):
+    path = tmp_path / 'document.json'
+    path.write_text(json.dumps(document, indent=indent, ensure_ascii=False), encoding='utf-8')
+    return path
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 5, 7, 64, 1 << 16])
+@pytest.mark.parametrize('indent', [None, 2])
+def test_members_across_chunk_boundaries(monkeypatch, tmp_path, chunk_size, indent):
+    monkeypatch.setattr(crm, 'CHUNK_SIZE', chunk_size)
+    path = write(tmp_path, DOCUMENT, indent)
+    assert [item for _, item in crm.iter_json_items(path, 'leads')] == DOCUMENT['leads']
+    assert dict(crm.iter_json_items(path, 'contacts')) == DOCUMENT['contacts']
+
+
+def test_array_items_have_no_names(tmp_path):
+    path = write(tmp_path, DOCUMENT)
+    assert [name for name, _ in crm.iter_json_items(path, 'leads')] == [None, None, None]
+    assert list(crm.iter_json_array(path, 'leads')) == DOCUMENT['leads']
+
+
+def test_only_the_top_level_member_counts(tmp_path):
+    # Nested "contacts" lists come before the top-level contacts object
+    document = {'summary': {'contacts': [{'name': 'nested'}]}, 'contacts': {'A': {'contacts': []}}}
+    path = write(tmp_path, document)
+    assert dict(crm.iter_json_items(path, 'contacts')) == {'A': {'contacts': []}}
+    # Present only in nested objects: there is nothing to stream
+    assert list(crm.iter_json_items(path, 'name')) == []
+
+
+@pytest.mark.parametrize('document', [{'leads': 3}, {'leads': None}, {}, [{'leads': []}]])
+def test_missing_or_scalar_member_yields_nothing(tmp_path, document):
+    assert list(crm.iter_json_items(write(tmp_path, document), 'leads')) == []
+
+
+def test_empty_containers(tmp_path):
+    path = write(tmp_path, {'leads': [], 'contacts': {}})
+    assert list(crm.iter_json_items(path, 'leads')) == []
+    assert list(crm.iter_json_items(path, 'contacts')) == []
+
+
+def test_shipped_contact_research(monkeypatch):
+    monkeypatch.setattr(crm, 'CHUNK_SIZE', 1000)
+    path = ROOT / 'exports' / 'contact-research.json'
+    expected = json.loads(path.read_text(encoding='utf-8'))['contacts']
+    assert dict(crm.iter_json_items(path, 'contacts')) == expected
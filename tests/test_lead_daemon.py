@@ -0,0 +1,100 @@
+"""Change propagation and output placement of scripts/lead-daemon.py."""
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+
+import pytest
+
+from conftest import ROOT, load_script
+
+daemon = load_script('lead-daemon')
+
+TRACKED_OUTPUTS = [
+    ROOT / 'src' / 'data.json',
+    ROOT / 'src' / 'data_enriched.json',
+    ROOT / 'src' / 'organization-entities.json',
+    ROOT / 'exports' / 'top-20-leads.json',
+    ROOT / 'exports' / 'top-20-leads.csv',
+]
+
+
+def parse_args(monkeypatch, *argv: str):
+    monkeypatch.setattr(sys, 'argv', ['lead-daemon.py', *argv])
+    return daemon.parse_args()
+
+
+def fingerprint(paths) -> dict:
+    return {path: hashlib.sha1(path.read_bytes()).hexdigest() if path.exists() else None for path in paths}
+
+
+@pytest.mark.parametrize('changed, stages', [
+    ({'weights'}, ['weights', 'scores', 'enrichment', 'top-leads', 'export']),
+    ({'contacts'}, ['contacts', 'export']),
+    ({'tenders'}, ['tenders', 'enrichment', 'top-leads', 'export']),
+    ({'top-leads'}, ['top-leads']),
+    ({'export', 'tenders', 'ingest'},
+     ['ingest', 'organizations', 'tenders', 'scores', 'enrichment', 'top-leads', 'export']),
+    (set(), []),
+])
+def test_affected_runs_downstream_stages_in_order(changed, stages):
+    assert daemon.affected(changed) == stages
+
+
+def test_rebuilds_what_a_source_change_affects(monkeypatch, tmp_path):
+    workspace = daemon.LeadWorkspace(parse_args(monkeypatch, '--output-dir', str(tmp_path / 'out')))
+    sources = {stage: tmp_path / f'{stage}.json' for stage in ('organizations', 'weights', 'tenders', 'contacts')}
+    for path in sources.values():
+        path.write_text('{}')
+    workspace.watched = sources
+    workspace.mtimes = workspace.current_mtimes()
+
+    ran = []
+    for method, stage in [('ingest', 'ingest'), ('load_organizations', 'organizations'), ('load_weights', 'weights'),
+                          ('load_tenders', 'tenders'), ('load_contacts', 'contacts'), ('score', 'scores'),
+                          ('enrich', 'enrichment'), ('top_leads', 'top-leads'), ('export', 'export')]:
+        monkeypatch.setattr(workspace, method, lambda stage=stage: ran.append(stage))
+
+    assert workspace.rebuild(None) is None
+    stat = sources['weights'].stat()
+    os.utime(sources['weights'], (stat.st_atime, stat.st_mtime + 10))
+    run = workspace.rebuild(None)
+    assert run['reason'] == 'changed: weights'
+    assert ran == ['weights', 'scores', 'enrichment', 'top-leads', 'export']
+
+    # Seen once; contact research then only refreshes the export
+    ran.clear()
+    assert workspace.rebuild(None) is None
+    stat = sources['contacts'].stat()
+    os.utime(sources['contacts'], (stat.st_atime, stat.st_mtime + 10))
+    workspace.rebuild(None)
+    assert ran == ['contacts', 'export']
+
+
+def test_failed_stage_stops_the_rebuild(monkeypatch, tmp_path):
+    workspace = daemon.LeadWorkspace(parse_args(monkeypatch, '--output-dir', str(tmp_path)))
+    ran = []
+    monkeypatch.setattr(workspace, 'load_weights', lambda: ran.append('weights'))
+    monkeypatch.setattr(workspace, 'score', lambda: 1 / 0)
+    monkeypatch.setattr(workspace, 'enrich', lambda: ran.append('enrichment'))
+    run = workspace.rebuild({'weights'}, 'test')
+    assert run['error'].startswith('scores: ')
+    assert ran == ['weights']
+
+
+def test_benchmark_leaves_tracked_outputs_alone(monkeypatch, capsys):
+    before = fingerprint(TRACKED_OUTPUTS)
+    monkeypatch.setattr(sys, 'argv', ['lead-daemon.py', '--benchmark', '1'])
+    daemon.main()
+    assert 'Score-only rebuild over 1 runs' in capsys.readouterr().out
+    assert fingerprint(TRACKED_OUTPUTS) == before
+
+
+def test_output_dir_receives_the_outputs(monkeypatch, tmp_path):
+    before = fingerprint(TRACKED_OUTPUTS)
+    workspace = daemon.LeadWorkspace(parse_args(monkeypatch, '--output-dir', str(tmp_path)))
+    run = workspace.rebuild({'organizations', 'weights', 'tenders', 'contacts'}, 'test')
+    assert 'error' not in run
+    assert {'data.json', 'top-20-leads.json', 'top-20-leads.csv'} <= {path.name for path in tmp_path.iterdir()}
+    assert fingerprint(TRACKED_OUTPUTS) == before
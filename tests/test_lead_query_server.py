@@ -0,0 +1,174 @@
+"""Lead queries of scripts/lead-query-server.py: facets, name search, recency, sorting and paging."""
+from __future__ import annotations
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from datetime import date, timedelta
+
+import pytest
+
+from conftest import load_script
+
+server = load_script('lead-query-server')
+
+TODAY = date.today()
+
+
+def days_ago(days: int) -> str:
+    return (TODAY - timedelta(days=days)).isoformat()
+
+
+LEADS = [
+    {'name': 'Gemeente Amsterdam', 'entity_id': 'e1', 'type': 'Gemeente', 'priority': 'Hot',
+     'lead_score': 90, 'algorithm_count': 40, 'impactful_count': 6, 'latest_date': days_ago(3)},
+    {'name': 'Gemeente Amstelveen', 'entity_id': 'e2', 'type': 'Gemeente', 'priority': 'Warm',
+     'lead_score': 60, 'algorithm_count': 8, 'impactful_count': 9, 'latest_date': days_ago(60)},
+    {'name': 'Provincie Zeeland', 'entity_id': 'e3', 'type': 'Provincie', 'priority': 'Hot',
+     'lead_score': 75, 'algorithm_count': 12, 'impactful_count': 1, 'latest_date': days_ago(400)},
+    {'name': 'Waterschap Amstel, Gooi en Vecht', 'entity_id': 'e4', 'type': 'Waterschap', 'priority': 'Cold',
+     'lead_score': 30, 'algorithm_count': 2, 'impactful_count': 0, 'latest_date': None},
+    {'name': 'Gemeente Ede', 'entity_id': 'e5', 'type': 'Gemeente', 'priority': 'Cold',
+     'lead_score': 20, 'algorithm_count': 1, 'impactful_count': 0, 'latest_date': days_ago(20)},
+]
+CONTACTS = {
+    # Research is keyed by the name it was researched under, which need not match the lead
+    'Gemeente Amsterdam (gemeente)': {'entity_id': 'e1', 'primary_email': 'info@amsterdam.nl', 'contacts': [
+        {'name': 'A. de Vries', 'role': 'CIO', 'linkedin': 'https://www.linkedin.com/in/adevries'},
+    ]},
+    'Gemeente Amstelveen': {'entity_id': 'e2', 'primary_email': 'info@amstelveen.nl', 'contacts': []},
+}
+
+
+@pytest.fixture(scope='module')
+def index():
+    return server.LeadIndex({'total_algorithms': 63, 'leads': LEADS}, {}, {'contacts': CONTACTS})
+
+
+def names(result: dict) -> list[str]:
+    return [lead['name'] for lead in result['leads']]
+
+
+def test_unfiltered_query_uses_the_sort_order(index):
+    result = index.query({})
+    assert result['total'] == 5 and result['sort'] == 'lead_score'
+    assert names(result) == ['Gemeente Amsterdam', 'Provincie Zeeland', 'Gemeente Amstelveen',
+                             'Waterschap Amstel, Gooi en Vecht', 'Gemeente Ede']
+    assert names(index.query({'sort': 'impactful_count'}))[:2] == ['Gemeente Amstelveen', 'Gemeente Amsterdam']
+    # Unknown sort keys fall back to the score
+    assert index.query({'sort': 'password'})['sort'] == 'lead_score'
+
+
+@pytest.mark.parametrize('params, expected', [
+    ({'type': 'Gemeente'}, ['Gemeente Amsterdam', 'Gemeente Amstelveen', 'Gemeente Ede']),
+    ({'type': 'Gemeente', 'priority': 'Cold'}, ['Gemeente Ede']),
+    ({'priority': 'Hot'}, ['Gemeente Amsterdam', 'Provincie Zeeland']),
+    ({'type': 'Ministerie'}, []),
+    ({'contact': 'named'}, ['Gemeente Amsterdam']),
+    ({'contact': 'linkedin'}, ['Gemeente Amsterdam']),
+    ({'contact': 'email-only'}, ['Gemeente Amstelveen']),
+    ({'contact': 'none'}, ['Provincie Zeeland', 'Waterschap Amstel, Gooi en Vecht', 'Gemeente Ede']),
+])
+def test_facets_intersect(index, params, expected):
+    result = index.query(params)
+    assert names(result) == expected
+    assert result['total'] == len(expected)
+
+
+@pytest.mark.parametrize('term, expected', [
+    ('amst', ['Gemeente Amsterdam', 'Gemeente Amstelveen', 'Waterschap Amstel, Gooi en Vecht']),
+    ('AMSTEL', ['Gemeente Amstelveen', 'Waterschap Amstel, Gooi en Vecht']),
+    ('erdam', ['Gemeente Amsterdam']),
+    # Every trigram occurs, but not contiguously
+    ('amsteld', []),
+    # Shorter than a trigram: substring scan
+    ('ed', ['Gemeente Ede']),
+    ('zz', []),
+])
+def test_trigram_search(index, term, expected):
+    assert names(index.query({'search': term})) == expected
+
+
+def test_search_combines_with_facets(index):
+    assert names(index.query({'search': 'amst', 'type': 'Gemeente', 'priority': 'Warm'})) == ['Gemeente Amstelveen']
+
+
+@pytest.mark.parametrize('recency, expected', [
+    ('week', ['Gemeente Amsterdam']),
+    ('month', ['Gemeente Amsterdam', 'Gemeente Ede']),
+    ('3months', ['Gemeente Amsterdam', 'Gemeente Amstelveen', 'Gemeente Ede']),
+    ('year', ['Gemeente Amsterdam', 'Gemeente Amstelveen', 'Gemeente Ede']),
+    # Unknown windows do not filter; leads without a date stay in
+    ('decade', ['Gemeente Amsterdam', 'Provincie Zeeland', 'Gemeente Amstelveen',
+                'Waterschap Amstel, Gooi en Vecht', 'Gemeente Ede']),
+])
+def test_recency_window(index, recency, expected):
+    assert names(index.query({'recency': recency})) == expected
+
+
+def test_recency_cutoff_clamps_the_day():
+    assert server.recency_cutoff('month', date(2026, 3, 31)) == '2026-02-28'
+    assert server.recency_cutoff('3months', date(2026, 1, 15)) == '2025-10-15'
+    assert server.recency_cutoff('week', date(2026, 1, 3)) == '2025-12-27'
+    assert server.recency_cutoff('') is None
+
+
+@pytest.mark.parametrize('params', [{}, {'type': 'Gemeente'}])
+def test_paging(index, params):
+    everything = names(index.query(params))
+    pages = [names(index.query({**params, 'per_page': '2', 'page': str(page)})) for page in (1, 2, 3)]
+    assert [name for page in pages for name in page] == everything
+    assert all(len(page) <= 2 for page in pages)
+    result = index.query({**params, 'per_page': '2', 'page': '9'})
+    assert result['leads'] == [] and result['total'] == len(everything)
+
+
+def test_paging_bounds(index):
+    result = index.query({'per_page': '0', 'page': '-3'})
+    assert (result['per_page'], result['page']) == (1, 1)
+    assert names(result) == ['Gemeente Amsterdam']
+    assert index.query({'per_page': '100000'})['per_page'] == server.MAX_PER_PAGE
+    with pytest.raises(ValueError):
+        index.query({'page': 'two'})
+
+
+def test_leads_carry_their_contact_summary(index):
+    lead = index.query({'search': 'amsterdam'})['leads'][0]
+    assert lead['contact_summary']['primary_email'] == 'info@amsterdam.nl'
+    assert [c['name'] for c in lead['contact_summary']['named_contacts']] == ['A. de Vries']
+    assert index.stats == {'totalLeads': 5, 'hotLeads': 2, 'warmLeads': 1, 'totalAlgorithms': 63,
+                           'totalImpactful': 16}
+
+
+def get(base: str, path: str) -> tuple[int, dict]:
+    try:
+        with urllib.request.urlopen(base + path, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+def test_unreadable_sources_answer_with_a_json_error(monkeypatch, tmp_path):
+    leads_path = tmp_path / 'data.json'
+    leads_path.write_text('{"leads": [', encoding='utf-8')
+    monkeypatch.setattr(server, 'LEADS_PATH', leads_path)
+    monkeypatch.setattr(server, 'ORGS_PATH', tmp_path / 'organizations.json')
+    monkeypatch.setattr(server, 'CONTACTS_PATH', tmp_path / 'contact-research.json')
+
+    httpd = server.ThreadingHTTPServer(('127.0.0.1', 0), server.make_handler(server.LeadStore()))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    base = f'http://127.0.0.1:{httpd.server_address[1]}'
+    try:
+        status, body = get(base, '/leads')
+        assert status == 503 and 'could not be loaded' in body['error']
+        # Once the file is complete the next request indexes it
+        leads_path.write_text(json.dumps({'leads': LEADS}), encoding='utf-8')
+        status, body = get(base, '/leads?type=Provincie')
+        assert status == 200 and names(body) == ['Provincie Zeeland']
+        status, body = get(base, '/leads?page=two')
+        assert status == 400
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
@@ -0,0 +1,32 @@
+"""Lookalike queries of org_similarity.py."""
+from __future__ import annotations
+
+import pytest
+
+from org_similarity import build_lookalikes, similar_to
+
+ORGANIZATIONS = {
+    'Gemeente Asten': {'algorithms': [{'description': 'Parkeerhandhaving met kentekenherkenning',
+                                       'goal': 'Parkeercontrole', 'category': 'Handhaving'}]},
+    'Gemeente Someren': {'algorithms': [{'description': 'Kentekenherkenning voor parkeerhandhaving',
+                                         'goal': 'Parkeercontrole', 'category': 'Handhaving'}]},
+    'Waterschap Aa en Maas': {'algorithms': [{'description': 'Voorspelling van waterpeil en neerslag',
+                                              'goal': 'Waterbeheer', 'category': 'Water'}]},
+}
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    path = tmp_path / 'similarity-cache.npz'
+    build_lookalikes(ORGANIZATIONS, cache_path=path, output_path=tmp_path / 'lookalikes.json')
+    return path
+
+
+def test_similar_to_known_customer(cache_path):
+    assert [name for name, _ in similar_to(['Gemeente Asten'], cache_path=cache_path)] == ['Gemeente Someren']
+    assert similar_to([], cache_path=cache_path) == []
+
+
+def test_similar_to_unknown_customer_raises(cache_path):
+    with pytest.raises(ValueError, match='Gemeente Atsen'):
+        similar_to(['Gemeente Asten', 'Gemeente Atsen'], cache_path=cache_path)
@@ -0,0 +1,100 @@
+"""Send queue, retries and rate limiting of scripts/outreach-dispatch.py against local stand-ins."""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from conftest import load_script
+from stand_ins import TRUNCATE, HttpStandIn, SmtpStandIn
+
+dispatcher = load_script('outreach-dispatch')
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    # Retries are due right away; backoff timing itself is not under test
+    monkeypatch.setattr(dispatcher, 'backoff', lambda attempts, retry_after: 0.0)
+
+
+def messages(count: int, campaign: str = 'test') -> list[dict]:
+    return [{
+        'idempotency_key': dispatcher.idempotency_key(campaign, 'intro', f'Gemeente {i}', f'info@gemeente{i}.nl'),
+        'campaign': campaign,
+        'lead': f'Gemeente {i}',
+        'recipient': f'info@gemeente{i}.nl',
+        'subject': 'Algoritmeregister',
+        'body': f'Beste Gemeente {i}',
+    } for i in range(count)]
+
+
+def run(queue, transport, concurrency: int = 4, rate: float = 1000.0, max_attempts: int = 4):
+    return dispatcher.dispatch(queue, 'test', transport, concurrency, rate, max_attempts, max_wait=5.0)
+
+
+def test_queue_resumes_without_resending(tmp_path):
+    path = tmp_path / 'queue.sqlite'
+    batch = messages(6)
+    queue = dispatcher.SendQueue(path)
+    assert queue.enqueue(batch) == 6
+    # An interrupted run left two messages claimed but never finished
+    queue.claim('test', 2, time.time())
+    queue.conn.close()
+
+    with HttpStandIn() as stand_in:
+        queue = dispatcher.SendQueue(path)
+        assert queue.enqueue(batch) == 0
+        stats = run(queue, dispatcher.HttpTransport(stand_in.url))
+        assert stats.sent == 6
+        assert queue.counts('test') == {'sent': 6}
+
+        # Re-running the campaign finds nothing left to send
+        assert queue.enqueue(batch) == 0
+        assert run(queue, dispatcher.HttpTransport(stand_in.url)).sent == 0
+    assert sorted(stand_in.delivered) == sorted(message['idempotency_key'] for message in batch)
+
+
+def test_retryable_errors_are_retried(tmp_path):
+    queue = dispatcher.SendQueue(tmp_path / 'queue.sqlite')
+    queue.enqueue(messages(3))
+    with HttpStandIn([503, (429, {'Retry-After': '0'}), TRUNCATE]) as stand_in:
+        stats = run(queue, dispatcher.HttpTransport(stand_in.url), concurrency=1)
+    assert (stats.sent, stats.retries, stats.failed) == (3, 3, 0)
+    assert len(stand_in.delivered) == 3
+    assert any(error.startswith('IncompleteRead') for error in stats.errors)
+
+
+def test_permanent_errors_and_exhausted_attempts_fail(tmp_path):
+    queue = dispatcher.SendQueue(tmp_path / 'queue.sqlite')
+    queue.enqueue(messages(2))
+    with HttpStandIn([400, 503, 503, 503]) as stand_in:
+        stats = run(queue, dispatcher.HttpTransport(stand_in.url), concurrency=1, max_attempts=3)
+    # The 400 fails at once; the other message gets three 503s
+    assert (stats.sent, stats.failed, stats.retries) == (0, 2, 2)
+    assert queue.counts('test') == {'failed': 2}
+    assert len(stand_in.requests) == 4
+
+
+def test_rate_limit_holds_from_the_first_send(tmp_path):
+    queue = dispatcher.SendQueue(tmp_path / 'queue.sqlite')
+    queue.enqueue(messages(5))
+    with HttpStandIn() as stand_in:
+        stats = run(queue, dispatcher.HttpTransport(stand_in.url), concurrency=4, rate=20.0)
+    assert stats.sent == 5
+    gaps = [later - earlier for earlier, later in zip(stand_in.requests, stand_in.requests[1:])]
+    # 20 msg/s is one send per 50 ms; allow for scheduling jitter, but no burst of parallel sends
+    assert min(gaps) > 0.03
+    assert stand_in.requests[-1] - stand_in.requests[0] >= 0.18
+
+
+def test_smtp_transport(tmp_path):
+    queue = dispatcher.SendQueue(tmp_path / 'queue.sqlite')
+    batch = messages(3)
+    queue.enqueue(batch)
+    with SmtpStandIn([451, 550]) as stand_in:
+        transport = dispatcher.SmtpTransport('127.0.0.1', stand_in.port, 'outreach@algoritmehub.nl')
+        stats = run(queue, transport, concurrency=1)
+    # 451 is retried, 550 fails the message
+    assert (stats.sent, stats.retries, stats.failed) == (2, 1, 1)
+    assert len(stand_in.delivered) == 2
+    assert all(message_id.endswith('@algoritmehub.nl>') for message_id in stand_in.delivered)
@@ -0,0 +1,81 @@
+"""Grouping TenderNed publications into procurements (tender_dedup.py)."""
+from __future__ import annotations
+
+import pandas as pd
+
+from tender_dedup import dedupe_tenders
+
+ORG = 'Naam Aanbestedende dienst'
+TITLE = 'Naam aanbesteding'
+TYPE = 'Type publicatie'
+VALUE = 'Geraamde waarde in EUR'
+URL = 'URL TenderNed'
+
+
+def publications(*rows: dict) -> pd.DataFrame:
+    defaults = {ORG: 'Gemeente Utrecht', TITLE: 'Levering kantoorartikelen', TYPE: 'Aankondiging van een opdracht',
+                VALUE: None, URL: None}
+    df = pd.DataFrame([{**defaults, 'ID publicatie': index + 1, **row} for index, row in enumerate(rows)])
+    df['Publicatiedatum'] = pd.to_datetime(df['Publicatiedatum'])
+    return df
+
+
+def test_recurring_title_is_a_new_procurement_each_year():
+    df = publications(*({'Publicatiedatum': f'{year}-03-01'} for year in range(2020, 2025)))
+    canonical, _ = dedupe_tenders(df)
+    assert len(canonical) == 5
+    assert canonical['publication_count'].tolist() == [1] * 5
+    assert canonical['procurement_id'].nunique() == 5
+
+
+def test_follow_ups_join_their_announcement():
+    df = publications(
+        {'Publicatiedatum': '2023-01-10', URL: 'https://tenderned.nl/1'},
+        {'Publicatiedatum': '2023-02-01', TITLE: 'Rectificatie: Levering kantoorartikelen', TYPE: 'Rectificatie'},
+        # Awards can come long after the announcement
+        {'Publicatiedatum': '2024-06-01', TYPE: 'Aankondiging van een gegunde opdracht', VALUE: 80000.0,
+         URL: 'https://tenderned.nl/3'},
+        {'Publicatiedatum': '2024-09-01'},
+    )
+    canonical, _ = dedupe_tenders(df)
+    assert canonical['publication_count'].tolist() == [3, 1]
+    first = canonical.iloc[0]
+    # Identity from the announcement, value carried forward from the award
+    assert (first['ID publicatie'], first[TITLE], first[URL]) == (1, 'Levering kantoorartikelen', 'https://tenderned.nl/1')
+    assert first[VALUE] == 80000.0
+    assert [p['id'] for p in first['publications']] == [1, 2, 3]
+
+
+def test_prior_notice_and_announcement_are_one_procurement():
+    df = publications(
+        {'Publicatiedatum': '2023-01-10', TYPE: 'Vooraankondiging'},
+        {'Publicatiedatum': '2023-04-01'},
+        {'Publicatiedatum': '2024-04-01'},
+    )
+    canonical, _ = dedupe_tenders(df)
+    assert canonical['publication_count'].tolist() == [2, 1]
+
+
+def test_reference_groups_across_years_and_merges_labels():
+    df = publications(
+        {'Publicatiedatum': '2020-01-01', 'Referentienummer': 'UTR-2020-01'},
+        {'Publicatiedatum': '2022-01-01', 'Referentienummer': 'utr-2020-01', TITLE: 'Kantoorartikelen perceel 2'},
+        {'Publicatiedatum': '2022-01-01', 'Referentienummer': 'UTR-2022-07'},
+    )
+    labels = pd.Series([0b001, 0b100, 0b010], index=df.index)
+    canonical, merged = dedupe_tenders(df, labels)
+    assert canonical['publication_count'].tolist() == [2, 1]
+    assert merged.tolist() == [0b101, 0b010]
+
+
+def test_untitled_publications_without_reference_stay_apart():
+    df = publications({'Publicatiedatum': '2023-01-01', TITLE: None}, {'Publicatiedatum': '2023-01-02', TITLE: None})
+    canonical, _ = dedupe_tenders(df)
+    assert len(canonical) == 2
+
+
+def test_empty_frame():
+    df = publications({'Publicatiedatum': '2023-01-01'}).iloc[:0]
+    canonical, merged = dedupe_tenders(df, pd.Series(dtype='int64'))
+    assert canonical.empty and merged.empty
+    assert {'procurement_id', 'publication_count', 'publications'} <= set(canonical.columns)
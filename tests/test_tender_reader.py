@@ -0,0 +1,38 @@
+"""Streaming reader of tender_reader.py feeding tender_dedup."""
+from __future__ import annotations
+
+import pandas as pd
+
+from tender_dedup import TYPE_COLUMN, dedupe_tenders, follow_ups
+from tender_reader import read_tenders, tender_frame, write_synthetic
+
+
+def test_blank_publication_type_in_categorical_column():
+    df = tender_frame({
+        'ID publicatie': [1, 2, 3],
+        'Publicatiedatum': ['2024-01-01', '2024-02-01', '2024-03-01'],
+        'Naam Aanbestedende dienst': ['Gemeente A', 'Gemeente A', 'Gemeente B'],
+        'Naam aanbesteding': ['Cloud migratie', 'Rectificatie: Cloud migratie', 'Privacy audit'],
+        TYPE_COLUMN: ['Aankondiging van een opdracht', None, 'Rectificatie'],
+    })
+    assert isinstance(df[TYPE_COLUMN].dtype, pd.CategoricalDtype)
+    assert follow_ups(df).tolist() == [False, True, True]
+
+    canonical, _ = dedupe_tenders(df)
+    assert canonical['publication_count'].tolist() == [2, 1]
+    assert canonical['publications'][0] == [
+        {'id': 1, 'date': '2024-01-01', 'type': 'Aankondiging van een opdracht'},
+        {'id': 2, 'date': '2024-02-01'},
+    ]
+
+
+def test_synthetic_workbook_has_blank_types(tmp_path):
+    path = tmp_path / 'tenderned.xlsx'
+    write_synthetic(path, 60)
+    df, labels = read_tenders(path)
+    assert labels is None
+    assert len(df) == 60
+    assert df[TYPE_COLUMN].isna().any()
+
+    canonical, _ = dedupe_tenders(df)
+    assert canonical['publication_count'].sum() == 60
@@ -0,0 +1,38 @@
+"""Golden corpus of the tender taxonomy for both matchers, and the label cache keys."""
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from conftest import ROOT
+from tender_taxonomy import GOLDEN_PATH, cache_key, classify_rows, load_matcher
+
+CASES = json.loads(GOLDEN_PATH.read_text(encoding='utf-8'))['cases']
+
+
+@pytest.mark.parametrize('case', CASES, ids=[case['text'] or '<empty>' for case in CASES])
+def test_python_matcher_golden(case):
+    matcher = load_matcher()
+    assert matcher.names(matcher.labels(case['text'])) == case['categories']
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node is not installed')
+def test_node_matcher_golden():
+    result = subprocess.run(['node', 'tender-taxonomy.js', '--check'], cwd=ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stdout
+
+
+def test_cache_keys_normalize_float_ids():
+    assert cache_key(123) == cache_key(123.0) == cache_key('123') == '123'
+    assert cache_key(None) is None
+    assert cache_key(float('nan')) is None
+
+    matcher = load_matcher()
+    cache: dict[str, int] = {}
+    classify_rows([(123.0, ('Pilot machine learning',))], matcher, cache)
+    assert cache == {'123': matcher.bit('AI')}
+    # The same publication read with an integer ID is a cache hit
+    assert classify_rows([(123, ('Maaibeheer',))], matcher, cache) == [matcher.bit('AI')]